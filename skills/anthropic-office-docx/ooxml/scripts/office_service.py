@@ -0,0 +1,478 @@
+#!/usr/bin/env python3
+"""
+Local conversion service that keeps warm headless LibreOffice instances.
+
+Starting soffice dominates the cost of a single conversion. The service starts
+N instances once, each with its own user profile, and runs conversion and
+recalculation jobs on them for clients that connect over a local socket.
+pack.py, thumbnail.py and recalc.py use the service when it is running and
+fall back to starting soffice themselves when it is not, or when no instance
+frees up within the job's timeout.
+
+The service itself needs LibreOffice's Python UNO bridge (the `uno` module,
+e.g. from the python3-uno package); clients only need the standard library.
+
+Example usage:
+    python office_service.py start [--workers N] [--socket PATH]
+    python office_service.py status
+    python office_service.py stop
+"""
+
+import argparse
+import getpass
+import json
+import os
+import platform
+import queue
+import select
+import shutil
+import socket
+import socketserver
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+from pathlib import Path
+
+# Socket path override; defaults to a per-user path in the temp directory
+SOCKET_ENV = "OFFICE_SERVICE_SOCKET"
+
+# Extra seconds a client waits beyond the job timeout for the service to reply
+CLIENT_GRACE = 5
+
+# Filters used when a conversion format names only the extension
+PDF_FILTERS = {
+    "com.sun.star.presentation.PresentationDocument": "impress_pdf_Export",
+    "com.sun.star.drawing.DrawingDocument": "draw_pdf_Export",
+    "com.sun.star.sheet.SpreadsheetDocument": "calc_pdf_Export",
+    "com.sun.star.text.TextDocument": "writer_pdf_Export",
+}
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Keep warm headless LibreOffice instances for conversions"
+    )
+    parser.add_argument("command", choices=["start", "status", "stop"])
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=max(1, min(4, os.cpu_count() or 1)),
+        help="Number of LibreOffice instances to keep running (start only)",
+    )
+    parser.add_argument("--socket", help=f"Socket path (default: ${SOCKET_ENV} or temp dir)")
+    args = parser.parse_args()
+
+    socket_path = args.socket or default_socket_path()
+
+    if args.command == "status":
+        reply = request({"op": "ping"}, timeout=5, socket_path=socket_path)
+        if reply is None:
+            print(f"Not running ({socket_path})")
+            sys.exit(1)
+        print(f"Running with {reply['workers']} workers ({socket_path})")
+    elif args.command == "stop":
+        if request({"op": "shutdown"}, timeout=30, socket_path=socket_path) is None:
+            print(f"Not running ({socket_path})")
+            sys.exit(1)
+        print("Stopped")
+    else:
+        try:
+            serve(socket_path, args.workers)
+        except (RuntimeError, ImportError) as e:
+            sys.exit(f"Error: {e}")
+
+
+def default_socket_path():
+    """Socket path from $OFFICE_SERVICE_SOCKET, or a per-user temp path."""
+    if os.environ.get(SOCKET_ENV):
+        return os.environ[SOCKET_ENV]
+    if hasattr(os, "getuid"):
+        user = os.getuid()
+    else:
+        try:
+            user = getpass.getuser()
+        except (ImportError, KeyError, OSError):
+            # getpass.getuser() raises one of these when no user name is known
+            return os.path.join(tempfile.gettempdir(), "office-service.sock")
+    return os.path.join(tempfile.gettempdir(), f"office-service-{user}.sock")
+
+
+# Client
+
+
+def request(job, timeout, socket_path=None):
+    """Send a job to the service and wait for its reply.
+
+    Args:
+        job: JSON-serializable job, e.g. {"op": "convert", ...}
+        timeout: Seconds the job may run
+        socket_path: Service socket (default: default_socket_path())
+
+    Returns:
+        The reply dict, or None if the service is not running or too busy to
+        start the job in time (callers then run soffice themselves)
+    """
+    if not hasattr(socket, "AF_UNIX"):
+        return None
+    socket_path = socket_path or default_socket_path()
+    if not os.path.exists(socket_path):
+        return None
+
+    try:
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+            sock.settimeout(timeout + CLIENT_GRACE)
+            sock.connect(socket_path)
+            sock.sendall(json.dumps(dict(job, timeout=timeout)).encode() + b"\n")
+            with sock.makefile("rb") as reply:
+                line = reply.readline()
+    except socket.timeout:
+        return {"ok": False, "error": "Timeout waiting for office service"}
+    except OSError:
+        return None
+    if not line:
+        return {"ok": False, "error": "Office service closed the connection"}
+    reply = json.loads(line)
+    if reply.get("busy"):
+        return None
+    return reply
+
+
+def convert(input_path, outdir, output_format, timeout=60):
+    """Convert a document like `soffice --convert-to FORMAT --outdir OUTDIR`.
+
+    Args:
+        input_path: Document to convert
+        outdir: Directory for the output, named after the input with the new extension
+        output_format: Extension with an optional filter, e.g. "pdf" or "html:HTML"
+        timeout: Seconds the conversion may run
+
+    Returns:
+        The reply dict ({"ok": True, "output": path} or {"ok": False, "error": msg}),
+        or None if the service is not running
+    """
+    return request(
+        {
+            "op": "convert",
+            "input": str(Path(input_path).absolute()),
+            "outdir": str(Path(outdir).absolute()),
+            "format": output_format,
+        },
+        timeout,
+    )
+
+
+def recalculate(input_path, timeout=30):
+    """Recalculate all formulas in a spreadsheet and save it in place.
+
+    Returns:
+        The reply dict, or None if the service is not running
+    """
+    return request(
+        {"op": "recalc", "input": str(Path(input_path).absolute())}, timeout
+    )
+
+
+# Service
+
+
+def _import_uno():
+    """Import the UNO bridge, looking in LibreOffice's program directory if needed."""
+    try:
+        import uno
+
+        return uno
+    except ImportError:
+        pass
+
+    if platform.system() == "Darwin":
+        candidates = ["/Applications/LibreOffice.app/Contents/Resources"]
+    else:
+        candidates = ["/usr/lib/libreoffice/program", "/opt/libreoffice/program"]
+    for candidate in candidates:
+        if os.path.exists(os.path.join(candidate, "uno.py")):
+            sys.path.append(candidate)
+            break
+    try:
+        import uno
+
+        return uno
+    except ImportError:
+        raise ImportError(
+            "The office service needs LibreOffice's Python UNO bridge "
+            "(install python3-uno or run with LibreOffice's python)"
+        ) from None
+
+
+class OfficeWorker:
+    """One headless LibreOffice instance with an isolated user profile."""
+
+    def __init__(self, index, base_dir):
+        self.name = f"office-service-{os.getpid()}-{index}"
+        self.profile = Path(base_dir) / f"profile-{index}"
+        self.process = None
+        self.desktop = None
+
+    def start(self, startup_timeout=60):
+        """Start soffice and connect to it over a UNO pipe."""
+        uno = _import_uno()
+        self.process = subprocess.Popen(
+            [
+                "soffice",
+                "--headless",
+                "--invisible",
+                "--nologo",
+                "--norestore",
+                "--nodefault",
+                "--nolockcheck",
+                f"-env:UserInstallation={self.profile.absolute().as_uri()}",
+                f"--accept=pipe,name={self.name};urp;StarOffice.ComponentContext",
+            ],
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+        )
+
+        local = uno.getComponentContext()
+        resolver = local.ServiceManager.createInstanceWithContext(
+            "com.sun.star.bridge.UnoUrlResolver", local
+        )
+        deadline = time.monotonic() + startup_timeout
+        while True:
+            try:
+                context = resolver.resolve(
+                    f"uno:pipe,name={self.name};urp;StarOffice.ComponentContext"
+                )
+                break
+            except Exception:
+                if self.process.poll() is not None or time.monotonic() > deadline:
+                    self.stop()
+                    raise RuntimeError("LibreOffice failed to start")
+                time.sleep(0.25)
+        self.desktop = context.ServiceManager.createInstanceWithContext(
+            "com.sun.star.frame.Desktop", context
+        )
+
+    def stop(self):
+        """Terminate the instance, killing it if it doesn't exit promptly."""
+        if self.desktop is not None:
+            try:
+                self.desktop.terminate()
+            except Exception:
+                pass
+            self.desktop = None
+        if self.process is not None:
+            try:
+                self.process.wait(timeout=5)
+            except subprocess.TimeoutExpired:
+                self.process.kill()
+                self.process.wait()
+            self.process = None
+
+    def restart(self):
+        if self.process is not None and self.process.poll() is None:
+            self.process.kill()
+            self.process.wait()
+        self.process = None
+        self.desktop = None
+        self.start()
+
+    def run(self, job):
+        """Run a job and return its result dict. Errors propagate to the caller."""
+        uno = _import_uno()
+
+        def props(**values):
+            return tuple(
+                uno.createUnoStruct("com.sun.star.beans.PropertyValue", Name=k, Value=v)
+                for k, v in values.items()
+            )
+
+        input_path = Path(job["input"])
+        if not input_path.exists():
+            return {"ok": False, "error": f"File {input_path} does not exist"}
+
+        document = self.desktop.loadComponentFromURL(
+            input_path.as_uri(), "_blank", 0, props(Hidden=True)
+        )
+        if document is None:
+            return {"ok": False, "error": f"Could not load {input_path}"}
+
+        try:
+            if job["op"] == "recalc":
+                document.calculateAll()
+                document.store()
+                return {"ok": True, "output": str(input_path)}
+
+            extension, _, filter_name = job["format"].partition(":")
+            if not filter_name:
+                if extension != "pdf":
+                    return {"ok": False, "error": f"Format needs a filter: {extension}"}
+                filter_name = next(
+                    (f for s, f in PDF_FILTERS.items() if document.supportsService(s)),
+                    "writer_pdf_Export",
+                )
+            output = Path(job["outdir"]) / f"{input_path.stem}.{extension}"
+            output.parent.mkdir(parents=True, exist_ok=True)
+            document.storeToURL(output.as_uri(), props(FilterName=filter_name))
+            return {"ok": True, "output": str(output)}
+        finally:
+            document.close(True)
+
+
+class _Handler(socketserver.StreamRequestHandler):
+    def handle(self):
+        line = self.rfile.readline()
+        if not line:
+            return
+        try:
+            job = json.loads(line)
+            reply = self.server.service.dispatch(job, self.client_waiting)
+        except Exception as e:
+            reply = {"ok": False, "error": str(e)}
+        if reply is None:
+            return
+        try:
+            self.wfile.write(json.dumps(reply).encode() + b"\n")
+        except OSError:
+            pass  # The client gave up waiting
+
+    def client_waiting(self):
+        """Whether the client is still connected; it sends nothing after the job."""
+        try:
+            readable, _, _ = select.select([self.connection], [], [], 0)
+            return not readable or self.connection.recv(1, socket.MSG_PEEK) != b""
+        except OSError:
+            return False
+
+
+class _Server(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+    daemon_threads = True
+
+
+class OfficeService:
+    """Pool of OfficeWorkers serving jobs from a Unix socket."""
+
+    def __init__(self, socket_path, workers):
+        self.socket_path = socket_path
+        self.base_dir = tempfile.mkdtemp(prefix="office-service-")
+        self.workers = [OfficeWorker(i, self.base_dir) for i in range(workers)]
+        self.idle = queue.Queue()
+        self.server = None
+
+    def dispatch(self, job, client_waiting=lambda: True):
+        """Run a job and return its reply, or None if the client disconnected.
+
+        The job's timeout covers waiting for an idle worker as well as running
+        the job, so the reply always arrives while the client still waits. A job
+        that can't get a worker in time is answered with a "busy" reply.
+        """
+        op = job.get("op")
+        if op == "ping":
+            return {"ok": True, "workers": len(self.workers)}
+        if op == "shutdown":
+            threading.Thread(target=self.server.shutdown, daemon=True).start()
+            return {"ok": True}
+        if op not in ("convert", "recalc"):
+            return {"ok": False, "error": f"Unknown operation: {op}"}
+
+        deadline = time.monotonic() + job.get("timeout", 60)
+        try:
+            worker = self.idle.get(timeout=max(0, deadline - time.monotonic()))
+        except queue.Empty:
+            return {"ok": False, "busy": True, "error": "Office service busy"}
+
+        restart = False
+        try:
+            if not client_waiting():
+                return None
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return {"ok": False, "busy": True, "error": "Office service busy"}
+            reply, restart = self._run(worker, job, remaining)
+            return reply
+        finally:
+            if restart:
+                # Restart after replying, so the client isn't kept waiting
+                threading.Thread(
+                    target=self._restart, args=(worker,), daemon=True
+                ).start()
+            else:
+                self.idle.put(worker)
+
+    def _restart(self, worker):
+        try:
+            worker.restart()
+        except Exception as e:
+            print(f"Warning: Could not restart {worker.name}: {e}", flush=True)
+            return
+        self.idle.put(worker)
+
+    def _run(self, worker, job, timeout):
+        """Run a job on a worker.
+
+        Returns:
+            tuple: (reply, whether the worker hung or died and must be restarted)
+        """
+        result = {}
+
+        def target():
+            try:
+                result["reply"] = worker.run(job)
+            except Exception as e:
+                result["error"] = e
+
+        thread = threading.Thread(target=target, daemon=True)
+        thread.start()
+        thread.join(timeout)
+
+        if thread.is_alive():
+            return {"ok": False, "error": "Timeout during conversion"}, True
+        if "error" in result:
+            # A crashed instance can't serve further jobs
+            crashed = worker.process is None or worker.process.poll() is not None
+            return {"ok": False, "error": str(result["error"])}, crashed
+        return result["reply"], False
+
+    def serve_forever(self):
+        if request({"op": "ping"}, timeout=5, socket_path=self.socket_path):
+            raise RuntimeError(f"Office service already running at {self.socket_path}")
+        if os.path.exists(self.socket_path):
+            os.unlink(self.socket_path)
+
+        try:
+            for worker in self.workers:
+                worker.start()
+                self.idle.put(worker)
+
+            self.server = _Server(self.socket_path, _Handler)
+            self.server.service = self
+            os.chmod(self.socket_path, 0o600)
+            print(
+                f"Office service running with {len(self.workers)} workers "
+                f"at {self.socket_path}",
+                flush=True,
+            )
+            self.server.serve_forever()
+        finally:
+            if self.server is not None:
+                self.server.server_close()
+            if os.path.exists(self.socket_path):
+                os.unlink(self.socket_path)
+            for worker in self.workers:
+                worker.stop()
+            shutil.rmtree(self.base_dir, ignore_errors=True)
+
+
+def serve(socket_path, workers):
+    """Run the service in the foreground until stopped."""
+    if not hasattr(socket, "AF_UNIX"):
+        raise RuntimeError("The office service needs Unix domain sockets")
+    _import_uno()
+    try:
+        OfficeService(socket_path, workers).serve_forever()
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
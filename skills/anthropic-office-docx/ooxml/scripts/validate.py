@@ -3,14 +3,20 @@
 Command line tool to validate Office document XML files against XSD schemas and tracked changes.
 
 Usage:
-    python validate.py <dir> --original <original_file>
+    python validate.py <dir> --original <original_file> [--workers N] [--cache] [--streaming]
 """
 
 import argparse
 import sys
 from pathlib import Path
 
-from validation import DOCXSchemaValidator, PPTXSchemaValidator, RedliningValidator
+from validation import (
+    BaseSchemaValidator,
+    DOCXSchemaValidator,
+    OriginalPackage,
+    PPTXSchemaValidator,
+    RedliningValidator,
+)
 
 
 def main():
@@ -30,6 +36,23 @@ def main():
         action="store_true",
         help="Enable verbose output",
     )
+    parser.add_argument(
+        "-j",
+        "--workers",
+        type=int,
+        default=1,
+        help="Number of processes for per-part schema checks (default: 1)",
+    )
+    parser.add_argument(
+        "--cache",
+        action="store_true",
+        help="Reuse results for unchanged parts from a cache next to the unpacked directory",
+    )
+    parser.add_argument(
+        "--streaming",
+        action="store_true",
+        help="Lower peak memory on very large parts by streaming scans and not keeping parsed trees between checks (slower)",
+    )
     args = parser.parse_args()
 
     # Validate paths
@@ -52,12 +75,29 @@ def main():
             print(f"Error: Validation not supported for file type {file_extension}")
             sys.exit(1)
 
-    # Run validators
+    # Run validators, sharing one reader for the original package
     success = True
-    for V in validators:
-        validator = V(unpacked_dir, original_file, verbose=args.verbose)
-        if not validator.validate():
-            success = False
+    with OriginalPackage(original_file) as original_package:
+        for V in validators:
+            if issubclass(V, BaseSchemaValidator):
+                validator = V(
+                    unpacked_dir,
+                    original_file,
+                    verbose=args.verbose,
+                    workers=args.workers,
+                    cache=args.cache,
+                    streaming=args.streaming,
+                    original_package=original_package,
+                )
+            else:
+                validator = V(
+                    unpacked_dir,
+                    original_file,
+                    verbose=args.verbose,
+                    original_package=original_package,
+                )
+            if not validator.validate():
+                success = False
 
     if success:
         print("All validations PASSED!")
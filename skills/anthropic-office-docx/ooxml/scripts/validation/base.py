@@ -2,11 +2,20 @@
 Base validator with common validation logic for document files.
 """
 
+import concurrent.futures
+import copy
+import hashlib
+import io
+import json
+import os
 import re
+import zipfile
 from pathlib import Path
 
 import lxml.etree
 
+from .package import OriginalPackage
+
 
 class BaseSchemaValidator:
     """Base validator with common validation logic for document files."""
@@ -66,6 +75,13 @@ class BaseSchemaValidator:
         "drawing": "ISO-IEC29500-4_2016/dml-main.xsd",
     }
 
+    # Bump when the format or meaning of cached per-part results changes
+    VALIDATION_CACHE_VERSION = 1
+
+    # Compiled XSD schemas shared by every validator in this process
+    # Format: resolved schema path -> lxml.etree.XMLSchema
+    _compiled_schemas = {}
+
     # Unified namespace constants
     MC_NAMESPACE = "http://schemas.openxmlformats.org/markup-compatibility/2006"
     XML_NAMESPACE = "http://www.w3.org/XML/1998/namespace"
@@ -103,11 +119,39 @@ class BaseSchemaValidator:
         "http://www.w3.org/XML/1998/namespace",
     }
 
-    def __init__(self, unpacked_dir, original_file, verbose=False):
+    def __init__(
+        self,
+        unpacked_dir,
+        original_file,
+        verbose=False,
+        workers=1,
+        cache=False,
+        streaming=False,
+        original_package=None,
+    ):
         self.unpacked_dir = Path(unpacked_dir).resolve()
         self.original_file = Path(original_file)
+
+        # Reader for the original package, shared with the other validators of
+        # the run when one is passed in
+        self.original_package = original_package or OriginalPackage(original_file)
         self.verbose = verbose
 
+        # Number of processes for per-part checks (1 runs everything in-process)
+        self.workers = workers
+
+        # For very large parts: read parts with iterparse where a check allows it
+        # and don't keep parsed trees between checks, so at most one full tree
+        # (for the XSD and tree-based checks) is in memory at a time
+        self.streaming = streaming
+
+        # Persistent cache of per-part results, stored next to the unpacked directory
+        self.cache_path = (
+            self.unpacked_dir.parent / f".{self.unpacked_dir.name}.validation-cache.json"
+            if cache
+            else None
+        )
+
         # Set schemas directory
         self.schemas_dir = Path(__file__).parent.parent.parent / "schemas"
 
@@ -120,28 +164,259 @@ class BaseSchemaValidator:
         if not self.xml_files:
             print(f"Warning: No XML files found in {self.unpacked_dir}")
 
+        # Memoized lowercased local names of namespaced tags and attributes
+        self._local_names = {}
+
+        # Parsed trees shared by all checks, so each part is parsed once per run
+        # (left empty in streaming mode)
+        # Format: Path -> lxml.etree._ElementTree, or the exception raised parsing it
+        self._parsed_trees = {}
+
+        # XSD errors of the original package's parts, memoized by relative path
+        self._original_errors = {}
+
+        # Results of the per-part checks when they are run up front
+        # (process pool and/or validation cache)
+        # Format: Path -> {check name: result}
+        self._part_results = None
+
     def validate(self):
         """Run all validation checks and return True if all pass."""
         raise NotImplementedError("Subclasses must implement the validate method")
 
+    def _parse_xml(self, xml_file):
+        """Parse an XML file on first use and return the shared tree.
+
+        The tree is shared by every check in this validator and must be treated
+        as read-only; checks that need to modify it work on a copy. Parse errors
+        are cached as well and re-raised on every call. In streaming mode nothing
+        is cached and every call parses the file again.
+
+        Args:
+            xml_file: Path to the XML file in unpacked_dir
+
+        Returns:
+            lxml.etree._ElementTree: Parsed tree
+
+        Raises:
+            lxml.etree.XMLSyntaxError: If the file is not well-formed
+        """
+        xml_file = Path(xml_file)
+        if self.streaming:
+            return lxml.etree.parse(str(xml_file))
+
+        tree = self._parsed_trees.get(xml_file)
+        if tree is None:
+            try:
+                tree = lxml.etree.parse(str(xml_file))
+            except Exception as e:
+                tree = e
+            self._parsed_trees[xml_file] = tree
+
+        if isinstance(tree, Exception):
+            raise tree
+        return tree
+
+    def _part_checks(self):
+        """Get the checks that only depend on a single part, keyed by name.
+
+        These can run independently per part, in a process pool when
+        workers > 1. Cross-part checks merge their results afterwards.
+        """
+        return {
+            "xml": self._check_well_formed,
+            "unique_ids": self._scan_unique_ids,
+            "xsd": self.validate_file_against_xsd,
+        }
+
+    def _get_part_result(self, xml_file, check):
+        """Get the result of a per-part check for one file.
+
+        With workers > 1 or the validation cache enabled, the first call runs
+        every per-part check for every file up front and later calls read the
+        stored results. Otherwise the check runs in-process on demand.
+
+        Args:
+            xml_file: Path to the XML file in unpacked_dir
+            check: Name of the check (see _part_checks)
+        """
+        if self._part_results is None and (
+            self.cache_path or (self.workers > 1 and len(self.xml_files) > 1)
+        ):
+            self._run_part_checks()
+
+        if self._part_results is not None:
+            return self._part_results[xml_file][check]
+        return self._part_checks()[check](xml_file)
+
+    def _check_part(self, xml_file):
+        """Run all per-part checks for one file and return their results."""
+        return {name: check(xml_file) for name, check in self._part_checks().items()}
+
+    def _run_part_checks(self):
+        """Run the per-part checks for all files.
+
+        Parts whose cache key is unchanged since the last cached run reuse the
+        stored results; the remaining parts are checked in-process or across a
+        process pool. Cross-part checks always run on the full package.
+        """
+        cached_parts = self._load_validation_cache()
+        cache_keys = {}
+        results = {}
+        pending = []
+
+        for xml_file in self.xml_files:
+            if self.cache_path:
+                relative_path = xml_file.relative_to(self.unpacked_dir).as_posix()
+                cache_keys[relative_path] = self._get_part_cache_key(xml_file)
+                entry = cached_parts.get(relative_path)
+                if entry and entry["key"] == cache_keys[relative_path]:
+                    results[xml_file] = self._decode_part_results(entry["results"])
+                    continue
+            pending.append(xml_file)
+
+        if self.verbose and self.cache_path:
+            print(
+                f"Reusing cached results for {len(results)} of {len(self.xml_files)} files"
+            )
+
+        if self.workers > 1 and len(pending) > 1:
+            results.update(zip(pending, self._check_parts_in_pool(pending)))
+        else:
+            results.update((f, self._check_part(f)) for f in pending)
+
+        # Keep self.xml_files order so reported messages are stable
+        self._part_results = {f: results[f] for f in self.xml_files}
+
+        if self.cache_path:
+            self._save_validation_cache(cache_keys)
+
+    def _check_parts_in_pool(self, xml_files):
+        """Run the per-part checks for the given files across a process pool.
+
+        Returns:
+            list: Per-file results, in the same order as xml_files
+        """
+        chunksize = max(1, len(xml_files) // (self.workers * 4))
+        with concurrent.futures.ProcessPoolExecutor(
+            max_workers=self.workers,
+            initializer=_init_part_worker,
+            initargs=(
+                type(self),
+                self.unpacked_dir,
+                self.original_file,
+                {"streaming": self.streaming},
+            ),
+        ) as executor:
+            return list(
+                executor.map(_check_part_in_worker, xml_files, chunksize=chunksize)
+            )
+
+    def _get_part_cache_key(self, xml_file):
+        """Build the cache key for the per-part results of one file.
+
+        The key covers everything the per-part checks depend on: the part's
+        content, the schema it is validated against, and the matching part of
+        the original package (identified by the CRC and size from the zip
+        directory, so the original is not read).
+        """
+        relative_path = xml_file.relative_to(self.unpacked_dir)
+        try:
+            content_hash = hashlib.sha256(xml_file.read_bytes()).hexdigest()
+        except OSError:
+            content_hash = ""
+
+        schema_path = self._get_schema_path(xml_file)
+        schema = (
+            schema_path.relative_to(self.schemas_dir).as_posix() if schema_path else ""
+        )
+
+        try:
+            info = self.original_package.getinfo(relative_path)
+            original = f"{info.CRC:08x}-{info.file_size}" if info else "absent"
+        except (OSError, zipfile.BadZipFile):
+            original = "unreadable"
+
+        return f"{content_hash}:{schema}:{original}"
+
+    def _load_validation_cache(self):
+        """Load cached per-part results.
+
+        Returns:
+            dict: relative path -> {"key": ..., "results": ...}; empty if there
+                is no usable cache for this validator
+        """
+        if not self.cache_path or not self.cache_path.exists():
+            return {}
+
+        try:
+            data = json.loads(self.cache_path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return {}
+
+        if (
+            data.get("version") != self.VALIDATION_CACHE_VERSION
+            or data.get("validator") != type(self).__name__
+        ):
+            return {}
+        return data.get("parts", {})
+
+    def _save_validation_cache(self, cache_keys):
+        """Write the per-part results of this run to the validation cache.
+
+        Args:
+            cache_keys: relative path -> cache key for every file in this run
+        """
+        parts = {
+            xml_file.relative_to(self.unpacked_dir).as_posix(): result
+            for xml_file, result in self._part_results.items()
+        }
+        data = {
+            "version": self.VALIDATION_CACHE_VERSION,
+            "validator": type(self).__name__,
+            "parts": {
+                relative_path: {
+                    "key": key,
+                    "results": self._encode_part_results(parts[relative_path]),
+                }
+                for relative_path, key in cache_keys.items()
+            },
+        }
+
+        # Write atomically so an interrupted run never leaves a corrupt cache
+        temp_path = self.cache_path.with_name(self.cache_path.name + ".tmp")
+        try:
+            temp_path.write_text(json.dumps(data), encoding="utf-8")
+            os.replace(temp_path, self.cache_path)
+        except OSError as e:
+            print(f"Warning: Could not write validation cache {self.cache_path}: {e}")
+
+    def _encode_part_results(self, results):
+        """Convert per-part results to JSON-compatible values."""
+        is_valid, xsd_errors = results["xsd"]
+        return {
+            "xml": results["xml"],
+            "unique_ids": [list(entry) for entry in results["unique_ids"]],
+            "xsd": [is_valid, sorted(xsd_errors)],
+        }
+
+    def _decode_part_results(self, results):
+        """Convert cached per-part results back to the values the checks return."""
+        is_valid, xsd_errors = results["xsd"]
+        return {
+            "xml": results["xml"],
+            "unique_ids": [tuple(entry) for entry in results["unique_ids"]],
+            "xsd": (is_valid, set(xsd_errors)),
+        }
+
     def validate_xml(self):
         """Validate that all XML files are well-formed."""
         errors = []
 
         for xml_file in self.xml_files:
-            try:
-                # Try to parse the XML file
-                lxml.etree.parse(str(xml_file))
-            except lxml.etree.XMLSyntaxError as e:
-                errors.append(
-                    f"  {xml_file.relative_to(self.unpacked_dir)}: "
-                    f"Line {e.lineno}: {e.msg}"
-                )
-            except Exception as e:
-                errors.append(
-                    f"  {xml_file.relative_to(self.unpacked_dir)}: "
-                    f"Unexpected error: {str(e)}"
-                )
+            error = self._get_part_result(xml_file, "xml")
+            if error:
+                errors.append(error)
 
         if errors:
             print(f"FAILED - Found {len(errors)} XML violations:")
@@ -153,13 +428,40 @@ class BaseSchemaValidator:
                 print("PASSED - All XML files are well-formed")
             return True
 
+    def _check_well_formed(self, xml_file):
+        """Check that a single XML file is well-formed.
+
+        Returns:
+            str: Error message, or None if the file parses
+        """
+        try:
+            # Try to parse the XML file
+            if self.streaming:
+                # A parser target without callbacks checks the syntax in C
+                # without building a tree
+                parser = lxml.etree.XMLParser(target=_DiscardTarget(), huge_tree=True)
+                lxml.etree.parse(str(xml_file), parser)
+            else:
+                self._parse_xml(xml_file)
+        except lxml.etree.XMLSyntaxError as e:
+            return (
+                f"  {xml_file.relative_to(self.unpacked_dir)}: "
+                f"Line {e.lineno}: {e.msg}"
+            )
+        except Exception as e:
+            return (
+                f"  {xml_file.relative_to(self.unpacked_dir)}: "
+                f"Unexpected error: {str(e)}"
+            )
+        return None
+
     def validate_namespaces(self):
         """Validate that namespace prefixes in Ignorable attributes are declared."""
         errors = []
 
         for xml_file in self.xml_files:
             try:
-                root = lxml.etree.parse(str(xml_file)).getroot()
+                root = self._get_root(xml_file)
                 declared = set(root.nsmap.keys()) - {None}  # Exclude default namespace
 
                 for attr_val in [
@@ -188,81 +490,28 @@ class BaseSchemaValidator:
         errors = []
         global_ids = {}  # Track globally unique IDs across all files
 
+        # File-level uniqueness is checked per part; global uniqueness is
+        # checked here by merging the per-part results in file order
         for xml_file in self.xml_files:
-            try:
-                root = lxml.etree.parse(str(xml_file)).getroot()
-                file_ids = {}  # Track IDs that must be unique within this file
-
-                # Remove all mc:AlternateContent elements from the tree
-                mc_elements = root.xpath(
-                    ".//mc:AlternateContent", namespaces={"mc": self.MC_NAMESPACE}
-                )
-                for elem in mc_elements:
-                    elem.getparent().remove(elem)
+            for entry in self._get_part_result(xml_file, "unique_ids"):
+                if entry[0] == "error":
+                    errors.append(entry[1])
+                    continue
 
-                # Now check IDs in the cleaned tree
-                for elem in root.iter():
-                    # Get the element name without namespace
-                    tag = (
-                        elem.tag.split("}")[-1].lower()
-                        if "}" in elem.tag
-                        else elem.tag.lower()
+                _, id_value, line, tag = entry
+                if id_value in global_ids:
+                    prev_file, prev_line, prev_tag = global_ids[id_value]
+                    errors.append(
+                        f"  {xml_file.relative_to(self.unpacked_dir)}: "
+                        f"Line {line}: Global ID '{id_value}' in <{tag}> "
+                        f"already used in {prev_file} at line {prev_line} in <{prev_tag}>"
+                    )
+                else:
+                    global_ids[id_value] = (
+                        xml_file.relative_to(self.unpacked_dir),
+                        line,
+                        tag,
                     )
-
-                    # Check if this element type has ID uniqueness requirements
-                    if tag in self.UNIQUE_ID_REQUIREMENTS:
-                        attr_name, scope = self.UNIQUE_ID_REQUIREMENTS[tag]
-
-                        # Look for the specified attribute
-                        id_value = None
-                        for attr, value in elem.attrib.items():
-                            attr_local = (
-                                attr.split("}")[-1].lower()
-                                if "}" in attr
-                                else attr.lower()
-                            )
-                            if attr_local == attr_name:
-                                id_value = value
-                                break
-
-                        if id_value is not None:
-                            if scope == "global":
-                                # Check global uniqueness
-                                if id_value in global_ids:
-                                    prev_file, prev_line, prev_tag = global_ids[
-                                        id_value
-                                    ]
-                                    errors.append(
-                                        f"  {xml_file.relative_to(self.unpacked_dir)}: "
-                                        f"Line {elem.sourceline}: Global ID '{id_value}' in <{tag}> "
-                                        f"already used in {prev_file} at line {prev_line} in <{prev_tag}>"
-                                    )
-                                else:
-                                    global_ids[id_value] = (
-                                        xml_file.relative_to(self.unpacked_dir),
-                                        elem.sourceline,
-                                        tag,
-                                    )
-                            elif scope == "file":
-                                # Check file-level uniqueness
-                                key = (tag, attr_name)
-                                if key not in file_ids:
-                                    file_ids[key] = {}
-
-                                if id_value in file_ids[key]:
-                                    prev_line = file_ids[key][id_value]
-                                    errors.append(
-                                        f"  {xml_file.relative_to(self.unpacked_dir)}: "
-                                        f"Line {elem.sourceline}: Duplicate {attr_name}='{id_value}' in <{tag}> "
-                                        f"(first occurrence at line {prev_line})"
-                                    )
-                                else:
-                                    file_ids[key][id_value] = elem.sourceline
-
-            except (lxml.etree.XMLSyntaxError, Exception) as e:
-                errors.append(
-                    f"  {xml_file.relative_to(self.unpacked_dir)}: Error: {e}"
-                )
 
         if errors:
             print(f"FAILED - Found {len(errors)} ID uniqueness violations:")
@@ -274,6 +523,151 @@ class BaseSchemaValidator:
                 print("PASSED - All required IDs are unique")
             return True
 
+    def _scan_unique_ids(self, xml_file):
+        """Check file-level ID uniqueness in a single part and collect global IDs.
+
+        Returns:
+            list: Entries in document order, either ("error", message) or
+                ("global", id_value, line, tag) for IDs that must be globally unique
+        """
+        entries = []
+
+        try:
+            file_ids = {}  # Track IDs that must be unique within this file
+
+            # Elements inside mc:AlternateContent are skipped
+            for elem in self._iter_part_elements(
+                xml_file, skip_alternate_content=True
+            ):
+                # Check if this element type has ID uniqueness requirements
+                tag = self._local_name(elem.tag)
+                if tag in self.UNIQUE_ID_REQUIREMENTS:
+                    attr_name, scope = self.UNIQUE_ID_REQUIREMENTS[tag]
+
+                    # Look for the specified attribute
+                    id_value = None
+                    for attr, value in elem.attrib.items():
+                        if self._local_name(attr) == attr_name:
+                            id_value = value
+                            break
+
+                    if id_value is not None:
+                        if scope == "global":
+                            # Global uniqueness is checked when merging all parts
+                            entries.append(("global", id_value, elem.sourceline, tag))
+                        elif scope == "file":
+                            # Check file-level uniqueness
+                            key = (tag, attr_name)
+                            if key not in file_ids:
+                                file_ids[key] = {}
+
+                            if id_value in file_ids[key]:
+                                prev_line = file_ids[key][id_value]
+                                entries.append(
+                                    (
+                                        "error",
+                                        f"  {xml_file.relative_to(self.unpacked_dir)}: "
+                                        f"Line {elem.sourceline}: Duplicate {attr_name}='{id_value}' in <{tag}> "
+                                        f"(first occurrence at line {prev_line})",
+                                    )
+                                )
+                            else:
+                                file_ids[key][id_value] = elem.sourceline
+
+        except (lxml.etree.XMLSyntaxError, Exception) as e:
+            entries.append(
+                ("error", f"  {xml_file.relative_to(self.unpacked_dir)}: Error: {e}")
+            )
+
+        return entries
+
+    def _local_name(self, name):
+        """Get the lowercased local name of a namespaced tag or attribute name.
+
+        Results are memoized, so the namespace split and lowercasing happen
+        once per distinct name instead of once per element.
+        """
+        try:
+            return self._local_names[name]
+        except KeyError:
+            local_name = name.split("}")[-1].lower() if "}" in name else name.lower()
+            self._local_names[name] = local_name
+            return local_name
+
+    def _get_root(self, xml_file):
+        """Get the root element of a part, for checks that only look at the root.
+
+        In streaming mode only the start of the file is read, and the root's
+        children are not available.
+
+        Raises:
+            lxml.etree.XMLSyntaxError: If the start of the file is not well-formed
+        """
+        if not self.streaming:
+            return self._parse_xml(xml_file).getroot()
+        for _, root in lxml.etree.iterparse(
+            str(xml_file), events=("start",), huge_tree=True
+        ):
+            return root
+        raise lxml.etree.XMLSyntaxError("Document is empty", None, 1, 1)
+
+    def _iter_part_elements(self, xml_file, skip_alternate_content=False):
+        """Iterate over the elements of a part in document order.
+
+        In streaming mode the file is read with iterparse and every element is
+        cleared once processed, so no full tree is built for the scan. Otherwise
+        the shared tree is walked.
+
+        Args:
+            xml_file: Path to the XML file in unpacked_dir
+            skip_alternate_content: If True, skip mc:AlternateContent elements
+                and everything inside them
+
+        Raises:
+            lxml.etree.XMLSyntaxError: If the file is not well-formed
+        """
+        if self.streaming:
+            return self._iterparse_elements(xml_file, skip_alternate_content)
+
+        root = self._parse_xml(xml_file).getroot()
+        if skip_alternate_content:
+            # Remove all mc:AlternateContent elements from a copy of the tree
+            # (the parsed tree is shared with the other checks)
+            mc_elements = root.xpath(
+                ".//mc:AlternateContent", namespaces={"mc": self.MC_NAMESPACE}
+            )
+            if mc_elements:
+                root = copy.deepcopy(root)
+                for elem in root.xpath(
+                    ".//mc:AlternateContent", namespaces={"mc": self.MC_NAMESPACE}
+                ):
+                    elem.getparent().remove(elem)
+
+        return root.iter(lxml.etree.Element)
+
+    def _iterparse_elements(self, xml_file, skip_alternate_content):
+        """Stream the elements of a part with iterparse (see _iter_part_elements)."""
+        alternate_content_tag = f"{{{self.MC_NAMESPACE}}}AlternateContent"
+        skip_depth = 0
+
+        for event, elem in lxml.etree.iterparse(
+            str(xml_file), events=("start", "end"), huge_tree=True
+        ):
+            if event == "start":
+                if skip_alternate_content and elem.tag == alternate_content_tag:
+                    skip_depth += 1
+                elif not skip_depth:
+                    yield elem
+                continue
+
+            if skip_alternate_content and elem.tag == alternate_content_tag:
+                skip_depth -= 1
+
+            # Drop the processed element and its already-processed siblings
+            elem.clear(keep_tail=True)
+            while elem.getprevious() is not None:
+                del elem.getparent()[0]
+
     def validate_file_references(self):
         """
         Validate that all .rels files properly reference files and that all files are referenced.
@@ -310,7 +704,7 @@ class BaseSchemaValidator:
         for rels_file in rels_files:
             try:
                 # Parse relationships file
-                rels_root = lxml.etree.parse(str(rels_file)).getroot()
+                rels_root = self._parse_xml(rels_file).getroot()
 
                 # Get the directory where this .rels file is located
                 rels_dir = rels_file.parent
@@ -390,8 +784,6 @@ class BaseSchemaValidator:
         Validate that all r:id attributes in XML files reference existing IDs
         in their corresponding .rels files, and optionally validate relationship types.
         """
-        import lxml.etree
-
         errors = []
 
         # Process each XML file that might contain r:id references
@@ -411,7 +803,7 @@ class BaseSchemaValidator:
 
             try:
                 # Parse the .rels file to get valid relationship IDs and their types
-                rels_root = lxml.etree.parse(str(rels_file)).getroot()
+                rels_root = self._parse_xml(rels_file).getroot()
                 rid_to_type = {}
 
                 for rel in rels_root.findall(
@@ -433,11 +825,8 @@ class BaseSchemaValidator:
                         )
                         rid_to_type[rid] = type_name
 
-                # Parse the XML file to find all r:id references
-                xml_root = lxml.etree.parse(str(xml_file)).getroot()
-
                 # Find all elements with r:id attributes
-                for elem in xml_root.iter():
+                for elem in self._iter_part_elements(xml_file):
                     # Check for r:id attribute (relationship ID)
                     rid_attr = elem.get(f"{{{self.OFFICE_RELATIONSHIPS_NAMESPACE}}}id")
                     if rid_attr:
@@ -531,7 +920,7 @@ class BaseSchemaValidator:
 
         try:
             # Parse and get all declared parts and extensions
-            root = lxml.etree.parse(str(content_types_file)).getroot()
+            root = self._parse_xml(content_types_file).getroot()
             declared_parts = set()
             declared_extensions = set()
 
@@ -593,7 +982,7 @@ class BaseSchemaValidator:
                     continue
 
                 try:
-                    root_tag = lxml.etree.parse(str(xml_file)).getroot().tag
+                    root_tag = self._get_root(xml_file).tag
                     root_name = root_tag.split("}")[-1] if "}" in root_tag else root_tag
 
                     if root_name in declarable_roots and path_str not in declared_parts:
@@ -694,9 +1083,7 @@ class BaseSchemaValidator:
 
         for xml_file in self.xml_files:
             relative_path = str(xml_file.relative_to(self.unpacked_dir))
-            is_valid, new_file_errors = self.validate_file_against_xsd(
-                xml_file, verbose=False
-            )
+            is_valid, new_file_errors = self._get_part_result(xml_file, "xsd")
 
             if is_valid is None:
                 skipped_count += 1
@@ -762,11 +1149,16 @@ class BaseSchemaValidator:
 
         return None
 
-    def _clean_ignorable_namespaces(self, xml_doc):
-        """Remove attributes and elements not in allowed namespaces."""
-        # Create a clean copy
-        xml_string = lxml.etree.tostring(xml_doc, encoding="unicode")
-        xml_copy = lxml.etree.fromstring(xml_string)
+    def _clean_ignorable_namespaces(self, xml_doc, copy=True):
+        """Remove attributes and elements not in allowed namespaces.
+
+        Works on a copy unless copy is False, in which case xml_doc is modified.
+        """
+        if copy:
+            xml_string = lxml.etree.tostring(xml_doc, encoding="unicode")
+            xml_copy = lxml.etree.fromstring(xml_string)
+        else:
+            xml_copy = xml_doc.getroot()
 
         # Remove attributes not in allowed namespaces
         for elem in xml_copy.iter():
@@ -830,28 +1222,44 @@ class BaseSchemaValidator:
             return None, None  # Skip file
 
         try:
-            # Load schema
-            with open(schema_path, "rb") as xsd_file:
-                parser = lxml.etree.XMLParser()
-                xsd_doc = lxml.etree.parse(
-                    xsd_file, parser=parser, base_url=str(schema_path)
-                )
-                schema = lxml.etree.XMLSchema(xsd_doc)
+            # Load XML (validation works on a copy, unless the tree is not shared)
+            xml_doc = self._parse_xml(xml_file)
+        except Exception as e:
+            return False, {str(e)}
 
-            # Load and preprocess XML
-            with open(xml_file, "r") as f:
-                xml_doc = lxml.etree.parse(f)
+        return self._validate_xml_doc_xsd(
+            xml_doc, schema_path, xml_file.relative_to(base_path), owned=self.streaming
+        )
+
+    def _validate_xml_doc_xsd(self, xml_doc, schema_path, relative_path, owned=False):
+        """Validate a parsed XML document against an XSD schema.
+
+        Args:
+            xml_doc: Parsed lxml ElementTree
+            schema_path: Path to the XSD schema to validate against
+            relative_path: Path of the part relative to the package root
+            owned: If True, xml_doc is not used elsewhere and is preprocessed in
+                place instead of on a copy
+
+        Returns:
+            tuple: (is_valid, errors_set)
+        """
+        try:
+            schema = self._get_compiled_schema(schema_path)
 
-            xml_doc, _ = self._remove_template_tags_from_text_nodes(xml_doc)
+            # Preprocess XML
+            # (after this the tree is always private, so later steps modify it)
+            xml_doc, _ = self._remove_template_tags_from_text_nodes(
+                xml_doc, copy=not owned
+            )
             xml_doc = self._preprocess_for_mc_ignorable(xml_doc)
 
             # Clean ignorable namespaces if needed
-            relative_path = xml_file.relative_to(base_path)
             if (
                 relative_path.parts
                 and relative_path.parts[0] in self.MAIN_CONTENT_FOLDERS
             ):
-                xml_doc = self._clean_ignorable_namespaces(xml_doc)
+                xml_doc = self._clean_ignorable_namespaces(xml_doc, copy=False)
 
             # Validate
             if schema.validate(xml_doc):
@@ -866,49 +1274,87 @@ class BaseSchemaValidator:
         except Exception as e:
             return False, {str(e)}
 
+    def _get_compiled_schema(self, schema_path):
+        """Get the compiled XSD schema for a path, compiling it on first use.
+
+        Schemas are cached at class level, so DOCX and PPTX validators (and
+        repeated validator runs in the same process) compile each schema once.
+
+        Args:
+            schema_path: Path to the XSD schema
+
+        Returns:
+            lxml.etree.XMLSchema: Compiled schema
+        """
+        key = str(Path(schema_path).resolve())
+        schema = BaseSchemaValidator._compiled_schemas.get(key)
+        if schema is None:
+            with open(schema_path, "rb") as xsd_file:
+                parser = lxml.etree.XMLParser()
+                xsd_doc = lxml.etree.parse(
+                    xsd_file, parser=parser, base_url=str(schema_path)
+                )
+                schema = lxml.etree.XMLSchema(xsd_doc)
+            BaseSchemaValidator._compiled_schemas[key] = schema
+        return schema
+
     def _get_original_file_errors(self, xml_file):
         """Get XSD validation errors from a single file in the original document.
 
+        Results are memoized per part, so each original part is read and
+        validated at most once per run.
+
         Args:
             xml_file: Path to the XML file in unpacked_dir to check
 
         Returns:
             set: Set of error messages from the original file
         """
-        import tempfile
-        import zipfile
-
         # Resolve both paths to handle symlinks (e.g., /var vs /private/var on macOS)
         xml_file = Path(xml_file).resolve()
         unpacked_dir = self.unpacked_dir.resolve()
         relative_path = xml_file.relative_to(unpacked_dir)
 
-        with tempfile.TemporaryDirectory() as temp_dir:
-            temp_path = Path(temp_dir)
+        key = relative_path.as_posix()
+        if key not in self._original_errors:
+            self._original_errors[key] = self._validate_original_part(relative_path)
+        return self._original_errors[key]
 
-            # Extract original file
-            with zipfile.ZipFile(self.original_file, "r") as zip_ref:
-                zip_ref.extractall(temp_path)
+    def _validate_original_part(self, relative_path):
+        """Validate a single part of the original package against its XSD schema.
 
-            # Find corresponding file in original
-            original_xml_file = temp_path / relative_path
+        Args:
+            relative_path: Path of the part relative to the package root
 
-            if not original_xml_file.exists():
-                # File didn't exist in original, so no original errors
-                return set()
+        Returns:
+            set: Set of error messages from the original part
+        """
+        content = self.original_package.read(relative_path)
+        if content is None:
+            # File didn't exist in original, so no original errors
+            return set()
 
-            # Validate the specific file in original
-            is_valid, errors = self._validate_single_file_xsd(
-                original_xml_file, temp_path
-            )
-            return errors if errors else set()
+        schema_path = self._get_schema_path(relative_path)
+        if not schema_path:
+            return set()
+
+        try:
+            xml_doc = lxml.etree.parse(io.BytesIO(content))
+        except Exception as e:
+            return {str(e)}
 
-    def _remove_template_tags_from_text_nodes(self, xml_doc):
+        is_valid, errors = self._validate_xml_doc_xsd(
+            xml_doc, schema_path, relative_path, owned=True
+        )
+        return errors if errors else set()
+
+    def _remove_template_tags_from_text_nodes(self, xml_doc, copy=True):
         """Remove template tags from XML text nodes and collect warnings.
 
         Template tags follow the pattern {{ ... }} and are used as placeholders
         for content replacement. They should be removed from text content before
-        XSD validation while preserving XML structure.
+        XSD validation while preserving XML structure. Works on a copy unless
+        copy is False, in which case xml_doc is modified.
 
         Returns:
             tuple: (cleaned_xml_doc, warnings_list)
@@ -917,8 +1363,11 @@ class BaseSchemaValidator:
         template_pattern = re.compile(r"\{\{[^}]*\}\}")
 
         # Create a copy of the document to avoid modifying the original
-        xml_string = lxml.etree.tostring(xml_doc, encoding="unicode")
-        xml_copy = lxml.etree.fromstring(xml_string)
+        if copy:
+            xml_string = lxml.etree.tostring(xml_doc, encoding="unicode")
+            xml_copy = lxml.etree.fromstring(xml_string)
+        else:
+            xml_copy = xml_doc.getroot()
 
         def process_text_content(text, content_type):
             if not text:
@@ -947,5 +1396,27 @@ class BaseSchemaValidator:
         return lxml.etree.ElementTree(xml_copy), warnings
 
 
+class _DiscardTarget:
+    """Parser target that discards every event (see _check_well_formed)."""
+
+    def close(self):
+        return None
+
+
+# Validator used by each worker process of the per-part pool
+_worker_validator = None
+
+
+def _init_part_worker(validator_class, unpacked_dir, original_file, options):
+    """Create the validator for a worker process of the per-part pool."""
+    global _worker_validator
+    _worker_validator = validator_class(unpacked_dir, original_file, **options)
+
+
+def _check_part_in_worker(xml_file):
+    """Run the per-part checks for one file in a worker process."""
+    return _worker_validator._check_part(xml_file)
+
+
 if __name__ == "__main__":
     raise RuntimeError("This module should not be run directly.")
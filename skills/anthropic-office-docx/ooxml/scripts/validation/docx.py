@@ -3,8 +3,6 @@ Validator for Word document XML files against XSD schemas.
 """
 
 import re
-import tempfile
-import zipfile
 
 import lxml.etree
 
@@ -81,7 +79,7 @@ class DOCXSchemaValidator(BaseSchemaValidator):
                 continue
 
             try:
-                root = lxml.etree.parse(str(xml_file)).getroot()
+                root = self._parse_xml(xml_file).getroot()
 
                 # Find all w:t elements
                 for elem in root.iter(f"{{{self.WORD_2006_NAMESPACE}}}t"):
@@ -134,7 +132,7 @@ class DOCXSchemaValidator(BaseSchemaValidator):
                 continue
 
             try:
-                root = lxml.etree.parse(str(xml_file)).getroot()
+                root = self._parse_xml(xml_file).getroot()
 
                 # Find all w:t elements that are descendants of w:del elements
                 namespaces = {"w": self.WORD_2006_NAMESPACE}
@@ -180,7 +178,7 @@ class DOCXSchemaValidator(BaseSchemaValidator):
                 continue
 
             try:
-                root = lxml.etree.parse(str(xml_file)).getroot()
+                root = self._parse_xml(xml_file).getroot()
                 # Count all w:p elements
                 paragraphs = root.findall(f".//{{{self.WORD_2006_NAMESPACE}}}p")
                 count = len(paragraphs)
@@ -194,19 +192,16 @@ class DOCXSchemaValidator(BaseSchemaValidator):
         count = 0
 
         try:
-            # Create temporary directory to unpack original
-            with tempfile.TemporaryDirectory() as temp_dir:
-                # Unpack original docx
-                with zipfile.ZipFile(self.original_file, "r") as zip_ref:
-                    zip_ref.extractall(temp_dir)
+            # Parse document.xml straight from the original package
+            doc_xml = self.original_package.open("word/document.xml")
+            if doc_xml is None:
+                raise FileNotFoundError("word/document.xml not found in original")
+            with doc_xml:
+                root = lxml.etree.parse(doc_xml).getroot()
 
-                # Parse document.xml
-                doc_xml_path = temp_dir + "/word/document.xml"
-                root = lxml.etree.parse(doc_xml_path).getroot()
-
-                # Count all w:p elements
-                paragraphs = root.findall(f".//{{{self.WORD_2006_NAMESPACE}}}p")
-                count = len(paragraphs)
+            # Count all w:p elements
+            paragraphs = root.findall(f".//{{{self.WORD_2006_NAMESPACE}}}p")
+            count = len(paragraphs)
 
         except Exception as e:
             print(f"Error counting paragraphs in original document: {e}")
@@ -225,7 +220,7 @@ class DOCXSchemaValidator(BaseSchemaValidator):
                 continue
 
             try:
-                root = lxml.etree.parse(str(xml_file)).getroot()
+                root = self._parse_xml(xml_file).getroot()
                 namespaces = {"w": self.WORD_2006_NAMESPACE}
 
                 # Find w:delText in w:ins that are NOT within w:del
@@ -0,0 +1,79 @@
+"""
+Read-only access to the original Office package that validators compare against.
+"""
+
+import zipfile
+from pathlib import Path
+
+
+class OriginalPackage:
+    """Lazily-opened reader for the parts of an original Office package.
+
+    The package is opened on first use and parts are read straight from their
+    zip members, so comparing against the baseline never extracts it to disk.
+    Pass one instance to every validator of a run to share the open zip.
+    """
+
+    def __init__(self, path):
+        self.path = Path(path)
+        self._zip = None
+
+    def _get_zip(self):
+        """Open the package on first use and keep it open until close()."""
+        if self._zip is None:
+            self._zip = zipfile.ZipFile(self.path, "r")
+        return self._zip
+
+    def getinfo(self, relative_path):
+        """Get the zip directory entry of a part.
+
+        Args:
+            relative_path: Path of the part relative to the package root
+
+        Returns:
+            zipfile.ZipInfo: Entry of the part, or None if it is not in the package
+        """
+        try:
+            return self._get_zip().getinfo(Path(relative_path).as_posix())
+        except KeyError:
+            return None
+
+    def open(self, relative_path):
+        """Open a part for streaming reads (e.g. to pass to an XML parser).
+
+        Args:
+            relative_path: Path of the part relative to the package root
+
+        Returns:
+            File-like object for the part, or None if it is not in the package
+        """
+        try:
+            return self._get_zip().open(Path(relative_path).as_posix())
+        except KeyError:
+            return None
+
+    def read(self, relative_path):
+        """Read the raw content of a part.
+
+        Args:
+            relative_path: Path of the part relative to the package root
+
+        Returns:
+            bytes: Content of the part, or None if it is not in the package
+        """
+        try:
+            return self._get_zip().read(Path(relative_path).as_posix())
+        except KeyError:
+            return None
+
+    def close(self):
+        """Close the package if it was opened."""
+        if self._zip is not None:
+            self._zip.close()
+            self._zip = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
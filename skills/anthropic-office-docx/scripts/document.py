@@ -17,6 +17,9 @@ Usage:
     doc.add_comment(start=node, end=node, text="Comment text")
     doc.reply_to_comment(parent_comment_id=0, text="Reply text")
 
+    # Import many comments and tracked changes at once
+    results = doc.import_operations("review.jsonl")
+
     # Suggest tracked changes
     doc["word/document.xml"].suggest_deletion(node)  # Delete content
     doc["word/document.xml"].revert_insertion(ins_node)  # Reject insertion
@@ -26,19 +29,24 @@ Usage:
     doc.save()
 """
 
+import bisect
 import html
+import json
+import os
 import random
 import shutil
 import tempfile
+from contextlib import contextmanager
 from datetime import datetime, timezone
 from pathlib import Path
 
 from defusedxml import minidom
 from ooxml.scripts.pack import pack_document
 from ooxml.scripts.validation.docx import DOCXSchemaValidator
+from ooxml.scripts.validation.package import OriginalPackage
 from ooxml.scripts.validation.redlining import RedliningValidator
 
-from .utilities import XMLEditor
+from .utilities import XMLEditor, _TextIndex
 
 # Path to template files
 TEMPLATE_DIR = Path(__file__).parent / "templates"
@@ -71,20 +79,67 @@ class DocxXMLEditor(XMLEditor):
         self.rsid = rsid
         self.author = author
         self.initials = initials
+        # Next free tracked change ID, found by one scan on first use
+        self._next_change_id = None
+        # Nodes waiting for attribute injection while a batch is open
+        self._pending_nodes = None
 
     def _get_next_change_id(self):
-        """Get the next available change ID by checking all tracked change elements."""
-        max_id = -1
-        for tag in ("w:ins", "w:del"):
-            elements = self.dom.getElementsByTagName(tag)
-            for elem in elements:
-                change_id = elem.getAttribute("w:id")
-                if change_id:
-                    try:
-                        max_id = max(max_id, int(change_id))
-                    except ValueError:
-                        pass
-        return max_id + 1
+        """Allocate the next available change ID.
+
+        All tracked change elements are scanned once; later IDs come from a counter
+        that _note_change_id keeps ahead of IDs added through this editor.
+        """
+        if self._next_change_id is None:
+            max_id = -1
+            for tag in ("w:ins", "w:del"):
+                elements = self.dom.getElementsByTagName(tag)
+                for elem in elements:
+                    change_id = elem.getAttribute("w:id")
+                    if change_id:
+                        try:
+                            max_id = max(max_id, int(change_id))
+                        except ValueError:
+                            pass
+            self._next_change_id = max_id + 1
+        change_id = self._next_change_id
+        self._next_change_id += 1
+        return change_id
+
+    def _note_change_id(self, change_id):
+        """Keep the change ID counter ahead of an ID that was set explicitly."""
+        if self._next_change_id is None:
+            return
+        try:
+            self._next_change_id = max(self._next_change_id, int(change_id) + 1)
+        except ValueError:
+            pass
+
+    @contextmanager
+    def batch(self):
+        """Group many edits and add their attributes in one pass.
+
+        Edits made inside the block are applied to the DOM right away, but the
+        RSIDs, authors, dates and change IDs that DocxXMLEditor adds to new content
+        are added when the block exits, all with the same timestamp. Nested
+        batches join the outermost one.
+
+        Example:
+            editor = doc["word/document.xml"]
+            with editor.batch():
+                for run in runs:
+                    editor.suggest_deletion(run)
+        """
+        if self._pending_nodes is not None:
+            yield self
+            return
+
+        self._pending_nodes = []
+        try:
+            yield self
+        finally:
+            nodes, self._pending_nodes = self._pending_nodes, None
+            self._inject_attributes_to_nodes(nodes)
 
     def _ensure_w16du_namespace(self):
         """Ensure w16du namespace is declared on the root element."""
@@ -124,10 +179,14 @@ class DocxXMLEditor(XMLEditor):
         - w:comment: gets w:author, w:date, w:initials
         - w16cex:commentExtensible: gets w16cex:dateUtc
 
+        Inside batch() the nodes are queued and processed when the batch exits.
+
         Args:
             nodes: List of DOM nodes to process
         """
-        from datetime import datetime, timezone
+        if self._pending_nodes is not None:
+            self._pending_nodes.extend(nodes)
+            return
 
         timestamp = datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
 
@@ -168,6 +227,8 @@ class DocxXMLEditor(XMLEditor):
             # Auto-assign w:id if not present
             if not elem.hasAttribute("w:id"):
                 elem.setAttribute("w:id", str(self._get_next_change_id()))
+            else:
+                self._note_change_id(elem.getAttribute("w:id"))
             if not elem.hasAttribute("w:author"):
                 elem.setAttribute("w:author", self.author)
             if not elem.hasAttribute("w:date"):
@@ -204,38 +265,47 @@ class DocxXMLEditor(XMLEditor):
                     if not elem.hasAttribute("xml:space"):
                         elem.setAttribute("xml:space", "preserve")
 
+        handlers = {
+            "w:p": add_rsid_to_p,
+            "w:r": add_rsid_to_r,
+            "w:t": add_xml_space_to_t,
+            "w:ins": add_tracked_change_attrs,
+            "w:del": add_tracked_change_attrs,
+            "w:comment": add_comment_attrs,
+            "w16cex:commentExtensible": add_comment_extensible_date,
+        }
+
+        # Walk each node and its descendants once. Nodes inside another queued node
+        # are covered by its walk, and nodes removed again during a batch are skipped.
+        queued = set(map(id, nodes))
         for node in nodes:
-            if node.nodeType != node.ELEMENT_NODE:
+            if node.nodeType != node.ELEMENT_NODE or not self._needs_injection(
+                node, queued
+            ):
                 continue
+            stack = [node]
+            while stack:
+                elem = stack.pop()
+                handler = handlers.get(elem.tagName)
+                if handler:
+                    handler(elem)
+                stack.extend(
+                    child
+                    for child in reversed(elem.childNodes)
+                    if child.nodeType == child.ELEMENT_NODE
+                )
 
-            # Handle the node itself
-            if node.tagName == "w:p":
-                add_rsid_to_p(node)
-            elif node.tagName == "w:r":
-                add_rsid_to_r(node)
-            elif node.tagName == "w:t":
-                add_xml_space_to_t(node)
-            elif node.tagName in ("w:ins", "w:del"):
-                add_tracked_change_attrs(node)
-            elif node.tagName == "w:comment":
-                add_comment_attrs(node)
-            elif node.tagName == "w16cex:commentExtensible":
-                add_comment_extensible_date(node)
-
-            # Process descendants (getElementsByTagName doesn't return the element itself)
-            for elem in node.getElementsByTagName("w:p"):
-                add_rsid_to_p(elem)
-            for elem in node.getElementsByTagName("w:r"):
-                add_rsid_to_r(elem)
-            for elem in node.getElementsByTagName("w:t"):
-                add_xml_space_to_t(elem)
-            for tag in ("w:ins", "w:del"):
-                for elem in node.getElementsByTagName(tag):
-                    add_tracked_change_attrs(elem)
-            for elem in node.getElementsByTagName("w:comment"):
-                add_comment_attrs(elem)
-            for elem in node.getElementsByTagName("w16cex:commentExtensible"):
-                add_comment_extensible_date(elem)
+    @staticmethod
+    def _needs_injection(node, queued):
+        """Check that node is in the document and has no ancestor in queued (ids)."""
+        parent = node.parentNode
+        while parent is not None:
+            if parent.nodeType == parent.DOCUMENT_NODE:
+                return True
+            if id(parent) in queued:
+                return False
+            parent = parent.parentNode
+        return False
 
     def replace_node(self, elem, new_content):
         """Replace node with automatic attribute injection."""
@@ -604,13 +674,162 @@ def _generate_hex_id() -> str:
     return f"{random.randint(1, 0x7FFFFFFE):08X}"
 
 
+def _link_or_copy(src, dst):
+    """Hard-link dst to src, copying it if that fails (e.g. across filesystems).
+
+    Used by copytree to build the Document workspace without duplicating unchanged
+    parts and media. Editors replace files rather than writing into them, so the
+    linked originals are never modified. Symlinks are not an option: validators
+    resolve workspace paths and expect them to stay inside the workspace.
+    """
+    try:
+        os.link(src, dst)
+    except OSError:
+        shutil.copy2(src, dst)
+    return dst
+
+
+def _copy_if_changed(src, dst):
+    """Copy src to dst unless dst is already the same file (an unmodified link)."""
+    if os.path.exists(dst) and os.path.samefile(src, dst):
+        return dst
+    return shutil.copy2(src, dst)
+
+
+def _ignore_non_xml_files(directory, names):
+    """copytree ignore function that keeps only directories and XML parts."""
+    return [
+        name
+        for name in names
+        if not name.endswith((".xml", ".rels"))
+        and not os.path.isdir(os.path.join(directory, name))
+    ]
+
+
+class _ParagraphAnchors:
+    """
+    Lookup of the paragraphs of document.xml by paraId, line number and text.
+
+    Built in one pass over the w:p elements, so resolving many anchors does not
+    search the document once per anchor. Anchors resolve against the document as
+    it was when the index was built.
+    """
+
+    def __init__(self, editor):
+        """
+        Index the paragraphs of an editor's document.
+
+        Args:
+            editor: XMLEditor of word/document.xml
+        """
+        paragraphs = editor.dom.getElementsByTagName("w:p")
+
+        # Format: {paraId: [w:p, ...], ...}
+        self.by_para_id = {}
+        lines = []
+        for i, para in enumerate(paragraphs):
+            para_id = para.getAttribute("w14:paraId")
+            if para_id:
+                self.by_para_id.setdefault(para_id.upper(), []).append(para)
+            line = getattr(para, "parse_position", (None,))[0]
+            if line is not None:
+                lines.append((line, i))
+        lines.sort()
+        self.lines = [line for line, _ in lines]
+        self.line_paragraphs = [paragraphs[i] for _, i in lines]
+        self.text = _TextIndex(paragraphs, editor._get_element_text)
+
+    def resolve(self, operation):
+        """
+        Find the paragraph an operation is anchored to.
+
+        Args:
+            operation: Operation dict with exactly one of "para_id", "line",
+                "lines" ([first, last], inclusive) or "contains"
+
+        Returns:
+            The anchored w:p element
+
+        Raises:
+            ValueError: If the anchor is missing, ambiguous or matches no paragraph
+        """
+        keys = [key for key in ("para_id", "line", "lines", "contains") if key in operation]
+        if len(keys) != 1:
+            raise ValueError(
+                "Operation needs exactly one anchor: para_id, line, lines or contains"
+            )
+        key = keys[0]
+        value = operation[key]
+
+        if key == "para_id":
+            matches = self.by_para_id.get(str(value).upper(), [])
+        elif key == "contains":
+            if not value or not isinstance(value, str):
+                raise ValueError("contains must be a non-empty string")
+            matches = list(self.text.find(html.unescape(value)))
+        else:
+            first, last = (value, value) if key == "line" else value
+            start = bisect.bisect_left(self.lines, int(first))
+            end = bisect.bisect_right(self.lines, int(last))
+            matches = self.line_paragraphs[start:end]
+
+        if not matches:
+            raise ValueError(f"No paragraph found for {key}={value!r}")
+        if len(matches) > 1:
+            raise ValueError(
+                f"{len(matches)} paragraphs found for {key}={value!r}; "
+                f"the anchor must match exactly one"
+            )
+        return matches[0]
+
+
+def _load_operations(source):
+    """
+    Load bulk operations from a list, a .json file (one list) or a .jsonl file.
+
+    Returns:
+        list: Operation dicts; a JSONL line that cannot be parsed is returned as
+            the ValueError describing it, so it is reported like a failed operation
+    """
+    if not isinstance(source, (str, Path)):
+        return list(source)
+
+    path = Path(source)
+    if path.suffix.lower() != ".jsonl":
+        with open(path, encoding="utf-8") as f:
+            operations = json.load(f)
+        if not isinstance(operations, list):
+            raise ValueError(f"{path} must contain a JSON list of operations")
+        return operations
+
+    operations = []
+    with open(path, encoding="utf-8") as f:
+        for line_number, line in enumerate(f, 1):
+            if not line.strip():
+                continue
+            try:
+                operations.append(json.loads(line))
+            except json.JSONDecodeError as e:
+                operations.append(ValueError(f"Line {line_number}: invalid JSON ({e})"))
+    return operations
+
+
 def _generate_rsid() -> str:
     """Generate random 8-character hex RSID."""
     return "".join(random.choices("0123456789ABCDEF", k=8))
 
 
 class Document:
-    """Manages comments in unpacked Word documents."""
+    """Manages comments in unpacked Word documents.
+
+    Edits are made in a temporary workspace at `unpacked_path`, whose unchanged
+    files are hard links to the files in the original unpacked directory (copies
+    when the two are on different filesystems). Editors replace a file when they
+    save it, so the original is never touched. Code that writes to workspace files
+    directly must do the same: write under a new name, or delete the file first,
+    instead of overwriting it in place. Writing into a linked file also changes the
+    original directory, and with it the validation baseline packed from it.
+    """
 
     def __init__(
         self,
@@ -636,14 +855,18 @@ class Document:
         if not self.original_path.exists() or not self.original_path.is_dir():
             raise ValueError(f"Directory not found: {unpacked_dir}")
 
-        # Create temporary directory with subdirectories for unpacked content and baseline
+        # Create temporary directory with subdirectories for unpacked content and baseline.
+        # The unpacked workspace links to the original files; editors replace a file
+        # when saving it, so only edited parts are ever materialized.
         self.temp_dir = tempfile.mkdtemp(prefix="docx_")
         self.unpacked_path = Path(self.temp_dir) / "unpacked"
-        shutil.copytree(self.original_path, self.unpacked_path)
+        shutil.copytree(
+            self.original_path, self.unpacked_path, copy_function=_link_or_copy
+        )
 
-        # Pack original directory into temporary .docx for validation baseline (outside unpacked dir)
+        # Temporary .docx of the original for validation baseline (outside unpacked
+        # dir), packed on first validation
         self.original_docx = Path(self.temp_dir) / "original.docx"
-        pack_document(self.original_path, self.original_docx, validate=False)
 
         self.word_path = self.unpacked_path / "word"
 
@@ -658,6 +881,12 @@ class Document:
         # Cache for lazy-loaded editors
         self._editors = {}
 
+        # Indexes over the XML parts, built on first use and kept in sync as
+        # comments, relationships, overrides and people are added
+        self._attribute_values = {}
+        self._used_ids = {}
+        self._comment_anchors = None
+
         # Comment file paths
         self.comments_path = self.word_path / "comments.xml"
         self.comments_extended_path = self.word_path / "commentsExtended.xml"
@@ -728,19 +957,26 @@ class Document:
             cm.add_comment(start=start_node, end=end_node, text="Explanation")
         """
         comment_id = self.next_comment_id
-        para_id = _generate_hex_id()
-        durable_id = _generate_hex_id()
+        para_id = self._new_unique_id("para")
+        durable_id = self._new_unique_id("durable")
         timestamp = datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
 
         # Add comment ranges to document.xml immediately
-        self._document.insert_before(start, self._comment_range_start_xml(comment_id))
+        nodes = self._document.insert_before(
+            start, self._comment_range_start_xml(comment_id)
+        )
 
         # If end node is a paragraph, append comment markup inside it
         # Otherwise insert after it (for run-level anchors)
         if end.tagName == "w:p":
-            self._document.append_to(end, self._comment_range_end_xml(comment_id))
+            nodes += self._document.append_to(
+                end, self._comment_range_end_xml(comment_id)
+            )
         else:
-            self._document.insert_after(end, self._comment_range_end_xml(comment_id))
+            nodes += self._document.insert_after(
+                end, self._comment_range_end_xml(comment_id)
+            )
+        self._index_comment_anchors(nodes)
 
         # Add to comments.xml immediately
         self._add_to_comments_xml(
@@ -785,28 +1021,29 @@ class Document:
 
         parent_info = self.existing_comments[parent_comment_id]
         comment_id = self.next_comment_id
-        para_id = _generate_hex_id()
-        durable_id = _generate_hex_id()
+        para_id = self._new_unique_id("para")
+        durable_id = self._new_unique_id("durable")
         timestamp = datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
 
         # Add comment ranges to document.xml immediately
-        parent_start_elem = self._document.get_node(
-            tag="w:commentRangeStart", attrs={"w:id": str(parent_comment_id)}
+        parent_start_elem = self._get_comment_anchor(
+            "w:commentRangeStart", parent_comment_id
         )
-        parent_ref_elem = self._document.get_node(
-            tag="w:commentReference", attrs={"w:id": str(parent_comment_id)}
+        parent_ref_elem = self._get_comment_anchor(
+            "w:commentReference", parent_comment_id
         )
 
-        self._document.insert_after(
+        nodes = self._document.insert_after(
             parent_start_elem, self._comment_range_start_xml(comment_id)
         )
         parent_ref_run = parent_ref_elem.parentNode
         self._document.insert_after(
             parent_ref_run, f'<w:commentRangeEnd w:id="{comment_id}"/>'
         )
-        self._document.insert_after(
+        nodes += self._document.insert_after(
             parent_ref_run, self._comment_ref_run_xml(comment_id)
         )
+        self._index_comment_anchors(nodes)
 
         # Add to comments.xml immediately
         self._add_to_comments_xml(
@@ -830,6 +1067,91 @@ class Document:
         self.next_comment_id += 1
         return comment_id
 
+    def import_operations(self, source) -> list:
+        """
+        Apply many comments and tracked changes to document.xml at once.
+
+        Anchors of all operations are resolved in one indexed pass over the document
+        as it was before the import, so earlier operations do not shift the anchors
+        of later ones. Operations are then applied in order in one editor batch.
+        An operation that fails is reported and skipped; the others still apply.
+
+        Operations are dicts with an "op" key, an optional "id" of the caller's
+        choosing that is echoed in the results, and one paragraph anchor
+        ("para_id", "line", "lines": [first, last] or "contains") unless noted:
+        - {"op": "comment", <anchor>, "text": ...}: comment on the paragraph
+        - {"op": "reply", "parent": ..., "text": ...}: reply to a comment, given
+          its w:id or the "id" of an earlier comment operation
+        - {"op": "delete", <anchor>}: suggest deleting the paragraph
+        - {"op": "replace", <anchor>, "find": ..., "replace": ...}: tracked
+          replacement of text that occurs once within a single run
+        - {"op": "insert", <anchor>, "text": ...}: tracked new paragraph after the
+          anchor, with its paragraph properties
+
+        Args:
+            source: List of operation dicts, or path to a .json file holding such a
+                list or to a .jsonl file with one operation per line
+
+        Returns:
+            list: One dict per operation with "index", "id", "op" and "status"
+                ("ok" or "error"), plus "comment_id" for comments and replies or
+                "error" with the reason of a failure
+
+        Example:
+            results = doc.import_operations([
+                {"op": "comment", "id": "c1", "contains": "Term of Agreement", "text": "Too short"},
+                {"op": "reply", "parent": "c1", "text": "Agreed"},
+                {"op": "replace", "para_id": "3F2A1B7C", "find": "30 days", "replace": "60 days"},
+            ])
+            failed = [r for r in results if r["status"] == "error"]
+        """
+        operations = _load_operations(source)
+        anchors = _ParagraphAnchors(self._document)
+
+        # Resolve every anchor before changing anything
+        resolved = []
+        for operation in operations:
+            try:
+                if isinstance(operation, ValueError):
+                    raise operation
+                if not isinstance(operation, dict):
+                    raise ValueError("Operation must be a JSON object")
+                if operation.get("op") == "reply":
+                    resolved.append(None)
+                else:
+                    resolved.append(anchors.resolve(operation))
+            except (ValueError, TypeError) as e:
+                resolved.append(ValueError(str(e)))
+
+        results = []
+        comment_ids = {}
+        # Last paragraph inserted after each anchor, to keep inserts in order
+        inserted_after = {}
+        with self._document.batch():
+            for index, (operation, anchor) in enumerate(zip(operations, resolved)):
+                if not isinstance(operation, dict):
+                    operation = {}
+                result = {"index": index, "id": operation.get("id"), "op": operation.get("op")}
+                try:
+                    if isinstance(anchor, ValueError):
+                        raise anchor
+                    comment_id = self._apply_operation(
+                        operation, anchor, comment_ids, inserted_after
+                    )
+                    if comment_id is not None:
+                        result["comment_id"] = comment_id
+                        if result["id"] is not None:
+                            comment_ids[result["id"]] = comment_id
+                    result["status"] = "ok"
+                except KeyError as e:
+                    result["status"] = "error"
+                    result["error"] = f"Missing field {e}"
+                except (ValueError, TypeError) as e:
+                    result["status"] = "error"
+                    result["error"] = str(e)
+                results.append(result)
+        return results
+
     def __del__(self):
         """Clean up temporary directory on deletion."""
         if hasattr(self, "temp_dir") and Path(self.temp_dir).exists():
@@ -842,21 +1164,33 @@ class Document:
         Raises:
             ValueError: If validation fails.
         """
-        # Create validators with current state
-        schema_validator = DOCXSchemaValidator(
-            self.unpacked_path, self.original_docx, verbose=False
-        )
-        redlining_validator = RedliningValidator(
-            self.unpacked_path, self.original_docx, verbose=False
-        )
+        self._ensure_original_docx()
+
+        # Create validators with current state, sharing one reader for the
+        # original docx (the schema validator caches per-part results in the
+        # temp directory, so repeated calls only re-check parts that changed)
+        with OriginalPackage(self.original_docx) as original_package:
+            schema_validator = DOCXSchemaValidator(
+                self.unpacked_path,
+                self.original_docx,
+                verbose=False,
+                cache=True,
+                original_package=original_package,
+            )
+            redlining_validator = RedliningValidator(
+                self.unpacked_path,
+                self.original_docx,
+                verbose=False,
+                original_package=original_package,
+            )
 
-        # Run validations
-        if not schema_validator.validate():
-            raise ValueError("Schema validation failed")
-        if not redlining_validator.validate():
-            raise ValueError("Redlining validation failed")
+            # Run validations
+            if not schema_validator.validate():
+                raise ValueError("Schema validation failed")
+            if not redlining_validator.validate():
+                raise ValueError("Redlining validation failed")
 
-    def save(self, destination=None, validate=True) -> None:
+    def save(self, destination=None, validate=True, source_docx=None) -> None:
         """
         Save all modified XML files to disk and copy to destination directory.
 
@@ -864,7 +1198,11 @@ class Document:
 
         Args:
             destination: Optional path to save to. If None, saves back to original directory.
+                A path ending in .docx is written as a packed document instead.
             validate: If True, validates document before saving (default: True).
+            source_docx: Optional .docx the original directory was unpacked from. When
+                saving to a .docx, parts that still match it are copied from it as-is
+                instead of being condensed and recompressed.
         """
         # Only ensure comment relationships and content types if comment files exist
         if self.comments_path.exists():
@@ -879,9 +1217,165 @@ class Document:
         if validate:
             self.validate()
 
-        # Copy contents from temp directory to destination (or original directory)
         target_path = Path(destination) if destination else self.original_path
-        shutil.copytree(self.unpacked_path, target_path, dirs_exist_ok=True)
+
+        # Pack straight into a destination .docx
+        if target_path.suffix.lower() == ".docx":
+            pack_document(
+                self.unpacked_path, target_path, validate=False, source_file=source_docx
+            )
+            return
+
+        # Copy contents from temp directory to destination (or original directory)
+        if target_path.resolve() == self.original_path.resolve():
+            # Keep the validation baseline at the state before any edits
+            self._ensure_original_docx()
+        shutil.copytree(
+            self.unpacked_path,
+            target_path,
+            copy_function=_copy_if_changed,
+            dirs_exist_ok=True,
+        )
+
+    def _ensure_original_docx(self):
+        """Pack the original directory into the validation baseline if not done yet.
+
+        Validators only compare XML parts against the baseline, so media and other
+        binary parts are left out of it.
+        """
+        if self.original_docx.exists():
+            return
+        with tempfile.TemporaryDirectory() as temp_dir:
+            xml_only_dir = Path(temp_dir) / "original"
+            shutil.copytree(
+                self.original_path,
+                xml_only_dir,
+                ignore=_ignore_non_xml_files,
+                copy_function=_link_or_copy,
+            )
+            pack_document(xml_only_dir, self.original_docx, validate=False)
+
+    # ==================== Private: Bulk Operations ====================
+
+    def _apply_operation(self, operation, para, comment_ids, inserted_after):
+        """Apply one import_operations operation to its resolved paragraph.
+
+        Each operation checks its input before changing the document, so a failed
+        operation leaves no partial edit behind.
+
+        Returns:
+            int: The new comment ID for comments and replies, otherwise None
+        """
+        op = operation.get("op")
+        editor = self._document
+
+        if op == "comment":
+            return self.add_comment(start=para, end=para, text=str(operation["text"]))
+
+        if op == "reply":
+            parent, text = operation["parent"], str(operation["text"])
+            if not isinstance(parent, int):
+                if parent not in comment_ids:
+                    raise ValueError(f"No earlier comment operation with id {parent!r}")
+                parent = comment_ids[parent]
+            return self.reply_to_comment(parent, text)
+
+        if op == "delete":
+            editor.suggest_deletion(para)
+            return None
+
+        if op == "replace":
+            find, replacement = str(operation["find"]), str(operation["replace"])
+            run, text = self._find_run_text(para, find)
+            editor.replace_node(
+                run, self._tracked_replacement_xml(run, text, find, replacement)
+            )
+            return None
+
+        if op == "insert":
+            pPr = next(
+                (c.toxml() for c in para.childNodes if c.nodeName == "w:pPr"), ""
+            )
+            text = html.escape(str(operation["text"]), quote=False)
+            new_para = DocxXMLEditor.suggest_paragraph(
+                f"<w:p>{pPr}<w:r><w:t>{text}</w:t></w:r></w:p>"
+            )
+            nodes = editor.insert_after(inserted_after.get(para, para), new_para)
+            inserted_after[para] = next(
+                n for n in nodes if n.nodeType == n.ELEMENT_NODE
+            )
+            return None
+
+        raise ValueError(
+            f"Unknown op {op!r}; expected comment, reply, delete, replace or insert"
+        )
+
+    def _find_run_text(self, para, find):
+        """Find the single run of a paragraph whose text contains find exactly once.
+
+        Runs inside existing tracked changes are not considered.
+
+        Returns:
+            tuple: (w:r element, its text)
+
+        Raises:
+            ValueError: If find does not occur exactly once within a single run
+        """
+        if not find:
+            raise ValueError("find must be a non-empty string")
+        matches = []
+        for run in para.getElementsByTagName("w:r"):
+            parent = run.parentNode
+            while parent is not para and parent.tagName not in (
+                "w:ins",
+                "w:del",
+                "w:moveFrom",
+                "w:moveTo",
+            ):
+                parent = parent.parentNode
+            texts = [c for c in run.childNodes if c.nodeName == "w:t"]
+            if parent is not para or len(texts) != 1:
+                continue
+            text = "".join(
+                c.data for c in texts[0].childNodes if c.nodeType == c.TEXT_NODE
+            )
+            matches.extend([(run, text)] * text.count(find))
+
+        if len(matches) != 1:
+            raise ValueError(
+                f"Text {find!r} must occur exactly once within a single run of the "
+                f"paragraph, found {len(matches)}. Text may be split across runs."
+            )
+        return matches[0]
+
+    def _tracked_replacement_xml(self, run, text, find, replacement):
+        """Build XML that replaces find in a run's text with a tracked change.
+
+        Unchanged text before and after keeps the run's attributes and formatting.
+        """
+        attrs = "".join(
+            f' {attr.name}="{html.escape(attr.value)}"'
+            for attr in (run.attributes.item(i) for i in range(run.attributes.length))
+        )
+        rPr = next((c.toxml() for c in run.childNodes if c.nodeName == "w:rPr"), "")
+        before, _, after = text.partition(find)
+
+        def text_run(value):
+            return f"<w:r{attrs}>{rPr}<w:t>{html.escape(value, quote=False)}</w:t></w:r>"
+
+        parts = [text_run(before)] if before else []
+        parts.append(
+            f'<w:del><w:r>{rPr}<w:delText xml:space="preserve">'
+            f"{html.escape(find, quote=False)}</w:delText></w:r></w:del>"
+        )
+        if replacement:
+            parts.append(
+                f"<w:ins><w:r>{rPr}<w:t>{html.escape(replacement, quote=False)}"
+                f"</w:t></w:r></w:ins>"
+            )
+        if after:
+            parts.append(text_run(after))
+        return "".join(parts)
 
     # ==================== Private: Initialization ====================
 
@@ -968,6 +1462,9 @@ class Document:
         root = editor.dom.documentElement
         override_xml = '<Override PartName="/word/people.xml" ContentType="application/vnd.openxmlformats-officedocument.wordprocessingml.people+xml"/>'
         editor.append_to(root, override_xml)
+        self._get_attribute_values(editor, "Override", "PartName").add(
+            "/word/people.xml"
+        )
 
     def _add_relationship_for_people(self, path):
         """Add people.xml relationship to document.xml.rels if not already present."""
@@ -984,6 +1481,7 @@ class Document:
         # Create the relationship entry
         rel_xml = f'<{prefix}Relationship Id="{next_rid}" Type="http://schemas.microsoft.com/office/2011/relationships/people" Target="people.xml"/>'
         editor.append_to(root, rel_xml)
+        self._get_attribute_values(editor, "Relationship", "Target").add("people.xml")
 
     def _update_settings(self, path, track_revisions=False):
         """Add RSID and optionally enable track revisions in settings.xml.
@@ -1069,11 +1567,7 @@ class Document:
         self, comment_id, para_id, text, author, initials, timestamp
     ):
         """Add a single comment to comments.xml."""
-        if not self.comments_path.exists():
-            shutil.copy(TEMPLATE_DIR / "comments.xml", self.comments_path)
-
-        editor = self["word/comments.xml"]
-        root = editor.get_node(tag="w:comments")
+        editor, root = self._get_comment_part("word/comments.xml", "w:comments")
 
         escaped_text = (
             text.replace("&", "&amp;").replace("<", "&lt;").replace(">", "&gt;")
@@ -1090,13 +1584,9 @@ class Document:
 
     def _add_to_comments_extended_xml(self, para_id, parent_para_id):
         """Add a single comment to commentsExtended.xml."""
-        if not self.comments_extended_path.exists():
-            shutil.copy(
-                TEMPLATE_DIR / "commentsExtended.xml", self.comments_extended_path
-            )
-
-        editor = self["word/commentsExtended.xml"]
-        root = editor.get_node(tag="w15:commentsEx")
+        editor, root = self._get_comment_part(
+            "word/commentsExtended.xml", "w15:commentsEx"
+        )
 
         if parent_para_id:
             xml = f'<w15:commentEx w15:paraId="{para_id}" w15:paraIdParent="{parent_para_id}" w15:done="0"/>'
@@ -1106,28 +1596,137 @@ class Document:
 
     def _add_to_comments_ids_xml(self, para_id, durable_id):
         """Add a single comment to commentsIds.xml."""
-        if not self.comments_ids_path.exists():
-            shutil.copy(TEMPLATE_DIR / "commentsIds.xml", self.comments_ids_path)
-
-        editor = self["word/commentsIds.xml"]
-        root = editor.get_node(tag="w16cid:commentsIds")
+        editor, root = self._get_comment_part(
+            "word/commentsIds.xml", "w16cid:commentsIds"
+        )
 
         xml = f'<w16cid:commentId w16cid:paraId="{para_id}" w16cid:durableId="{durable_id}"/>'
         editor.append_to(root, xml)
 
     def _add_to_comments_extensible_xml(self, durable_id):
         """Add a single comment to commentsExtensible.xml."""
-        if not self.comments_extensible_path.exists():
-            shutil.copy(
-                TEMPLATE_DIR / "commentsExtensible.xml", self.comments_extensible_path
-            )
-
-        editor = self["word/commentsExtensible.xml"]
-        root = editor.get_node(tag="w16cex:commentsExtensible")
+        editor, root = self._get_comment_part(
+            "word/commentsExtensible.xml", "w16cex:commentsExtensible"
+        )
 
         xml = f'<w16cex:commentExtensible w16cex:durableId="{durable_id}"/>'
         editor.append_to(root, xml)
 
+    def _get_comment_part(self, xml_path, root_tag):
+        """Get the editor and root element of a comment part, creating it from the
+        template if missing.
+
+        Looks at the document element instead of searching the part, so adding a
+        comment does not get slower as the part grows.
+        """
+        file_path = self.unpacked_path / xml_path
+        if not file_path.exists():
+            shutil.copy(TEMPLATE_DIR / file_path.name, file_path)
+
+        editor = self[xml_path]
+        root = editor.dom.documentElement
+        if root is None or root.tagName != root_tag:
+            root = editor.get_node(tag=root_tag)
+        return editor, root
+
+    # ==================== Private: Indexes ====================
+
+    def _get_attribute_values(self, editor, tag, attr):
+        """Get the set of attr values on tag elements of an editor's part.
+
+        The set is built by one scan and must be updated by callers that add
+        matching elements.
+        """
+        key = (editor.xml_path, tag, attr)
+        if key not in self._attribute_values:
+            self._attribute_values[key] = {
+                elem.getAttribute(attr) for elem in editor.dom.getElementsByTagName(tag)
+            }
+        return self._attribute_values[key]
+
+    def _new_unique_id(self, kind):
+        """Generate a paraId ("para") or durableId ("durable") not used yet.
+
+        IDs already in document.xml and the comment parts are collected on first
+        use; generated IDs are added so later calls never repeat them.
+        """
+        if kind not in self._used_ids:
+            if kind == "para":
+                sources = [
+                    ("word/document.xml", "w:p", "w14:paraId"),
+                    ("word/comments.xml", "w:p", "w14:paraId"),
+                    ("word/commentsExtended.xml", "w15:commentEx", "w15:paraId"),
+                    ("word/commentsIds.xml", "w16cid:commentId", "w16cid:paraId"),
+                ]
+            else:
+                sources = [
+                    ("word/commentsIds.xml", "w16cid:commentId", "w16cid:durableId"),
+                    (
+                        "word/commentsExtensible.xml",
+                        "w16cex:commentExtensible",
+                        "w16cex:durableId",
+                    ),
+                ]
+            used = set()
+            for xml_path, tag, attr in sources:
+                if (self.unpacked_path / xml_path).exists():
+                    used |= self._get_attribute_values(self[xml_path], tag, attr)
+            self._used_ids[kind] = used
+
+        used = self._used_ids[kind]
+        new_id = _generate_hex_id()
+        while new_id in used:
+            new_id = _generate_hex_id()
+        used.add(new_id)
+        return new_id
+
+    def _index_comment_anchors(self, nodes):
+        """Add comment range starts and references in nodes (or below them) to the
+        anchor index, if it has been built."""
+        if self._comment_anchors is None:
+            return
+        for node in nodes:
+            if node.nodeType != node.ELEMENT_NODE:
+                continue
+            for tag in ("w:commentRangeStart", "w:commentReference"):
+                elems = node.getElementsByTagName(tag)
+                if node.tagName == tag:
+                    elems = [node]
+                for elem in elems:
+                    key = (tag, elem.getAttribute("w:id"))
+                    self._comment_anchors.setdefault(key, []).append(elem)
+
+    def _get_comment_anchor(self, tag, comment_id):
+        """Find the comment range start or reference of a comment in document.xml.
+
+        Uses an index of the anchors, rebuilt when the anchor is missing from it or
+        an indexed element was edited or removed. Falls back to get_node (and its
+        errors) when there is not exactly one match.
+        """
+        key = (tag, str(comment_id))
+        elems = self._comment_anchors.get(key) if self._comment_anchors else None
+        if not elems or not all(self._is_comment_anchor(e, *key) for e in elems):
+            self._comment_anchors = {}
+            for anchor_tag in ("w:commentRangeStart", "w:commentReference"):
+                self._index_comment_anchors(
+                    self._document.dom.getElementsByTagName(anchor_tag)
+                )
+            elems = self._comment_anchors.get(key)
+        if elems and len(elems) == 1:
+            return elems[0]
+        return self._document.get_node(tag=tag, attrs={"w:id": key[1]})
+
+    def _is_comment_anchor(self, elem, tag, comment_id):
+        """Check that an indexed anchor is still in document.xml with the same ID."""
+        if elem.tagName != tag or elem.getAttribute("w:id") != comment_id:
+            return False
+        parent = elem.parentNode
+        while parent is not None:
+            if parent.nodeType == parent.DOCUMENT_NODE:
+                return parent is self._document.dom
+            parent = parent.parentNode
+        return False
+
     # ==================== Private: XML Fragments ====================
 
     def _comment_range_start_xml(self, comment_id):
@@ -1159,24 +1758,15 @@ class Document:
 
     def _has_relationship(self, editor, target):
         """Check if a relationship with given target exists."""
-        for rel_elem in editor.dom.getElementsByTagName("Relationship"):
-            if rel_elem.getAttribute("Target") == target:
-                return True
-        return False
+        return target in self._get_attribute_values(editor, "Relationship", "Target")
 
     def _has_override(self, editor, part_name):
         """Check if an override with given part name exists."""
-        for override_elem in editor.dom.getElementsByTagName("Override"):
-            if override_elem.getAttribute("PartName") == part_name:
-                return True
-        return False
+        return part_name in self._get_attribute_values(editor, "Override", "PartName")
 
     def _has_author(self, editor, author):
         """Check if an author already exists in people.xml."""
-        for person_elem in editor.dom.getElementsByTagName("w15:person"):
-            if person_elem.getAttribute("w15:author") == author:
-                return True
-        return False
+        return author in self._get_attribute_values(editor, "w15:person", "w15:author")
 
     def _add_author_to_people(self, author):
         """Add author to people.xml (called during initialization)."""
@@ -1199,6 +1789,7 @@ class Document:
   <w15:presenceInfo w15:providerId="None" w15:userId="{escaped_author}"/>
 </w15:person>'''
         editor.append_to(root, person_xml)
+        self._get_attribute_values(editor, "w15:person", "w15:author").add(author)
 
     def _ensure_comment_relationships(self):
         """Ensure word/_rels/document.xml.rels has comment relationships."""
@@ -1239,6 +1830,7 @@ class Document:
         for rel_id, rel_type, target in rels:
             rel_xml = f'<{prefix}Relationship Id="rId{rel_id}" Type="{rel_type}" Target="{target}"/>'
             editor.append_to(root, rel_xml)
+            self._get_attribute_values(editor, "Relationship", "Target").add(target)
 
     def _ensure_comment_content_types(self):
         """Ensure [Content_Types].xml has comment content types."""
@@ -1274,3 +1866,4 @@ class Document:
                 f'<Override PartName="{part_name}" ContentType="{content_type}"/>'
             )
             editor.append_to(root, override_xml)
+            self._get_attribute_values(editor, "Override", "PartName").add(part_name)
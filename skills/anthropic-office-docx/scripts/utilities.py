@@ -28,14 +28,24 @@ Example usage:
 
     # Save changes
     editor.save()
+
+LxmlXMLEditor offers the same API backed by lxml, with indexed lookups for very
+large files. It returns lxml elements instead of minidom nodes.
 """
 
+import bisect
 import html
+import os
+import re
 from pathlib import Path
 from typing import Optional, Union
 
 import defusedxml.minidom
 import defusedxml.sax
+import lxml.etree
+
+# Anything that looks like "prefix:name"; may over-match text, never misses a prefix
+_PREFIX_PATTERN = re.compile(r"([A-Za-z_][\w.-]*):[A-Za-z_]")
 
 
 class XMLEditor:
@@ -68,7 +78,7 @@ class XMLEditor:
 
         with open(self.xml_path, "rb") as f:
             header = f.read(200).decode("utf-8", errors="ignore")
-        self.encoding = "ascii" if 'encoding="ascii"' in header else "utf-8"
+        self.encoding = "ascii" if re.search(r"encoding=[\"']ascii[\"']", header) else "utf-8"
 
         parser = _create_line_tracking_parser()
         self.dom = defusedxml.minidom.parse(str(self.xml_path), parser)
@@ -109,6 +119,10 @@ class XMLEditor:
             elem = editor.get_node(tag="w:t", contains="&#8220;Agreement")  # Entity notation
             elem = editor.get_node(tag="w:t", contains="\u201cAgreement")   # Unicode character
         """
+        # Normalize the search string: convert HTML entities to Unicode characters
+        # This allows searching for both "&#8220;Rowan" and ""Rowan"
+        normalized_contains = html.unescape(contains) if contains is not None else None
+
         matches = []
         for elem in self.dom.getElementsByTagName(tag):
             # Check line_number filter
@@ -135,9 +149,6 @@ class XMLEditor:
             # Check contains filter
             if contains is not None:
                 elem_text = self._get_element_text(elem)
-                # Normalize the search string: convert HTML entities to Unicode characters
-                # This allows searching for both "&#8220;Rowan" and ""Rowan"
-                normalized_contains = html.unescape(contains)
                 if normalized_contains not in elem_text:
                     continue
 
@@ -307,7 +318,7 @@ class XMLEditor:
         preserving the original encoding (ascii or utf-8).
         """
         content = self.dom.toxml(encoding=self.encoding)
-        self.xml_path.write_bytes(content)
+        _replace_file(self.xml_path, content)
 
     def _parse_fragment(self, xml_content):
         """
@@ -322,14 +333,20 @@ class XMLEditor:
         Raises:
             AssertionError: If fragment contains no element nodes
         """
-        # Extract namespace declarations from the root document element
+        # Extract namespace declarations from the root document element, keeping
+        # only prefixes that can occur in the fragment (parsing a wrapper with every
+        # declaration of a large document dominates the cost of small edits)
         root_elem = self.dom.documentElement
+        used_prefixes = set(_PREFIX_PATTERN.findall(xml_content))
         namespaces = []
         if root_elem and root_elem.attributes:
             for i in range(root_elem.attributes.length):
                 attr = root_elem.attributes.item(i)
-                if attr.name.startswith("xmlns"):  # type: ignore
-                    namespaces.append(f'{attr.name}="{attr.value}"')  # type: ignore
+                name = attr.name  # type: ignore
+                if name == "xmlns" or (
+                    name.startswith("xmlns:") and name[6:] in used_prefixes
+                ):
+                    namespaces.append(f'{name}="{attr.value}"')  # type: ignore
 
         ns_decl = " ".join(namespaces)
         wrapper = f"<root {ns_decl}>{xml_content}</root>"
@@ -343,6 +360,528 @@ class XMLEditor:
         return nodes
 
 
+class LxmlXMLEditor:
+    """
+    lxml-backed editor with the same node-finding and editing API as XMLEditor.
+
+    Intended for very large files (e.g. a 20 MB word/document.xml) that need many
+    get_node() calls. The first lookup of a tag indexes its elements, their original
+    line numbers and (per attribute name used in attrs=) their attribute values.
+    The first contains= lookup of a tag projects the text of its elements into one
+    searchable buffer. replace_node(), insert_after(), insert_before() and
+    append_to() keep the indexes in sync, so later lookups stay fast across edits.
+
+    Returned nodes are lxml.etree elements rather than minidom nodes. Attributes or
+    text changed directly on returned elements are only seen by get_node(attrs=...)
+    and get_node(contains=...) after reindex() is called.
+
+    Attributes:
+        xml_path: Path to the XML file being edited
+        encoding: Detected encoding of the XML file ('ascii' or 'utf-8')
+        tree: Parsed lxml.etree._ElementTree
+    """
+
+    XML_NAMESPACE = "http://www.w3.org/XML/1998/namespace"
+
+    def __init__(self, xml_path):
+        """
+        Initialize with path to XML file, parse it and build the node indexes.
+
+        Args:
+            xml_path: Path to XML file to edit (str or Path)
+
+        Raises:
+            ValueError: If the XML file does not exist
+        """
+        self.xml_path = Path(xml_path)
+        if not self.xml_path.exists():
+            raise ValueError(f"XML file not found: {xml_path}")
+
+        with open(self.xml_path, "rb") as f:
+            header = f.read(200).decode("utf-8", errors="ignore")
+        self.encoding = "ascii" if re.search(r"encoding=[\"']ascii[\"']", header) else "utf-8"
+        # lxml reports a missing standalone declaration as "no", so read it here
+        standalone = re.search(r"^\s*<\?xml[^>]*standalone=[\"'](yes|no)[\"']", header)
+        self._standalone = standalone.group(1) if standalone else None
+
+        self._parser = lxml.etree.XMLParser(
+            resolve_entities=False, no_network=True, huge_tree=True
+        )
+        self.tree = lxml.etree.parse(str(self.xml_path), self._parser)
+
+        # Prefix -> namespace URI, for resolving prefixed tag and attribute names
+        # (None is the default namespace, which applies to unprefixed tags only)
+        self._namespaces = dict(self.tree.getroot().nsmap)
+        self._namespaces["xml"] = self.XML_NAMESPACE
+
+        # Indexes are keyed by lxml tag name ("{uri}p") and built per tag on first use.
+        # Live elements of a tag, as insertion-ordered sets
+        # Format: {tag: {element: None, ...}}
+        self._tag_index = {}
+
+        # Elements of a tag from the original file, sorted by line
+        # Format: {tag: ([line, ...], [element, ...])}
+        self._line_index = {}
+
+        # Elements of a tag by attribute value (may hold removed elements, which
+        # are filtered out against the tag index)
+        # Format: {(tag, attribute): {value: {element: None, ...}}}
+        self._attr_index = {}
+
+        # Text projections of a tag's elements, for contains= lookups
+        # Format: {tag: _TextIndex}
+        self._text_index = {}
+
+    def get_node(
+        self,
+        tag: str,
+        attrs: Optional[dict[str, str]] = None,
+        line_number: Optional[Union[int, range]] = None,
+        contains: Optional[str] = None,
+    ):
+        """
+        Get an element by tag and identifier.
+
+        Same filters and errors as XMLEditor.get_node(), answered from the
+        indexes instead of scanning the document.
+
+        Args:
+            tag: The XML tag name (e.g., "w:del", "w:ins", "w:r")
+            attrs: Dictionary of attribute name-value pairs to match (e.g., {"w:id": "1"})
+            line_number: Line number (int) or line range (range) in original XML file (1-indexed)
+            contains: Text string that must appear in any text node within the element.
+                      Supports both entity notation (&#8220;) and Unicode characters (“).
+
+        Returns:
+            lxml.etree._Element: The matching element
+
+        Raises:
+            ValueError: If node not found or multiple matches found
+        """
+        tag_name = self._clark_name(tag, is_tag=True)
+        live = self._get_tag_index(tag_name)
+
+        normalized_contains = html.unescape(contains) if contains is not None else None
+        text_matches = None
+
+        # Start from the smallest candidate set the indexes can give
+        indexed_attrs = [(name, value) for name, value in (attrs or {}).items() if value]
+        if line_number is not None:
+            candidates = [
+                elem
+                for elem in self._find_by_line(tag_name, line_number)
+                if elem in live
+            ]
+        elif indexed_attrs:
+            name, value = indexed_attrs[0]
+            by_value = self._get_attr_index(tag_name, name).get(value, {})
+            candidates = [elem for elem in by_value if elem in live]
+        elif normalized_contains:
+            text_matches = self._get_text_index(tag_name).find(normalized_contains)
+            candidates = [elem for elem in text_matches if elem in live]
+        else:
+            candidates = list(live)
+
+        matches = []
+        for elem in candidates:
+            # Check attrs filter (a missing attribute matches "", as in minidom)
+            if attrs is not None:
+                if not all(
+                    elem.get(self._clark_name(attr_name), "") == attr_value
+                    for attr_name, attr_value in attrs.items()
+                ):
+                    continue
+
+            # Check contains filter (already done by the text index when it was used)
+            if contains is not None and text_matches is None:
+                if normalized_contains not in self._get_element_text(elem):
+                    continue
+
+            matches.append(elem)
+
+        if not matches:
+            # Build descriptive error message
+            filters = []
+            if line_number is not None:
+                line_str = (
+                    f"lines {line_number.start}-{line_number.stop - 1}"
+                    if isinstance(line_number, range)
+                    else f"line {line_number}"
+                )
+                filters.append(f"at {line_str}")
+            if attrs is not None:
+                filters.append(f"with attributes {attrs}")
+            if contains is not None:
+                filters.append(f"containing '{contains}'")
+
+            filter_desc = " ".join(filters) if filters else ""
+            base_msg = f"Node not found: <{tag}> {filter_desc}".strip()
+
+            # Add helpful hint based on filters used
+            if contains:
+                hint = "Text may be split across elements or use different wording."
+            elif line_number:
+                hint = "Line numbers may have changed if document was modified."
+            elif attrs:
+                hint = "Verify attribute values are correct."
+            else:
+                hint = "Try adding filters (attrs, line_number, or contains)."
+
+            raise ValueError(f"{base_msg}. {hint}")
+        if len(matches) > 1:
+            raise ValueError(
+                f"Multiple nodes found: <{tag}>. "
+                f"Add more filters (attrs, line_number, or contains) to narrow the search."
+            )
+        return matches[0]
+
+    def _get_element_text(self, elem):
+        """
+        Extract all text content from an element, skipping whitespace-only text.
+
+        Args:
+            elem: lxml.etree._Element to extract text from
+
+        Returns:
+            str: Concatenated text from all non-whitespace text nodes within the element
+        """
+        return "".join(text for text in elem.itertext() if text.strip())
+
+    def replace_node(self, elem, new_content):
+        """
+        Replace an element with new XML content.
+
+        Args:
+            elem: lxml.etree._Element to replace
+            new_content: String containing XML to replace the node with
+
+        Returns:
+            List[lxml.etree._Element]: All inserted nodes
+        """
+        nodes = self.insert_before(elem, new_content)
+        self._move_tail(elem, nodes[-1])
+        self._unindex(elem)
+        elem.getparent().remove(elem)
+        return nodes
+
+    def insert_after(self, elem, xml_content):
+        """
+        Insert XML content after an element.
+
+        Args:
+            elem: lxml.etree._Element to insert after
+            xml_content: String containing XML to insert
+
+        Returns:
+            List[lxml.etree._Element]: All inserted nodes
+        """
+        fragment = self._parse_fragment(xml_content)
+        self._mark_text_changed(elem.getparent())
+        tail, elem.tail = elem.tail, fragment.text
+        nodes = list(fragment)
+        previous = elem
+        for node in nodes:
+            previous.addnext(node)
+            self._index(node)
+            previous = node
+        if tail:
+            previous.tail = (previous.tail or "") + tail
+        return nodes
+
+    def insert_before(self, elem, xml_content):
+        """
+        Insert XML content before an element.
+
+        Args:
+            elem: lxml.etree._Element to insert before
+            xml_content: String containing XML to insert
+
+        Returns:
+            List[lxml.etree._Element]: All inserted nodes
+        """
+        fragment = self._parse_fragment(xml_content)
+        self._mark_text_changed(elem.getparent())
+        if fragment.text:
+            previous = elem.getprevious()
+            if previous is not None:
+                previous.tail = (previous.tail or "") + fragment.text
+            else:
+                parent = elem.getparent()
+                parent.text = (parent.text or "") + fragment.text
+        nodes = list(fragment)
+        for node in nodes:
+            elem.addprevious(node)
+            self._index(node)
+        return nodes
+
+    def append_to(self, elem, xml_content):
+        """
+        Append XML content as a child of an element.
+
+        Args:
+            elem: lxml.etree._Element to append to
+            xml_content: String containing XML to append
+
+        Returns:
+            List[lxml.etree._Element]: All inserted nodes
+        """
+        fragment = self._parse_fragment(xml_content)
+        self._mark_text_changed(elem)
+        if fragment.text:
+            if len(elem):
+                elem[-1].tail = (elem[-1].tail or "") + fragment.text
+            else:
+                elem.text = (elem.text or "") + fragment.text
+        nodes = list(fragment)
+        for node in nodes:
+            elem.append(node)
+            self._index(node)
+        return nodes
+
+    def get_next_rid(self):
+        """Get the next available rId for relationships files."""
+        max_id = 0
+        relationship_tag = self._clark_name("Relationship", is_tag=True)
+        for rel_elem in self._get_tag_index(relationship_tag):
+            rel_id = rel_elem.get("Id", "")
+            if rel_id.startswith("rId"):
+                try:
+                    max_id = max(max_id, int(rel_id[3:]))
+                except ValueError:
+                    pass
+        return f"rId{max_id + 1}"
+
+    def reindex(self):
+        """
+        Rebuild attribute and text indexes on next use.
+
+        Call after changing attributes or text directly on elements returned by this
+        editor. Tag and line indexes are unaffected by such changes.
+        """
+        self._attr_index = {}
+        self._text_index = {}
+
+    def save(self):
+        """
+        Save the edited XML back to the file.
+
+        Serializes the tree and writes it back to the original file path,
+        preserving the original encoding (ascii or utf-8).
+        """
+        # Write the declaration like minidom does: double quotes, the original
+        # encoding name, and standalone only if the source declared it
+        declaration = f'<?xml version="1.0" encoding="{self.tree.docinfo.encoding}"'
+        if self._standalone:
+            declaration += f' standalone="{self._standalone}"'
+        declaration += "?>\n"
+        content = declaration.encode(self.encoding) + lxml.etree.tostring(
+            self.tree, encoding=self.encoding, xml_declaration=False
+        )
+        _replace_file(self.xml_path, content)
+
+    def _clark_name(self, name, is_tag=False):
+        """Convert a prefixed name (e.g., "w:id") to lxml's {uri}id form.
+
+        Unprefixed tags are in the default namespace; unprefixed attributes are not.
+        """
+        prefix, _, local_name = name.rpartition(":")
+        uri = self._namespaces.get(prefix or None) if prefix or is_tag else None
+        return f"{{{uri}}}{local_name}" if uri else name
+
+    def _get_tag_index(self, tag):
+        """Get the live elements of a tag, indexing the tag on first use."""
+        if tag not in self._tag_index:
+            elements = list(self.tree.getroot().iter(tag))
+            self._tag_index[tag] = dict.fromkeys(elements)
+            # Inserted elements have no original line (sourceline is None)
+            original = sorted(
+                (elem for elem in elements if elem.sourceline),
+                key=lambda elem: elem.sourceline,
+            )
+            self._line_index[tag] = ([elem.sourceline for elem in original], original)
+        return self._tag_index[tag]
+
+    def _get_attr_index(self, tag, name):
+        """Get the value -> elements index of a tag's attribute, building it on first use."""
+        key = (tag, self._clark_name(name))
+        if key not in self._attr_index:
+            by_value = {}
+            for elem in self._get_tag_index(tag):
+                value = elem.get(key[1])
+                if value is not None:
+                    by_value.setdefault(value, {})[elem] = None
+            self._attr_index[key] = by_value
+        return self._attr_index[key]
+
+    def _get_text_index(self, tag):
+        """Get the text projection of a tag's elements, (re)building it when needed."""
+        text_index = self._text_index.get(tag)
+        if text_index is None or text_index.needs_rebuild():
+            text_index = _TextIndex(self._get_tag_index(tag), self._get_element_text)
+            self._text_index[tag] = text_index
+        return text_index
+
+    def _mark_text_changed(self, elem):
+        """Mark an element and its ancestors as having changed text."""
+        while elem is not None:
+            if elem.tag in self._text_index:
+                self._text_index[elem.tag].mark_stale(elem)
+            elem = elem.getparent()
+
+    def _find_by_line(self, tag, line_number):
+        """Get original elements of a tag that start on a line or in a line range."""
+        self._get_tag_index(tag)
+        lines, elements = self._line_index[tag]
+        if isinstance(line_number, range):
+            if line_number.step != 1:
+                return [e for l, e in zip(lines, elements) if l in line_number]
+            start, stop = line_number.start, line_number.stop
+        else:
+            start, stop = line_number, line_number + 1
+        return elements[bisect.bisect_left(lines, start) : bisect.bisect_left(lines, stop)]
+
+    def _index(self, node):
+        """Add an inserted node and its descendants to the indexes of built tags."""
+        for elem in node.iter(lxml.etree.Element):
+            if elem.tag in self._tag_index:
+                self._tag_index[elem.tag][elem] = None
+            if elem.tag in self._text_index:
+                self._text_index[elem.tag].mark_stale(elem)
+            for (tag, name), by_value in self._attr_index.items():
+                value = elem.get(name) if tag == elem.tag else None
+                if value is not None:
+                    by_value.setdefault(value, {})[elem] = None
+
+    def _unindex(self, node):
+        """Remove a node and its descendants from the tag indexes."""
+        for elem in node.iter(lxml.etree.Element):
+            self._tag_index.get(elem.tag, {}).pop(elem, None)
+
+    def _move_tail(self, source, target):
+        """Move the text following source to follow target instead."""
+        if source.tail:
+            target.tail = (target.tail or "") + source.tail
+        source.tail = None
+
+    def _parse_fragment(self, xml_content):
+        """
+        Parse XML fragment into a wrapper element declaring the document's namespaces.
+
+        Args:
+            xml_content: String containing XML fragment
+
+        Returns:
+            lxml.etree._Element: Wrapper whose children are the fragment's nodes and
+                whose text is any text before the first of them
+
+        Raises:
+            AssertionError: If fragment contains no element nodes
+        """
+        ns_decl = " ".join(
+            f'xmlns:{prefix}="{uri}"' if prefix else f'xmlns="{uri}"'
+            for prefix, uri in self.tree.getroot().nsmap.items()
+        )
+        wrapper = lxml.etree.fromstring(
+            f"<root {ns_decl}>{xml_content}</root>", self._parser
+        )
+        # Inserted elements have no line in the original file
+        for elem in wrapper.iter():
+            elem.sourceline = 0
+        assert any(
+            isinstance(child.tag, str) for child in wrapper
+        ), "Fragment must contain at least one element"
+        return wrapper
+
+
+class _TextIndex:
+    """
+    Text of all elements of one tag, concatenated into a single searchable buffer.
+
+    Each element's text occupies a span of the buffer, so a contains= lookup is a
+    substring search over the buffer instead of a walk over every element. Elements
+    whose text changed (or that were inserted) since the buffer was built are marked
+    stale and checked directly, until there are enough of them to rebuild instead.
+    """
+
+    # Separator between element spans (cannot occur in XML text)
+    SEPARATOR = "\0"
+
+    def __init__(self, elements, get_text):
+        """
+        Build the buffer from the text of each element.
+
+        Args:
+            elements: Elements to index, in document order
+            get_text: Function returning the text of an element
+        """
+        self.get_text = get_text
+        self.elements = list(elements)
+        self.starts = []
+        parts = []
+        offset = 0
+        for elem in self.elements:
+            text = get_text(elem)
+            self.starts.append(offset)
+            parts.append(text)
+            offset += len(text) + 1
+        self.buffer = self.SEPARATOR.join(parts)
+
+        # Elements whose buffer span no longer reflects their text
+        # Format: {element: None, ...}
+        self.stale = {}
+
+    def mark_stale(self, elem):
+        """Mark an element whose text changed or that was inserted after the build."""
+        self.stale[elem] = None
+
+    def needs_rebuild(self):
+        """Check whether enough elements are stale that rebuilding is cheaper."""
+        return len(self.stale) > max(64, len(self.elements) // 8)
+
+    def find(self, text):
+        """
+        Find the elements whose text contains a (non-empty) string.
+
+        Args:
+            text: String to search for
+
+        Returns:
+            dict: Matching elements as an insertion-ordered set; may include elements
+                no longer in the document
+        """
+        matches = {}
+        position = self.buffer.find(text)
+        while position != -1:
+            i = bisect.bisect_right(self.starts, position) - 1
+            elem = self.elements[i]
+            if elem not in self.stale:
+                matches[elem] = None
+            if i + 1 == len(self.starts):
+                break
+            position = self.buffer.find(text, self.starts[i + 1])
+        for elem in self.stale:
+            if text in self.get_text(elem):
+                matches[elem] = None
+        return matches
+
+
+def _replace_file(path, content):
+    """
+    Write content to a new file and move it over path.
+
+    Replacing the file instead of rewriting it in place leaves any other links to
+    the old file untouched (Document's workspace hard-links unmodified parts to the
+    original unpacked directory).
+
+    Args:
+        path: Path of the file to replace
+        content: Bytes to write
+    """
+    temp_path = path.with_name(f".{path.name}.tmp")
+    temp_path.write_bytes(content)
+    os.replace(temp_path, path)
+
+
 def _create_line_tracking_parser():
     """
     Create a SAX parser that tracks line and column numbers for each element.
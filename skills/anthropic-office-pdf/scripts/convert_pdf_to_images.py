@@ -1,29 +1,83 @@
 import os
+import re
 import sys
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
 
-from pdf2image import convert_from_path
+from PIL import Image
+from pdf2image import convert_from_path, pdfinfo_from_path
 
 
 # Converts each page of a PDF to a PNG image.
+# Pages are rasterized in parallel, in page ranges, directly at their final size
+# and written straight to disk, so memory use doesn't grow with the page count.
 
+DPI = 200
 
-def convert(pdf_path, output_dir, max_dim=1000):
-    images = convert_from_path(pdf_path, dpi=200)
 
-    for i, image in enumerate(images):
-        # Scale image if needed to keep width/height under `max_dim`
-        width, height = image.size
-        if width > max_dim or height > max_dim:
-            scale_factor = min(max_dim / width, max_dim / height)
-            new_width = int(width * scale_factor)
-            new_height = int(height * scale_factor)
-            image = image.resize((new_width, new_height))
-        
-        image_path = os.path.join(output_dir, f"page_{i+1}.png")
-        image.save(image_path)
-        print(f"Saved page {i+1} as {image_path} (size: {image.size})")
+def convert(pdf_path, output_dir, max_dim=1000, workers=None):
+    page_sizes = get_page_sizes(pdf_path)
+    page_count = len(page_sizes)
+    workers = min(workers or os.cpu_count() or 1, page_count) or 1
 
-    print(f"Converted {len(images)} pages to PNG images")
+    # Split pages into contiguous ranges that share a render size
+    ranges = []
+    chunk_size = max(1, -(-page_count // (workers * 4)))
+    for page in range(1, page_count + 1):
+        # Scale pages that would exceed `max_dim` at DPI down to fit it
+        width, height = page_sizes[page - 1]
+        size = max_dim if max(width, height) * DPI / 72 > max_dim else None
+        first, last, range_size = ranges[-1] if ranges else (None, None, None)
+        if ranges and range_size == size and last - first + 1 < chunk_size:
+            ranges[-1] = (first, page, size)
+        else:
+            ranges.append((page, page, size))
+
+    with tempfile.TemporaryDirectory(dir=output_dir) as temp_dir:
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            futures = [
+                executor.submit(render_pages, pdf_path, output_dir, temp_dir, *r)
+                for r in ranges
+            ]
+            for future in futures:
+                for page, image_path, size in future.result():
+                    print(f"Saved page {page} as {image_path} (size: {size})")
+
+    print(f"Converted {page_count} pages to PNG images")
+
+
+def get_page_sizes(pdf_path):
+    # pdfinfo reports "Page    N size: W x H pts" lines when given a page range
+    info = pdfinfo_from_path(pdf_path)
+    info = pdfinfo_from_path(pdf_path, first_page=1, last_page=info["Pages"])
+    sizes = []
+    for page in range(1, info["Pages"] + 1):
+        key = next(k for k in info if re.fullmatch(rf"Page\s+{page} size", k))
+        width, height = re.match(r"([\d.]+) x ([\d.]+)", info[key]).groups()
+        sizes.append((float(width), float(height)))
+    return sizes
+
+
+def render_pages(pdf_path, output_dir, temp_dir, first, last, size):
+    # Each range gets its own folder, since pdf2image collects outputs by prefix
+    paths = convert_from_path(
+        pdf_path,
+        dpi=DPI,
+        first_page=first,
+        last_page=last,
+        size=size,
+        fmt="png",
+        output_folder=tempfile.mkdtemp(dir=temp_dir),
+        output_file="page",
+        paths_only=True,
+    )
+    saved = []
+    for page, path in zip(range(first, last + 1), sorted(paths)):
+        image_path = os.path.join(output_dir, f"page_{page}.png")
+        os.replace(path, image_path)
+        with Image.open(image_path) as image:
+            saved.append((page, image_path, image.size))
+    return saved
 
 
 if __name__ == "__main__":
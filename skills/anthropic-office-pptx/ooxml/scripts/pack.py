@@ -3,29 +3,52 @@
 Tool to pack a directory into a .docx, .pptx, or .xlsx file with XML formatting undone.
 
 Example usage:
-    python pack.py <input_directory> <office_file> [--force]
+    python pack.py <input_directory> <office_file> [--force] [--source <original_file>]
 """
 
 import argparse
+import copy
+import io
+import os
 import shutil
+import struct
 import subprocess
 import sys
 import tempfile
-import defusedxml.minidom
+import xml.sax
+import xml.sax.handler
+import zlib
+import defusedxml.sax
+import lxml.etree
 import zipfile
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 
+try:
+    from . import office_service
+except ImportError:  # Run as a script from this directory
+    import office_service
+
 
 def main():
     parser = argparse.ArgumentParser(description="Pack a directory into an Office file")
     parser.add_argument("input_directory", help="Unpacked Office document directory")
     parser.add_argument("output_file", help="Output Office file (.docx/.pptx/.xlsx)")
     parser.add_argument("--force", action="store_true", help="Skip validation")
+    parser.add_argument(
+        "--source",
+        help="Office file the directory was unpacked from; parts that still match "
+        "it are copied from it as-is",
+    )
     args = parser.parse_args()
 
     try:
         success = pack_document(
-            args.input_directory, args.output_file, validate=not args.force
+            args.input_directory,
+            args.output_file,
+            validate=not args.force,
+            source_file=args.source,
+            workers=os.cpu_count(),
         )
 
         # Show warning if validation was skipped
@@ -42,13 +65,19 @@ def main():
         sys.exit(f"Error: {e}")
 
 
-def pack_document(input_dir, output_file, validate=False):
+def pack_document(
+    input_dir, output_file, validate=False, source_file=None, workers=None
+):
     """Pack a directory into an Office file (.docx/.pptx/.xlsx).
 
     Args:
         input_dir: Path to unpacked Office document directory
         output_file: Path to output Office file
         validate: If True, validates with soffice (default: False)
+        source_file: Optional Office file the directory was unpacked from. Parts
+            that still match it are copied from it without recompression, so
+            packing time grows with the edits rather than the document size.
+        workers: Number of processes for condensing XML parts (default: 1)
 
     Returns:
         bool: True if successful, False if validation failed
@@ -61,15 +90,26 @@ def pack_document(input_dir, output_file, validate=False):
     if output_file.suffix.lower() not in {".docx", ".pptx", ".xlsx"}:
         raise ValueError(f"{output_file} must be a .docx, .pptx, or .xlsx file")
 
+    if source_file is not None:
+        output_file.parent.mkdir(parents=True, exist_ok=True)
+        _repack_from_source(input_dir, output_file, Path(source_file))
+        if validate and not validate_document(output_file):
+            output_file.unlink()  # Delete the corrupt file
+            return False
+        return True
+
     # Work in temporary directory to avoid modifying original
     with tempfile.TemporaryDirectory() as temp_dir:
         temp_content_dir = Path(temp_dir) / "content"
         shutil.copytree(input_dir, temp_content_dir)
 
         # Process XML files to remove pretty-printing whitespace
-        for pattern in ["*.xml", "*.rels"]:
-            for xml_file in temp_content_dir.rglob(pattern):
-                condense_xml(xml_file)
+        format_xml_files(
+            list(temp_content_dir.rglob("*.xml"))
+            + list(temp_content_dir.rglob("*.rels")),
+            condense_xml,
+            workers=workers,
+        )
 
         # Create final Office file as zip archive
         output_file.parent.mkdir(parents=True, exist_ok=True)
@@ -87,6 +127,113 @@ def pack_document(input_dir, output_file, validate=False):
     return True
 
 
+def _repack_from_source(input_dir, output_file, source_file):
+    """Pack a directory into an Office file, reusing members of the file it came from.
+
+    Members of source_file whose part is unchanged in input_dir are copied as raw
+    compressed bytes. Only new or changed parts are condensed and compressed.
+    Members keep the order of source_file, followed by new parts.
+
+    Args:
+        input_dir: Path to unpacked Office document directory
+        output_file: Path to output Office file
+        source_file: Path to the Office file input_dir was unpacked from
+    """
+    parts = {
+        f.relative_to(input_dir).as_posix(): f
+        for f in sorted(input_dir.rglob("*"))
+        if f.is_file()
+    }
+
+    with zipfile.ZipFile(source_file, "r") as source, zipfile.ZipFile(
+        output_file, "w", zipfile.ZIP_DEFLATED
+    ) as zf:
+        source_members = {info.filename: info for info in source.infolist()}
+        names = [name for name in source_members if name in parts]
+        names += [name for name in parts if name not in source_members]
+
+        for name in names:
+            part = parts[name]
+            info = source_members.get(name)
+            if info is not None and _part_matches_member(part, source, info):
+                _copy_raw_member(source, info, zf)
+            elif part.name.endswith((".xml", ".rels")):
+                zf.writestr(name, _condensed_xml(part))
+            else:
+                zf.write(part, name)
+
+
+def _part_matches_member(part, source, info):
+    """Check whether an unpacked part still holds the content of a zip member.
+
+    Binary parts are compared by size and CRC. XML parts are compared by their
+    canonical form without formatting whitespace, since unpacking pretty-prints them.
+    """
+    if not part.name.endswith((".xml", ".rels")):
+        if part.stat().st_size != info.file_size:
+            return False
+        crc = 0
+        with open(part, "rb") as f:
+            while chunk := f.read(1 << 20):
+                crc = zlib.crc32(chunk, crc)
+        return crc == info.CRC
+
+    try:
+        return _canonical_xml(part.read_bytes()) == _canonical_xml(source.read(info))
+    except lxml.etree.XMLSyntaxError:
+        return False
+
+
+def _canonical_xml(content):
+    """Canonicalize XML content, ignoring formatting whitespace between elements."""
+    parser = lxml.etree.XMLParser(
+        remove_blank_text=True, resolve_entities=False, no_network=True, huge_tree=True
+    )
+    return lxml.etree.tostring(lxml.etree.fromstring(content, parser), method="c14n")
+
+
+def _copy_raw_member(source, info, zf):
+    """Copy a member's compressed bytes from one zip file into another.
+
+    zipfile has no public API for this, so the entry is written the same way
+    ZipFile.write does, minus the compression. If the zipfile internals this
+    relies on have changed, the member is decompressed and written again.
+    """
+    new_info = copy.copy(info)
+    new_info.extra = b""
+    # CRC and sizes are written in the local header, not in a data descriptor
+    new_info.flag_bits &= ~0x08
+
+    # ZipFile internals used below; checked against CPython 3.8 through 3.13
+    internals = ("_lock", "_writecheck", "_didModify", "start_dir", "fp")
+    try:
+        if not all(hasattr(zf, name) for name in internals):
+            raise AttributeError("ZipFile internals not found")
+        zf._writecheck(new_info)
+        header = new_info.FileHeader()
+    except (AttributeError, TypeError):
+        zf.writestr(new_info, source.read(info))
+        return
+
+    # Locate the member's data after its local file header
+    source.fp.seek(info.header_offset)
+    local_header = source.fp.read(zipfile.sizeFileHeader)
+    name_length, extra_length = struct.unpack("<HH", local_header[26:30])
+    source.fp.seek(
+        info.header_offset + zipfile.sizeFileHeader + name_length + extra_length
+    )
+    data = source.fp.read(info.compress_size)
+
+    with zf._lock:
+        zf._didModify = True
+        new_info.header_offset = zf.fp.tell()
+        zf.fp.write(header)
+        zf.fp.write(data)
+        zf.filelist.append(new_info)
+        zf.NameToInfo[new_info.filename] = new_info
+        zf.start_dir = zf.fp.tell()
+
+
 def validate_document(doc_path):
     """Validate document by converting to HTML with soffice."""
     # Determine the correct filter based on file extension
@@ -99,6 +246,14 @@ def validate_document(doc_path):
             filter_name = "html:HTML (StarCalc)"
 
     with tempfile.TemporaryDirectory() as temp_dir:
+        # Use warm LibreOffice instances if the office service is running
+        reply = office_service.convert(doc_path, temp_dir, filter_name, timeout=10)
+        if reply is not None:
+            if not reply["ok"]:
+                print(f"Validation error: {reply['error']}", file=sys.stderr)
+                return False
+            return True
+
         try:
             result = subprocess.run(
                 [
@@ -132,27 +287,250 @@ def validate_document(doc_path):
 
 def condense_xml(xml_file):
     """Strip unnecessary whitespace and remove comments."""
-    with open(xml_file, "r", encoding="utf-8") as f:
-        dom = defusedxml.minidom.parse(f)
-
-    # Process each element to remove whitespace and comments
-    for element in dom.getElementsByTagName("*"):
-        # Skip w:t elements and their processing
-        if element.tagName.endswith(":t"):
-            continue
-
-        # Remove whitespace-only text nodes and comment nodes
-        for child in list(element.childNodes):
-            if (
-                child.nodeType == child.TEXT_NODE
-                and child.nodeValue
-                and child.nodeValue.strip() == ""
-            ) or child.nodeType == child.COMMENT_NODE:
-                element.removeChild(child)
-
-    # Write back the condensed XML
-    with open(xml_file, "wb") as f:
-        f.write(dom.toxml(encoding="UTF-8"))
+    _rewrite_xml(xml_file, pretty=False)
+
+
+def pretty_print_xml(xml_file):
+    """Indent an XML file for editing, one node per line."""
+    _rewrite_xml(xml_file, pretty=True)
+
+
+def format_xml_files(xml_files, formatter=condense_xml, workers=None):
+    """Apply condense_xml or pretty_print_xml to XML files.
+
+    Parts are independent, so with workers > 1 they are spread across that many
+    processes. Library callers get the serial loop by default, since starting a
+    pool from inside another program isn't always safe.
+    """
+    xml_files = list(xml_files)
+    workers = min(workers or 1, len(xml_files))
+    if workers < 2:
+        for xml_file in xml_files:
+            formatter(xml_file)
+        return
+
+    chunksize = max(1, len(xml_files) // (4 * workers))
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        for _ in executor.map(formatter, xml_files, chunksize=chunksize):
+            pass
+
+
+def _condensed_xml(xml_file):
+    """Get the content of an XML file without formatting whitespace and comments."""
+    output = io.BytesIO()
+    _format_xml(xml_file, output, pretty=False)
+    return output.getvalue()
+
+
+def _rewrite_xml(xml_file, pretty):
+    """Format an XML file in place through a temporary file next to it."""
+    xml_file = Path(xml_file)
+    temp_file = xml_file.with_name(f".{xml_file.name}.tmp")
+    try:
+        with open(temp_file, "wb") as f:
+            _format_xml(xml_file, f, pretty)
+        os.replace(temp_file, xml_file)
+    finally:
+        temp_file.unlink(missing_ok=True)
+
+
+def _format_xml(source, output, pretty):
+    """Stream an XML document from source to the binary file object output.
+
+    The output is the same as minidom gives for toprettyxml(indent="  ",
+    encoding="ascii") when pretty is set, and for toxml(encoding="UTF-8") after
+    removing whitespace-only text and comments (except inside *:t elements)
+    otherwise. Only the text of the current node is held in memory.
+    """
+    writer = io.TextIOWrapper(
+        output,
+        encoding="ascii" if pretty else "UTF-8",
+        errors="xmlcharrefreplace",
+        newline="\n",
+        write_through=False,
+    )
+    formatter = _XMLFormatter(writer, pretty)
+    parser = defusedxml.sax.make_parser()
+    parser.setContentHandler(formatter)
+    parser.setProperty(xml.sax.handler.property_lexical_handler, formatter)
+    with open(source, "rb") as f:
+        parser.parse(f)
+    writer.flush()
+    writer.detach()
+
+
+def _escape_xml(data):
+    """Escape text and attribute values like minidom does."""
+    return (
+        data.replace("&", "&amp;")
+        .replace("<", "&lt;")
+        .replace('"', "&quot;")
+        .replace(">", "&gt;")
+    )
+
+
+class _XMLFormatter(xml.sax.handler.ContentHandler, xml.sax.handler.LexicalHandler):
+    """SAX handler that writes the nodes it receives the way minidom serializes them.
+
+    minidom writes an element holding a single text node inline and every other
+    element with one child per line, so each open element waits for its first
+    child (or its end) before its start tag is closed. Adjacent character data
+    is merged into one text node, as minidom's builder does.
+    """
+
+    # Child states of an open element
+    EMPTY, SINGLE, MULTI = range(3)
+
+    def __init__(self, writer, pretty):
+        super().__init__()
+        self.write = writer.write
+        self.pretty = pretty
+        self.newl = "\n" if pretty else ""
+        self.addindent = "  " if pretty else ""
+        # [tag, indent, state, held first text node]; the document is the bottom frame
+        self.stack = [[None, "", self.MULTI, None]]
+        # Prefixes in scope for each open element, checked as a namespace-aware parser would
+        self.prefixes = [{"xml"}]
+        self.text = []
+        self.text_kind = None
+        self.in_cdata = False
+        self.cdata_continue = False
+
+    def startDocument(self):
+        encoding = "ascii" if self.pretty else "UTF-8"
+        self.write(f'<?xml version="1.0" encoding="{encoding}"?>{self.newl}')
+
+    def startElement(self, name, attrs):
+        self._flush_text()
+        indent = self._open_child()
+        # minidom puts namespace declarations before the other attributes
+        declarations, other = [], []
+        for attr_name in attrs.getNames():
+            is_declaration = attr_name == "xmlns" or attr_name.startswith("xmlns:")
+            (declarations if is_declaration else other).append(attr_name)
+        self._check_prefixes(name, declarations, other)
+        names = declarations + other
+
+        parts = [indent, "<", name]
+        for attr_name in names:
+            parts += [" ", attr_name, '="', _escape_xml(attrs.getValue(attr_name)), '"']
+        self.write("".join(parts))
+        self.stack.append([name, indent, self.EMPTY, None])
+
+    def endElement(self, name):
+        self._flush_text()
+        self.prefixes.pop()
+        tag, indent, state, held = self.stack.pop()
+        if state == self.EMPTY:
+            self.write(f"/>{self.newl}")
+        elif state == self.SINGLE:
+            self.write(f">{self._inline(*held)}</{tag}>{self.newl}")
+        else:
+            self.write(f"{indent}</{tag}>{self.newl}")
+
+    def _check_prefixes(self, name, declarations, other):
+        """Reject prefixes that are not bound, like minidom's namespace-aware parser."""
+        prefixes = self.prefixes[-1]
+        if any(d.startswith("xmlns:") for d in declarations):
+            prefixes = prefixes | {d[6:] for d in declarations if d.startswith("xmlns:")}
+        self.prefixes.append(prefixes)
+        for qname in [name] + other:
+            prefix, sep, _ = qname.partition(":")
+            if sep and prefix not in prefixes:
+                raise xml.sax.SAXParseException(
+                    f"unbound prefix: {qname}", None, self._locator
+                )
+
+    def characters(self, content):
+        if not content:
+            return
+        kind = "cdata" if self.in_cdata else "text"
+        if self.text_kind != kind or (kind == "cdata" and not self.cdata_continue):
+            self._flush_text()
+            self.text_kind = kind
+        self.cdata_continue = self.in_cdata
+        self.text.append(content)
+
+    def ignorableWhitespace(self, whitespace):
+        self.characters(whitespace)
+
+    def processingInstruction(self, target, data):
+        self._flush_text()
+        indent = self._open_child()
+        self.write(f"{indent}<?{target} {data}?>{self.newl}")
+
+    def comment(self, content):
+        self._flush_text()
+        if not self.pretty and self._strips_children():
+            return
+        if "--" in content:
+            raise ValueError("'--' is not allowed in a comment node")
+        indent = self._open_child()
+        self.write(f"{indent}<!--{content}-->{self.newl}")
+
+    def startCDATA(self):
+        self.in_cdata = True
+        self.cdata_continue = False
+
+    def endCDATA(self):
+        self.in_cdata = False
+
+    def _strips_children(self):
+        """Check whether condensing drops blank text and comments of the open element."""
+        tag = self.stack[-1][0]
+        return tag is not None and not tag.endswith(":t")
+
+    def _flush_text(self):
+        """Emit the pending text node once it can no longer grow."""
+        if self.text_kind is None:
+            return
+        kind, data = self.text_kind, "".join(self.text)
+        self.text_kind, self.text = None, []
+        if (
+            kind == "text"
+            and not self.pretty
+            and self._strips_children()
+            and data.strip() == ""
+        ):
+            return
+
+        frame = self.stack[-1]
+        if frame[2] == self.EMPTY:
+            # May turn out to be the only child, which is written inline
+            frame[2], frame[3] = self.SINGLE, (kind, data)
+            return
+        indent = self._open_child()
+        if kind == "cdata":
+            self.write(self._inline(kind, data))
+        else:
+            self.write(_escape_xml(f"{indent}{data}{self.newl}"))
+
+    def _open_child(self):
+        """Close the start tag of the open element for a new child line.
+
+        Returns:
+            str: Indentation of the child
+        """
+        frame = self.stack[-1]
+        indent = frame[1] + self.addindent if frame[0] is not None else ""
+        if frame[2] != self.MULTI:
+            held = frame[3]
+            frame[2], frame[3] = self.MULTI, None
+            self.write(f">{self.newl}")
+            if held is not None:
+                kind, data = held
+                if kind == "cdata":
+                    self.write(self._inline(kind, data))
+                else:
+                    self.write(_escape_xml(f"{indent}{data}{self.newl}"))
+        return indent
+
+    def _inline(self, kind, data):
+        if kind == "cdata":
+            if "]]>" in data:
+                raise ValueError("']]>' not allowed in a CDATA section")
+            return f"<![CDATA[{data}]]>"
+        return _escape_xml(data)
 
 
 if __name__ == "__main__":
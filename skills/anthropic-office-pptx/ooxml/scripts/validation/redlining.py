@@ -2,19 +2,29 @@
 Validator for tracked changes in Word documents.
 """
 
-import subprocess
-import tempfile
-import zipfile
+import difflib
 from pathlib import Path
 
+from .package import OriginalPackage
+
 
 class RedliningValidator:
     """Validator for tracked changes in Word documents."""
 
-    def __init__(self, unpacked_dir, original_docx, verbose=False):
+    # Maximum number of differing paragraph blocks shown when texts don't match
+    MAX_DIFF_HUNKS = 50
+
+    def __init__(
+        self, unpacked_dir, original_docx, verbose=False, original_package=None
+    ):
         self.unpacked_dir = Path(unpacked_dir)
         self.original_docx = Path(original_docx)
         self.verbose = verbose
+
+        # Reader for the original package, shared with the other validators of
+        # the run when one is passed in
+        self.original_package = original_package or OriginalPackage(original_docx)
+
         self.namespaces = {
             "w": "http://schemas.openxmlformats.org/wordprocessingml/2006/main"
         }
@@ -60,59 +70,50 @@ class RedliningValidator:
             # If we can't parse the XML, continue with full validation
             pass
 
-        # Create temporary directory for unpacking original docx
-        with tempfile.TemporaryDirectory() as temp_dir:
-            temp_path = Path(temp_dir)
-
-            # Unpack original docx
-            try:
-                with zipfile.ZipFile(self.original_docx, "r") as zip_ref:
-                    zip_ref.extractall(temp_path)
-            except Exception as e:
-                print(f"FAILED - Error unpacking original docx: {e}")
-                return False
-
-            original_file = temp_path / "word" / "document.xml"
-            if not original_file.exists():
-                print(
-                    f"FAILED - Original document.xml not found in {self.original_docx}"
-                )
-                return False
-
-            # Parse both XML files using xml.etree.ElementTree for redlining validation
-            try:
-                import xml.etree.ElementTree as ET
-
-                modified_tree = ET.parse(modified_file)
-                modified_root = modified_tree.getroot()
+        # Read the original document.xml straight from the original package
+        try:
+            original_file = self.original_package.open("word/document.xml")
+        except Exception as e:
+            print(f"FAILED - Error reading original docx: {e}")
+            return False
+
+        if original_file is None:
+            print(f"FAILED - Original document.xml not found in {self.original_docx}")
+            return False
+
+        # Parse both XML files using xml.etree.ElementTree for redlining validation
+        try:
+            import xml.etree.ElementTree as ET
+
+            modified_tree = ET.parse(modified_file)
+            modified_root = modified_tree.getroot()
+            with original_file:
                 original_tree = ET.parse(original_file)
-                original_root = original_tree.getroot()
-            except ET.ParseError as e:
-                print(f"FAILED - Error parsing XML files: {e}")
-                return False
-
-            # Remove Claude's tracked changes from both documents
-            self._remove_claude_tracked_changes(original_root)
-            self._remove_claude_tracked_changes(modified_root)
-
-            # Extract and compare text content
-            modified_text = self._extract_text_content(modified_root)
-            original_text = self._extract_text_content(original_root)
-
-            if modified_text != original_text:
-                # Show detailed character-level differences for each paragraph
-                error_message = self._generate_detailed_diff(
-                    original_text, modified_text
-                )
-                print(error_message)
-                return False
-
-            if self.verbose:
-                print("PASSED - All changes by Claude are properly tracked")
-            return True
+            original_root = original_tree.getroot()
+        except ET.ParseError as e:
+            print(f"FAILED - Error parsing XML files: {e}")
+            return False
+
+        # Remove Claude's tracked changes from both documents
+        self._remove_claude_tracked_changes(original_root)
+        self._remove_claude_tracked_changes(modified_root)
+
+        # Extract and compare text content
+        modified_text = self._extract_text_content(modified_root)
+        original_text = self._extract_text_content(original_root)
+
+        if modified_text != original_text:
+            # Show detailed character-level differences for each paragraph
+            error_message = self._generate_detailed_diff(original_text, modified_text)
+            print(error_message)
+            return False
+
+        if self.verbose:
+            print("PASSED - All changes by Claude are properly tracked")
+        return True
 
     def _generate_detailed_diff(self, original_text, modified_text):
-        """Generate detailed word-level differences using git word diff."""
+        """Generate detailed character-level differences for each changed paragraph."""
         error_parts = [
             "FAILED - Document text doesn't match after removing Claude's tracked changes",
             "",
@@ -127,92 +128,115 @@ class RedliningValidator:
             "",
         ]
 
-        # Show git word diff
-        git_diff = self._get_git_word_diff(original_text, modified_text)
-        if git_diff:
-            error_parts.extend(["Differences:", "============", git_diff])
+        # Show word diff
+        word_diff = self._get_word_diff(original_text, modified_text)
+        if word_diff:
+            error_parts.extend(["Differences:", "============", word_diff])
         else:
-            error_parts.append("Unable to generate word diff (git not available)")
+            error_parts.append("Unable to generate word diff")
 
         return "\n".join(error_parts)
 
-    def _get_git_word_diff(self, original_text, modified_text):
-        """Generate word diff using git with character-level precision."""
-        try:
-            with tempfile.TemporaryDirectory() as temp_dir:
-                temp_path = Path(temp_dir)
-
-                # Create two files
-                original_file = temp_path / "original.txt"
-                modified_file = temp_path / "modified.txt"
-
-                original_file.write_text(original_text, encoding="utf-8")
-                modified_file.write_text(modified_text, encoding="utf-8")
-
-                # Try character-level diff first for precise differences
-                result = subprocess.run(
-                    [
-                        "git",
-                        "diff",
-                        "--word-diff=plain",
-                        "--word-diff-regex=.",  # Character-by-character diff
-                        "-U0",  # Zero lines of context - show only changed lines
-                        "--no-index",
-                        str(original_file),
-                        str(modified_file),
-                    ],
-                    capture_output=True,
-                    text=True,
-                )
-
-                if result.stdout.strip():
-                    # Clean up the output - remove git diff header lines
-                    lines = result.stdout.split("\n")
-                    # Skip the header lines (diff --git, index, +++, ---, @@)
-                    content_lines = []
-                    in_content = False
-                    for line in lines:
-                        if line.startswith("@@"):
-                            in_content = True
-                            continue
-                        if in_content and line.strip():
-                            content_lines.append(line)
-
-                    if content_lines:
-                        return "\n".join(content_lines)
-
-                # Fallback to word-level diff if character-level is too verbose
-                result = subprocess.run(
-                    [
-                        "git",
-                        "diff",
-                        "--word-diff=plain",
-                        "-U0",  # Zero lines of context
-                        "--no-index",
-                        str(original_file),
-                        str(modified_file),
-                    ],
-                    capture_output=True,
-                    text=True,
-                )
-
-                if result.stdout.strip():
-                    lines = result.stdout.split("\n")
-                    content_lines = []
-                    in_content = False
-                    for line in lines:
-                        if line.startswith("@@"):
-                            in_content = True
-                            continue
-                        if in_content and line.strip():
-                            content_lines.append(line)
-                    return "\n".join(content_lines)
-
-        except (subprocess.CalledProcessError, FileNotFoundError, Exception):
-            # Git not available or other error, return None to use fallback
-            pass
+    def _get_word_diff(self, original_text, modified_text, max_hunks=None):
+        """Generate a character-level word diff of two texts, paragraph by paragraph.
+
+        Uses the same format as `git diff --word-diff=plain --word-diff-regex=. -U0`:
+        only changed paragraphs are shown, with removed text as [-...-] and added
+        text as {+...+}. The alignment of changes can differ from git's, since
+        this runs in-process with difflib so git is not required.
 
-        return None
+        Args:
+            original_text: Original text, one paragraph per line
+            modified_text: Modified text, one paragraph per line
+            max_hunks: Stop after this many blocks of changed paragraphs
+                (default: MAX_DIFF_HUNKS)
+
+        Returns:
+            str: The word diff, or None if the texts don't differ
+        """
+        if max_hunks is None:
+            max_hunks = self.MAX_DIFF_HUNKS
+
+        original_lines = original_text.split("\n")
+        modified_lines = modified_text.split("\n")
+        matcher = difflib.SequenceMatcher(
+            None, original_lines, modified_lines, autojunk=False
+        )
+
+        content_lines = []
+        hunk_count = 0
+        for tag, i1, i2, j1, j2 in matcher.get_opcodes():
+            if tag == "equal":
+                continue
+            if hunk_count == max_hunks:
+                content_lines.append(f"... (stopped after {max_hunks} differences)")
+                break
+            hunk_count += 1
+
+            old_lines = original_lines[i1:i2]
+            new_lines = modified_lines[j1:j2]
+            if len(old_lines) == len(new_lines):
+                # Same number of paragraphs: diff each pair on its own
+                hunk_lines = [
+                    self._diff_paragraph(old, new)
+                    for old, new in zip(old_lines, new_lines)
+                ]
+            else:
+                hunk_lines = [
+                    self._diff_paragraph("\n".join(old_lines), "\n".join(new_lines))
+                ]
+
+            # Skip blank lines, as git's output does with -U0
+            for hunk_line in "\n".join(hunk_lines).split("\n"):
+                if hunk_line.strip():
+                    content_lines.append(hunk_line)
+
+        return "\n".join(content_lines) if content_lines else None
+
+    def _diff_paragraph(self, old, new):
+        """Diff two strings character by character into [-...-]{+...+} markup."""
+        # Segments are [op, text] with op "=" (unchanged), "-" (removed) or "+" (added)
+        segments = [["=", ""]]
+        matcher = difflib.SequenceMatcher(None, old, new, autojunk=False)
+        for tag, i1, i2, j1, j2 in matcher.get_opcodes():
+            if tag == "equal":
+                segments.append(["=", old[i1:i2]])
+                continue
+            if tag in ("delete", "replace"):
+                segments.append(["-", old[i1:i2]])
+            if tag in ("insert", "replace"):
+                segments.append(["+", new[j1:j2]])
+
+        # Slide lone insertions and deletions as far right as possible, like git,
+        # so "a b" -> "a x b" shows as "a {+x +}b" rather than "a{+ x+} b"
+        for i in range(1, len(segments) - 1):
+            previous, change, following = segments[i - 1 : i + 2]
+            if change[0] == "=" or previous[0] != "=" or following[0] != "=":
+                continue
+            while (
+                following[1][:1] not in ("", "\n")
+                and change[1][0] == following[1][0]
+            ):
+                previous[1] += change[1][0]
+                change[1] = change[1][1:] + following[1][0]
+                following[1] = following[1][1:]
+
+        parts = []
+        for op, text in segments:
+            if op == "=":
+                parts.append(text)
+            elif op == "-":
+                parts.append(self._mark_diff_segment(text, "[-", "-]"))
+            else:
+                parts.append(self._mark_diff_segment(text, "{+", "+}"))
+        return "".join(parts)
+
+    def _mark_diff_segment(self, segment, start_marker, end_marker):
+        """Wrap a changed segment in markers, keeping line breaks outside them."""
+        return "\n".join(
+            f"{start_marker}{piece}{end_marker}" if piece else ""
+            for piece in segment.split("\n")
+        )
 
     def _remove_claude_tracked_changes(self, root):
         """Remove tracked changes authored by Claude from the XML root."""
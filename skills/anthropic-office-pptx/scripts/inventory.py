@@ -17,18 +17,28 @@ Classes:
 Main Functions:
     extract_text_inventory: Extract all text from a presentation
     save_inventory: Save extracted data to JSON
+    save_batch_inventory: Stream inventories of many presentations to JSONL
 
 Usage:
     python inventory.py input.pptx output.json
+    python inventory.py --batch templates/ more.pptx output.jsonl
 """
 
 import argparse
+import getpass
+import hashlib
 import json
+import os
 import platform
+import stat
 import sys
+import tempfile
+from concurrent.futures import FIRST_COMPLETED, Future, ProcessPoolExecutor, wait
 from dataclasses import dataclass
+from functools import lru_cache
+from itertools import islice
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Tuple, Union
+from typing import Any, Dict, Iterator, List, Optional, Sequence, Tuple, Union
 
 from PIL import Image, ImageDraw, ImageFont
 from pptx import Presentation
@@ -46,6 +56,12 @@ InventoryData = Dict[
 ]  # Dict of slide_id -> {shape_id -> ShapeData}
 InventoryDict = Dict[str, Dict[str, ShapeDict]]  # JSON-serializable inventory
 
+# Optional JSON file used to persist the font catalog across runs
+FONT_CACHE_ENV = "PPTX_FONT_CACHE"
+
+# Directory for cached overflow measurements; set to an empty string to disable
+INVENTORY_CACHE_ENV = "PPTX_INVENTORY_CACHE"
+
 
 def main():
     """Main entry point for command-line usage."""
@@ -60,6 +76,10 @@ Examples:
   python inventory.py presentation.pptx inventory.json --issues-only
     Extracts only text shapes that have overflow or overlap issues
 
+  python inventory.py --batch templates/ extra.pptx inventory.jsonl
+    Extracts every .pptx under templates/ plus extra.pptx in parallel,
+    writing one JSON line per slide as each presentation finishes
+
 The output JSON includes:
   - All text content organized by slide and shape
   - Correct absolute positions for shapes in groups
@@ -69,16 +89,49 @@ The output JSON includes:
         """,
     )
 
-    parser.add_argument("input", help="Input PowerPoint file (.pptx)")
-    parser.add_argument("output", help="Output JSON file for inventory")
+    parser.add_argument(
+        "input",
+        nargs="+",
+        help="Input PowerPoint file (.pptx), or several files and directories with --batch",
+    )
+    parser.add_argument(
+        "output", help="Output JSON file for inventory (JSONL with --batch)"
+    )
     parser.add_argument(
         "--issues-only",
         action="store_true",
         help="Include only text shapes that have overflow or overlap issues",
     )
+    parser.add_argument(
+        "--font-cache",
+        help=f"JSON file to persist the system font catalog across runs "
+        f"(default: ${FONT_CACHE_ENV} if set)",
+    )
+    parser.add_argument(
+        "--batch",
+        action="store_true",
+        help="Process many presentations in parallel and stream slides to JSONL",
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        help="Number of worker processes for --batch (default: CPU count)",
+    )
 
     args = parser.parse_args()
 
+    if args.font_cache:
+        os.environ[FONT_CACHE_ENV] = args.font_cache
+
+    if args.batch:
+        run_batch(args)
+        return
+
+    if len(args.input) != 1:
+        print("Error: Multiple inputs require --batch")
+        sys.exit(1)
+    args.input = args.input[0]
+
     input_path = Path(args.input)
     if not input_path.exists():
         print(f"Error: Input file not found: {args.input}")
@@ -125,6 +178,28 @@ The output JSON includes:
         sys.exit(1)
 
 
+def run_batch(args: argparse.Namespace) -> None:
+    """Run batch extraction for the command line."""
+    pptx_paths = find_presentations(args.input)
+    if not pptx_paths:
+        print("Error: No PowerPoint files (.pptx) found in the inputs")
+        sys.exit(1)
+
+    print(f"Extracting text inventory from {len(pptx_paths)} presentations")
+    output_path = Path(args.output)
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+    failures = save_batch_inventory(
+        pptx_paths, output_path, issues_only=args.issues_only, workers=args.workers
+    )
+
+    print(f"Output saved to: {args.output}")
+    if failures:
+        print(f"Failed to process {len(failures)} presentations:")
+        for path in failures:
+            print(f"  {path}")
+        sys.exit(1)
+
+
 @dataclass
 class ShapeWithPosition:
     """A shape with its absolute position on the slide."""
@@ -134,6 +209,312 @@ class ShapeWithPosition:
     absolute_top: int  # in EMUs
 
 
+class FontCatalog:
+    """Index of the font files in the system font directories.
+
+    Each directory is listed once; name lookups are then answered from memory
+    with the same precedence as probing the filesystem: directories in order,
+    exact file names before substring matches. The listing can be persisted to
+    a JSON file and is reused as long as the directories are unchanged.
+    """
+
+    def __init__(self, cache_path: Optional[str] = None):
+        """Initialize the catalog, loading or scanning the font directories.
+
+        Args:
+            cache_path: Optional JSON file to read the catalog from and write it to
+        """
+        system = platform.system()
+        if system == "Darwin":  # macOS
+            font_dirs = [
+                "/System/Library/Fonts/",
+                "/Library/Fonts/",
+                "~/Library/Fonts/",
+            ]
+            self.extensions = [".ttf", ".otf", ".ttc", ".dfont"]
+        else:  # Linux
+            font_dirs = [
+                "/usr/share/fonts/truetype/",
+                "/usr/local/share/fonts/",
+                "~/.fonts/",
+            ]
+            self.extensions = [".ttf", ".otf"]
+
+        # macOS file systems are case-insensitive, so exact names match any case
+        self.fold_case = system == "Darwin"
+        self.font_dirs = [str(Path(d).expanduser()) for d in font_dirs]
+        self.cache_path = cache_path
+        self._matches: Dict[str, Optional[str]] = {}
+
+        # Directory -> file names in listing order
+        self.listings = self._load_cache()
+        if self.listings is None:
+            self.listings = {d: self._list_dir(d) for d in self.font_dirs}
+            self._save_cache()
+
+        self._exact: List[Tuple[str, Dict[str, str]]] = []
+        for font_dir in self.font_dirs:
+            names = self.listings.get(font_dir)
+            if names is None:
+                continue
+            index: Dict[str, str] = {}
+            for name in names:
+                index.setdefault(self._fold(name), name)
+            self._exact.append((font_dir, index))
+
+    def _fold(self, name: str) -> str:
+        return name.lower() if self.fold_case else name
+
+    @staticmethod
+    def _list_dir(font_dir: str) -> Optional[List[str]]:
+        """List the files directly inside a font directory, or None if missing."""
+        path = Path(font_dir)
+        if not path.exists():
+            return None
+        try:
+            return [entry.name for entry in os.scandir(path) if entry.is_file()]
+        except OSError:
+            return []
+
+    def _signature(self) -> Dict[str, Optional[float]]:
+        """Modification times of the font directories, used to validate the cache."""
+        signature: Dict[str, Optional[float]] = {}
+        for font_dir in self.font_dirs:
+            try:
+                signature[font_dir] = os.stat(font_dir).st_mtime
+            except OSError:
+                signature[font_dir] = None
+        return signature
+
+    def _load_cache(self) -> Optional[Dict[str, Optional[List[str]]]]:
+        if not self.cache_path:
+            return None
+        try:
+            with open(self.cache_path, encoding="utf-8") as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return None
+        if not isinstance(data, dict) or data.get("signature") != self._signature():
+            return None
+        return data.get("listings")
+
+    def _save_cache(self) -> None:
+        if not self.cache_path:
+            return
+        data = {"signature": self._signature(), "listings": self.listings}
+        try:
+            Path(self.cache_path).parent.mkdir(parents=True, exist_ok=True)
+            temp_path = f"{self.cache_path}.{os.getpid()}.tmp"
+            with open(temp_path, "w", encoding="utf-8") as f:
+                json.dump(data, f)
+            os.replace(temp_path, self.cache_path)
+        except OSError:
+            pass  # The cache is only an optimization
+
+    def find(self, font_name: str) -> Optional[str]:
+        """Find the font file for a font name.
+
+        Args:
+            font_name: Name of the font (e.g., 'Arial', 'Calibri')
+
+        Returns:
+            Path to the font file, or None if not found
+        """
+        if font_name not in self._matches:
+            self._matches[font_name] = self._find(font_name)
+        return self._matches[font_name]
+
+    def _find(self, font_name: str) -> Optional[str]:
+        # Common font file variations to try
+        font_variations = [
+            font_name,
+            font_name.lower(),
+            font_name.replace(" ", ""),
+            font_name.replace(" ", "-"),
+        ]
+        font_name_lower = font_name.lower().replace(" ", "")
+
+        for font_dir, index in self._exact:
+            # First try exact matches
+            for variant in font_variations:
+                for ext in self.extensions:
+                    name = index.get(self._fold(f"{variant}{ext}"))
+                    if name is not None:
+                        return os.path.join(font_dir, name)
+
+            # Then try fuzzy matching - find files containing the font name
+            for name in self.listings[font_dir] or []:
+                file_name_lower = name.lower()
+                if font_name_lower in file_name_lower and any(
+                    file_name_lower.endswith(ext) for ext in self.extensions
+                ):
+                    return os.path.join(font_dir, name)
+
+        return None
+
+    def fingerprint(self) -> str:
+        """Digest of the catalogued font files, for keying cached measurements."""
+        listings = {d: sorted(names or []) for d, names in self.listings.items()}
+        return hashlib.sha256(
+            json.dumps(listings, sort_keys=True).encode("utf-8")
+        ).hexdigest()
+
+
+_font_catalog: Optional[FontCatalog] = None
+
+
+def get_font_catalog() -> FontCatalog:
+    """Get the process-wide font catalog, building it on first use.
+
+    The catalog is persisted to the file named by the PPTX_FONT_CACHE
+    environment variable, if set.
+    """
+    global _font_catalog
+    if _font_catalog is None:
+        _font_catalog = FontCatalog(os.environ.get(FONT_CACHE_ENV))
+    return _font_catalog
+
+
+@lru_cache(maxsize=None)
+def _load_font(font_path: str, font_size: int) -> Optional[Any]:
+    """Load a TrueType font once per (path, size), or None if it cannot be loaded."""
+    try:
+        return ImageFont.truetype(font_path, size=font_size)
+    except Exception:
+        return None
+
+
+@lru_cache(maxsize=None)
+def _load_default_font() -> Any:
+    return ImageFont.load_default()
+
+
+@lru_cache(maxsize=None)
+def _measuring_draw() -> Any:
+    """Drawing context used only for text measurement."""
+    return ImageDraw.Draw(Image.new("RGB", (1, 1)))
+
+
+class MeasurementCache:
+    """On-disk cache of text overflow measurements, one entry per slide.
+
+    Entries are keyed by a digest of the slide, layout and master XML together
+    with the installed fonts, so a slide is only measured again when something
+    that affects its layout changes. Because the key is content-based, inventory
+    runs on the same deck from inventory.py, replace.py or a rearranged copy
+    share their measurements.
+    """
+
+    VERSION = 1
+
+    def __init__(self, cache_dir: str):
+        """Initialize the cache.
+
+        Args:
+            cache_dir: Directory holding one JSON file per slide entry
+        """
+        self.cache_dir = Path(cache_dir)
+        self._fonts = get_font_catalog().fingerprint()
+
+    def slide_key(self, slide: Any, part_digests: Dict[str, str]) -> Optional[str]:
+        """Compute the cache key for a slide.
+
+        Call before reading the slide's shapes: python-pptx can add empty
+        elements while font properties are inspected.
+
+        Args:
+            slide: Slide object
+            part_digests: Digests of layout and master parts already computed for
+                this presentation, keyed by part name
+
+        Returns:
+            Hex digest, or None if the slide can't be serialized
+        """
+        try:
+            layout = slide.slide_layout
+            parts = [slide.part, layout.part, layout.slide_master.part]
+            digest = hashlib.sha256(f"{self.VERSION}:{self._fonts}".encode("ascii"))
+            digest.update(hashlib.sha256(parts[0].blob).digest())
+            for part in parts[1:]:
+                name = str(part.partname)
+                if name not in part_digests:
+                    part_digests[name] = hashlib.sha256(part.blob).hexdigest()
+                digest.update(part_digests[name].encode("ascii"))
+        except Exception:
+            return None
+        return digest.hexdigest()
+
+    def get(self, key: str) -> Optional[List[Optional[float]]]:
+        """Get the frame overflow of each text shape on a slide, in collection order."""
+        try:
+            with open(self.cache_dir / f"{key}.json", encoding="utf-8") as f:
+                values = json.load(f)
+        except (OSError, ValueError):
+            return None
+        return values if isinstance(values, list) else None
+
+    def put(self, key: str, values: List[Optional[float]]) -> None:
+        """Store the frame overflow of each text shape on a slide."""
+        path = self.cache_dir / f"{key}.json"
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            temp_path = path.with_name(f".{key}.{os.getpid()}.tmp")
+            with open(temp_path, "w", encoding="utf-8") as f:
+                json.dump(values, f)
+            os.replace(temp_path, path)
+        except OSError:
+            pass  # The cache is only an optimization
+
+
+_measurement_cache: Optional[MeasurementCache] = None
+
+
+def private_cache_dir(name: str) -> Optional[Path]:
+    """Get a per-user cache directory under the system temporary directory.
+
+    The directory is created readable by its owner only. Returns None if it
+    can't be created, or if an existing one belongs to another user or is open
+    to others, so other local users can't seed cached results.
+
+    Args:
+        name: Directory name prefix, e.g. "pptx-inventory"
+    """
+    uid = os.getuid() if hasattr(os, "getuid") else None
+    try:
+        user = uid if uid is not None else getpass.getuser()
+        path = Path(tempfile.gettempdir()) / f"{name}-{user}"
+        path.mkdir(mode=0o700, exist_ok=True)
+        info = path.lstat()
+    except (ImportError, KeyError, OSError):
+        # getpass.getuser() raises one of these when no user name is known
+        return None
+    if not stat.S_ISDIR(info.st_mode):
+        return None
+    if uid is not None and (info.st_uid != uid or info.st_mode & 0o077):
+        return None
+    return path
+
+
+def get_measurement_cache() -> Optional[MeasurementCache]:
+    """Get the process-wide measurement cache, or None if disabled.
+
+    The cache lives in the directory named by the PPTX_INVENTORY_CACHE
+    environment variable, defaulting to a per-user private_cache_dir().
+    Setting the variable to an empty string disables it.
+    """
+    global _measurement_cache
+    cache_dir = os.environ.get(INVENTORY_CACHE_ENV)
+    if cache_dir is None:
+        cache_dir = private_cache_dir("pptx-inventory")
+    if not cache_dir:
+        return None
+    if _measurement_cache is None or str(_measurement_cache.cache_dir) != str(
+        Path(cache_dir)
+    ):
+        _measurement_cache = MeasurementCache(cache_dir)
+    return _measurement_cache
+
+
 class ParagraphData:
     """Data structure for paragraph properties extracted from a PowerPoint paragraph."""
 
@@ -280,67 +661,34 @@ class ShapeData:
     def get_font_path(font_name: str) -> Optional[str]:
         """Get the font file path for a given font name.
 
+        Lookups are answered from the process-wide font catalog, so the font
+        directories are scanned at most once per process.
+
         Args:
             font_name: Name of the font (e.g., 'Arial', 'Calibri')
 
         Returns:
             Path to the font file, or None if not found
         """
-        system = platform.system()
-
-        # Common font file variations to try
-        font_variations = [
-            font_name,
-            font_name.lower(),
-            font_name.replace(" ", ""),
-            font_name.replace(" ", "-"),
-        ]
-
-        # Define font directories and extensions by platform
-        if system == "Darwin":  # macOS
-            font_dirs = [
-                "/System/Library/Fonts/",
-                "/Library/Fonts/",
-                "~/Library/Fonts/",
-            ]
-            extensions = [".ttf", ".otf", ".ttc", ".dfont"]
-        else:  # Linux
-            font_dirs = [
-                "/usr/share/fonts/truetype/",
-                "/usr/local/share/fonts/",
-                "~/.fonts/",
-            ]
-            extensions = [".ttf", ".otf"]
-
-        # Try to find the font file
-        from pathlib import Path
-
-        for font_dir in font_dirs:
-            font_dir_path = Path(font_dir).expanduser()
-            if not font_dir_path.exists():
-                continue
+        return get_font_catalog().find(font_name)
 
-            # First try exact matches
-            for variant in font_variations:
-                for ext in extensions:
-                    font_path = font_dir_path / f"{variant}{ext}"
-                    if font_path.exists():
-                        return str(font_path)
+    @staticmethod
+    def get_font(font_name: str, font_size: int) -> Any:
+        """Get a PIL font for measuring text, shared across shapes.
 
-            # Then try fuzzy matching - find files containing the font name
-            try:
-                for file_path in font_dir_path.iterdir():
-                    if file_path.is_file():
-                        file_name_lower = file_path.name.lower()
-                        font_name_lower = font_name.lower().replace(" ", "")
-                        if font_name_lower in file_name_lower and any(
-                            file_name_lower.endswith(ext) for ext in extensions
-                        ):
-                            return str(file_path)
-            except (OSError, PermissionError):
-                continue
+        Args:
+            font_name: Name of the font (e.g., 'Arial', 'Calibri')
+            font_size: Font size in points
 
-        return None
+        Returns:
+            A pooled FreeTypeFont, or PIL's default font if none can be loaded
+        """
+        font_path = ShapeData.get_font_path(font_name)
+        if font_path:
+            font = _load_font(font_path, font_size)
+            if font is not None:
+                return font
+        return _load_default_font()
 
     @staticmethod
     def get_slide_dimensions(slide: Any) -> tuple[Optional[int], Optional[int]]:
@@ -391,6 +739,7 @@ class ShapeData:
         absolute_left: Optional[int] = None,
         absolute_top: Optional[int] = None,
         slide: Optional[Any] = None,
+        estimate_overflow: bool = True,
     ):
         """Initialize from a PowerPoint shape object.
 
@@ -399,6 +748,8 @@ class ShapeData:
             absolute_left: Absolute left position in EMUs (for shapes in groups)
             absolute_top: Absolute top position in EMUs (for shapes in groups)
             slide: Optional slide object to get dimensions and layout information
+            estimate_overflow: If False, skip text measurement and leave
+                frame_overflow_bottom for the caller to fill in (e.g. from a cache)
         """
         self.shape = shape  # Store reference to original shape
         self.shape_id: str = ""  # Will be set after sorting
@@ -461,7 +812,8 @@ class ShapeData:
             str, float
         ] = {}  # Dict of shape_id -> overlap area in sq inches
         self.warnings: List[str] = []
-        self._estimate_frame_overflow()
+        if estimate_overflow:
+            self._estimate_frame_overflow()
         self._calculate_slide_overflow()
         self._detect_bullet_issues()
 
@@ -574,8 +926,7 @@ class ShapeData:
             return
 
         # Set up PIL for text measurement
-        dummy_img = Image.new("RGB", (1, 1))
-        draw = ImageDraw.Draw(dummy_img)
+        draw = _measuring_draw()
 
         # Get default font size from placeholder or use conservative estimate
         default_font_size = self._get_default_font_size()
@@ -593,15 +944,7 @@ class ShapeData:
             font_name = para_data.font_name or "Arial"
             font_size = int(para_data.font_size or default_font_size)
 
-            font = None
-            font_path = self.get_font_path(font_name)
-            if font_path:
-                try:
-                    font = ImageFont.truetype(font_path, size=font_size)
-                except Exception:
-                    font = ImageFont.load_default()
-            else:
-                font = ImageFont.load_default()
+            font = self.get_font(font_name, font_size)
 
             # Wrap all lines in this paragraph
             all_wrapped_lines = []
@@ -879,36 +1222,52 @@ def calculate_overlap(
     return False, 0
 
 
-def detect_overlaps(shapes: List[ShapeData]) -> None:
+def detect_overlaps(shapes: List[ShapeData], tolerance: float = 0.05) -> None:
     """Detect overlapping shapes and update their overlapping_shapes dictionaries.
 
     This function requires each ShapeData to have its shape_id already set.
     It modifies the shapes in-place, adding shape IDs with overlap areas in square inches.
 
+    Shapes are swept left to right so only shapes whose horizontal extents
+    meet are compared. Results are identical to comparing every pair, including
+    the order in which overlapping shape IDs are recorded.
+
     Args:
         shapes: List of ShapeData objects with shape_id attributes set
+        tolerance: Minimum overlap in inches to consider as overlapping (default: 0.05")
     """
     n = len(shapes)
-
-    # Compare each pair of shapes
-    for i in range(n):
-        for j in range(i + 1, n):
-            shape1 = shapes[i]
-            shape2 = shapes[j]
-
-            # Ensure shape IDs are set
-            assert shape1.shape_id, f"Shape at index {i} has no shape_id"
-            assert shape2.shape_id, f"Shape at index {j} has no shape_id"
-
-            rect1 = (shape1.left, shape1.top, shape1.width, shape1.height)
-            rect2 = (shape2.left, shape2.top, shape2.width, shape2.height)
-
-            overlaps, overlap_area = calculate_overlap(rect1, rect2)
-
+    if n < 2:
+        return
+
+    # Ensure shape IDs are set
+    for i, shape in enumerate(shapes):
+        assert shape.shape_id, f"Shape at index {i} has no shape_id"
+
+    rects = [(s.left, s.top, s.width, s.height) for s in shapes]
+
+    # Sweep by left edge, keeping shapes that may still meet a later one
+    pairs = []
+    active: List[int] = []
+    for j in sorted(range(n), key=lambda k: rects[k][0]):
+        left = rects[j][0]
+        # Later shapes start at or after this one, so these can't overlap them either
+        active = [i for i in active if rects[i][0] + rects[i][2] - left > tolerance]
+        for i in active:
+            overlaps, overlap_area = calculate_overlap(
+                rects[min(i, j)], rects[max(i, j)], tolerance
+            )
             if overlaps:
-                # Add shape IDs with overlap area in square inches
-                shape1.overlapping_shapes[shape2.shape_id] = overlap_area
-                shape2.overlapping_shapes[shape1.shape_id] = overlap_area
+                pairs.append((min(i, j), max(i, j), overlap_area))
+        active.append(j)
+
+    # Record in pairwise order so each dictionary lists shapes by position
+    for i, j, overlap_area in sorted(pairs):
+        shape1 = shapes[i]
+        shape2 = shapes[j]
+        # Add shape IDs with overlap area in square inches
+        shape1.overlapping_shapes[shape2.shape_id] = overlap_area
+        shape2.overlapping_shapes[shape1.shape_id] = overlap_area
 
 
 def extract_text_inventory(
@@ -926,11 +1285,26 @@ def extract_text_inventory(
     The ShapeData objects contain the full shape information and can be
     converted to dictionaries for JSON serialization using to_dict().
     """
+    return dict(iter_text_inventory(pptx_path, prs, issues_only))
+
+
+def iter_text_inventory(
+    pptx_path: Path, prs: Optional[Any] = None, issues_only: bool = False
+) -> Iterator[Tuple[str, Dict[str, ShapeData]]]:
+    """Yield (slide-N, {shape-N: ShapeData}) for each slide with text.
+
+    Same arguments and ordering as extract_text_inventory, one slide at a time.
+    """
     if prs is None:
         prs = Presentation(str(pptx_path))
-    inventory: InventoryData = {}
+
+    cache = get_measurement_cache()
+    part_digests: Dict[str, str] = {}
 
     for slide_idx, slide in enumerate(prs.slides):
+        # Key the slide before its shapes are read (reading can modify the XML)
+        cache_key = cache.slide_key(slide, part_digests) if cache else None
+
         # Collect all valid shapes from this slide with absolute positions
         shapes_with_positions = []
         for shape in slide.shapes:  # type: ignore
@@ -939,6 +1313,11 @@ def extract_text_inventory(
         if not shapes_with_positions:
             continue
 
+        # Reuse overflow measurements if this exact slide was measured before
+        cached = cache.get(cache_key) if cache and cache_key else None
+        if cached is not None and len(cached) != len(shapes_with_positions):
+            cached = None
+
         # Convert to ShapeData with absolute positions and slide reference
         shape_data_list = [
             ShapeData(
@@ -946,10 +1325,19 @@ def extract_text_inventory(
                 swp.absolute_left,
                 swp.absolute_top,
                 slide,
+                estimate_overflow=cached is None,
             )
             for swp in shapes_with_positions
         ]
 
+        if cached is not None:
+            for shape_data, overflow in zip(shape_data_list, cached):
+                shape_data.frame_overflow_bottom = overflow
+        elif cache and cache_key:
+            cache.put(
+                cache_key, [sd.frame_overflow_bottom for sd in shape_data_list]
+            )
+
         # Sort by visual position and assign stable IDs in one step
         sorted_shapes = sort_shapes_by_position(shape_data_list)
         for idx, shape_data in enumerate(sorted_shapes):
@@ -967,12 +1355,10 @@ def extract_text_inventory(
             continue
 
         # Create slide inventory using the stable shape IDs
-        inventory[f"slide-{slide_idx}"] = {
+        yield f"slide-{slide_idx}", {
             shape_data.shape_id: shape_data for shape_data in sorted_shapes
         }
 
-    return inventory
-
 
 def get_inventory_as_dict(pptx_path: Path, issues_only: bool = False) -> InventoryDict:
     """Extract text inventory and return as JSON-serializable dictionaries.
@@ -1016,5 +1402,118 @@ def save_inventory(inventory: InventoryData, output_path: Path) -> None:
         json.dump(json_inventory, f, indent=2, ensure_ascii=False)
 
 
+def find_presentations(inputs: Sequence[Union[str, Path]]) -> List[Path]:
+    """Expand files and directories into a list of .pptx files.
+
+    Directories are searched recursively; Office lock files (~$name.pptx) and
+    files listed more than once are skipped.
+    """
+    pptx_paths: List[Path] = []
+    seen = set()
+    for item in inputs:
+        path = Path(item)
+        if path.is_dir():
+            candidates = sorted(path.rglob("*.pptx"))
+        else:
+            candidates = [path]
+        for candidate in candidates:
+            if candidate.suffix.lower() != ".pptx" or candidate.name.startswith("~$"):
+                continue
+            if candidate.resolve() not in seen:
+                seen.add(candidate.resolve())
+                pptx_paths.append(candidate)
+    return pptx_paths
+
+
+def _inventory_lines(pptx_path: str, issues_only: bool) -> Tuple[List[str], bool]:
+    """Extract one presentation as JSONL records, one per slide.
+
+    Runs in worker processes, so it returns plain strings rather than ShapeData.
+
+    Returns:
+        Tuple of (lines, ok) where ok is False if the presentation failed
+    """
+    try:
+        lines = [
+            json.dumps(
+                {
+                    "file": pptx_path,
+                    "slide": slide_key,
+                    "shapes": {
+                        shape_key: shape_data.to_dict()
+                        for shape_key, shape_data in shapes.items()
+                    },
+                },
+                ensure_ascii=False,
+            )
+            for slide_key, shapes in iter_text_inventory(
+                Path(pptx_path), issues_only=issues_only
+            )
+        ]
+    except Exception as e:
+        error = {"file": pptx_path, "error": str(e)}
+        return [json.dumps(error, ensure_ascii=False)], False
+    return lines, True
+
+
+def save_batch_inventory(
+    pptx_paths: Sequence[Union[str, Path]],
+    output_path: Path,
+    issues_only: bool = False,
+    workers: Optional[int] = None,
+) -> List[str]:
+    """Extract many presentations in parallel and stream the results to JSONL.
+
+    Each line is {"file", "slide", "shapes"} for one slide, with shapes in the
+    same form as save_inventory. A presentation that can't be read produces a
+    single {"file", "error"} line instead. Presentations are written as soon as
+    they finish, so the output order follows completion, not input order.
+
+    Args:
+        pptx_paths: PowerPoint files to process
+        output_path: Path of the JSONL file to write
+        issues_only: If True, only include shapes that have overflow or overlap issues
+        workers: Number of worker processes (default: CPU count)
+
+    Returns:
+        Paths of the presentations that failed
+    """
+    paths = [str(p) for p in pptx_paths]
+    workers = min(workers or os.cpu_count() or 1, len(paths)) or 1
+    failures: List[str] = []
+
+    with open(output_path, "w", encoding="utf-8") as f:
+
+        def write(path: str, result: Tuple[List[str], bool]) -> None:
+            lines, ok = result
+            if not ok:
+                failures.append(path)
+            for line in lines:
+                f.write(line + "\n")
+            f.flush()
+
+        if workers == 1:
+            for path in paths:
+                write(path, _inventory_lines(path, issues_only))
+        else:
+            with ProcessPoolExecutor(max_workers=workers) as executor:
+                # Keep at most two jobs per worker in flight so finished
+                # results are written and dropped instead of piling up
+                pending = iter(paths)
+                futures: Dict[Future, str] = {}
+                for path in islice(pending, 2 * workers):
+                    futures[executor.submit(_inventory_lines, path, issues_only)] = path
+                while futures:
+                    done, _ = wait(futures, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        write(futures.pop(future), future.result())
+                        for path in islice(pending, 1):
+                            futures[
+                                executor.submit(_inventory_lines, path, issues_only)
+                            ] = path
+
+    return failures
+
+
 if __name__ == "__main__":
     main()
@@ -38,17 +38,29 @@ Examples:
 
     python thumbnail.py template.pptx analysis --outline-placeholders
     # Creates thumbnail grids with red outlines around text placeholders
+
+Rendered slides are cached by content in $PPTX_THUMBNAIL_CACHE (default: a
+private per-user pptx-thumbnails-<uid> directory in the system temp directory;
+set it to an empty string to disable). Later runs only render slides that changed.
 """
 
 import argparse
+import hashlib
+import os
+import shutil
 import subprocess
 import sys
 import tempfile
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from pathlib import Path
 
-from inventory import extract_text_inventory
+# The office service client is shared with ooxml/scripts/pack.py
+sys.path.append(str(Path(__file__).resolve().parent.parent / "ooxml" / "scripts"))
+import office_service  # noqa: E402
+from inventory import extract_text_inventory, private_cache_dir
 from PIL import Image, ImageDraw, ImageFont
 from pptx import Presentation
+from pptx.opc.constants import RELATIONSHIP_TYPE as RT
 
 # Constants
 THUMBNAIL_WIDTH = 300  # Fixed thumbnail width in pixels
@@ -56,6 +68,10 @@ CONVERSION_DPI = 100  # DPI for PDF to image conversion
 MAX_COLS = 6  # Maximum number of columns
 DEFAULT_COLS = 5  # Default number of columns
 JPEG_QUALITY = 95  # JPEG compression quality
+THUMBNAIL_CACHE_ENV = "PPTX_THUMBNAIL_CACHE"  # Directory for cached slide images
+
+# Relationships that don't affect how a slide renders
+UNRENDERED_RELS = {RT.NOTES_SLIDE, RT.NOTES_MASTER, RT.COMMENTS, RT.SLIDE}
 
 # Grid layout constants
 GRID_PADDING = 20  # Padding between thumbnails
@@ -194,8 +210,145 @@ def get_placeholder_regions(pptx_path):
     return placeholder_regions, (slide_width_inches, slide_height_inches)
 
 
+def get_thumbnail_cache_dir():
+    """Get the slide image cache directory, or None if caching is disabled.
+
+    Defaults to a per-user private directory; see inventory.private_cache_dir.
+    """
+    cache_dir = os.environ.get(THUMBNAIL_CACHE_ENV)
+    if cache_dir is None:
+        return private_cache_dir("pptx-thumbnails")
+    return Path(cache_dir) if cache_dir else None
+
+
+def slide_cache_key(prs, slide, slide_num, dpi, digests):
+    """Compute a digest of everything that affects how a slide renders.
+
+    Covers the slide XML and every part it reaches through relationships
+    (layout, master, theme, images, charts, embedded media), but not part
+    names, so an unchanged slide keeps its key when the deck is rearranged.
+    Slides showing a slide number field also depend on their position.
+
+    Args:
+        prs: Presentation containing the slide
+        slide: Slide to key
+        slide_num: 1-based position of the slide
+        dpi: Rendering resolution
+        digests: Part digests already computed for this presentation, by part name
+    """
+    slide_blob = slide.part.blob
+    key = hashlib.sha256(f"{dpi}:{prs.slide_width}x{prs.slide_height}".encode())
+    key.update(hashlib.sha256(slide_blob).digest())
+    if b'type="slidenum"' in slide_blob:
+        key.update(f"#{slide_num}".encode())
+
+    # Collect the parts reachable from the slide, skipping cycles and other slides
+    related = {}
+    stack = [slide.part]
+    while stack:
+        part = stack.pop()
+        for rel in part.rels.values():
+            if rel.is_external or rel.reltype in UNRENDERED_RELS:
+                continue
+            target = rel.target_part
+            name = str(target.partname)
+            if target is slide.part or name in related:
+                continue
+            if name not in digests:
+                digests[name] = hashlib.sha256(target.blob).hexdigest()
+            related[name] = digests[name]
+            stack.append(target)
+
+    for digest in sorted(related.values()):
+        key.update(digest.encode("ascii"))
+    return key.hexdigest()
+
+
+def render_to_images(pptx_path, temp_dir, dpi, page_count=None):
+    """Render the visible slides of a presentation to JPEGs via PDF.
+
+    Args:
+        pptx_path: Presentation to render
+        temp_dir: Directory for the PDF and page images
+        dpi: Rendering resolution
+        page_count: Expected number of PDF pages; if given, the pages are
+            split into ranges rasterized in parallel
+
+    Returns:
+        Sorted list of image paths, one per visible slide
+    """
+    pdf_path = temp_dir / f"{pptx_path.stem}.pdf"
+
+    # Convert to PDF, using warm LibreOffice instances if the office service is running
+    print("Converting to PDF...")
+    reply = office_service.convert(pptx_path, temp_dir, "pdf", timeout=300)
+    if reply is None:
+        result = subprocess.run(
+            [
+                "soffice",
+                "--headless",
+                "--convert-to",
+                "pdf",
+                "--outdir",
+                str(temp_dir),
+                str(pptx_path),
+            ],
+            capture_output=True,
+            text=True,
+        )
+        if result.returncode != 0:
+            raise RuntimeError("PDF conversion failed")
+    elif not reply["ok"]:
+        raise RuntimeError(f"PDF conversion failed: {reply['error']}")
+    if not pdf_path.exists():
+        raise RuntimeError("PDF conversion failed")
+
+    # Convert PDF to images
+    print(f"Converting to images at {dpi} DPI...")
+    rasterize_pdf(pdf_path, temp_dir / "slide", dpi, page_count)
+
+    return sorted(temp_dir.glob("slide-*.jpg"))
+
+
+def rasterize_pdf(pdf_path, output_prefix, dpi, page_count=None, workers=None):
+    """Rasterize PDF pages to {output_prefix}-N.jpg with pdftoppm.
+
+    The pages are split into contiguous ranges, one pdftoppm per range, run
+    concurrently. pdftoppm pads page numbers for the whole document, so the
+    file names don't depend on the split. The last range is left open in
+    case the PDF has more pages than expected.
+    """
+    workers = min(workers or os.cpu_count() or 1, page_count or 1)
+    ranges = []
+    for i in range(workers):
+        first = i * page_count // workers + 1 if page_count else None
+        last = (i + 1) * page_count // workers if i < workers - 1 else None
+        ranges.append((first, last))
+
+    def run(page_range):
+        first, last = page_range
+        cmd = ["pdftoppm", "-jpeg", "-r", str(dpi)]
+        if first:
+            cmd += ["-f", str(first)]
+        if last:
+            cmd += ["-l", str(last)]
+        return subprocess.run(
+            cmd + [str(pdf_path), str(output_prefix)], capture_output=True, text=True
+        )
+
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        results = list(executor.map(run, ranges))
+    if any(result.returncode != 0 for result in results):
+        raise RuntimeError("Image conversion failed")
+
+
 def convert_to_images(pptx_path, temp_dir, dpi):
-    """Convert PowerPoint to images via PDF, handling hidden slides."""
+    """Convert PowerPoint to images via PDF, handling hidden slides.
+
+    Slide images are cached by slide_cache_key. Only slides without a cached
+    image are rendered: the others are marked hidden in a temporary copy of
+    the deck, which keeps slide numbering intact, and LibreOffice skips them.
+    """
     # Detect hidden slides
     print("Analyzing presentation...")
     prs = Presentation(str(pptx_path))
@@ -212,45 +365,59 @@ def convert_to_images(pptx_path, temp_dir, dpi):
     if hidden_slides:
         print(f"Hidden slides: {sorted(hidden_slides)}")
 
-    pdf_path = temp_dir / f"{pptx_path.stem}.pdf"
-
-    # Convert to PDF
-    print("Converting to PDF...")
-    result = subprocess.run(
-        [
-            "soffice",
-            "--headless",
-            "--convert-to",
-            "pdf",
-            "--outdir",
-            str(temp_dir),
-            str(pptx_path),
-        ],
-        capture_output=True,
-        text=True,
-    )
-    if result.returncode != 0 or not pdf_path.exists():
-        raise RuntimeError("PDF conversion failed")
+    # Look up cached images of visible slides
+    cache_dir = get_thumbnail_cache_dir()
+    slide_images = {}  # 1-based slide number -> image path
+    cache_keys = {}
+    if cache_dir:
+        digests = {}
+        for slide_num, slide in enumerate(prs.slides, 1):
+            if slide_num in hidden_slides:
+                continue
+            cache_keys[slide_num] = slide_cache_key(prs, slide, slide_num, dpi, digests)
+            cached_path = cache_dir / f"{cache_keys[slide_num]}.jpg"
+            if cached_path.exists():
+                slide_images[slide_num] = cached_path
+        if slide_images:
+            print(f"Reusing {len(slide_images)} cached slide images")
+
+    to_render = [
+        slide_num
+        for slide_num in range(1, total_slides + 1)
+        if slide_num not in hidden_slides and slide_num not in slide_images
+    ]
+
+    if to_render:
+        if slide_images:
+            # Hide the cached slides so only the changed ones are exported
+            print(f"Rendering {len(to_render)} changed slides")
+            for slide_num, slide in enumerate(prs.slides, 1):
+                if slide_num not in to_render:
+                    slide.element.set("show", "0")
+            render_path = temp_dir / "changed" / f"{pptx_path.stem}.pptx"
+            render_path.parent.mkdir()
+            prs.save(str(render_path))
+        else:
+            render_path = pptx_path
 
-    # Convert PDF to images
-    print(f"Converting to images at {dpi} DPI...")
-    result = subprocess.run(
-        ["pdftoppm", "-jpeg", "-r", str(dpi), str(pdf_path), str(temp_dir / "slide")],
-        capture_output=True,
-        text=True,
-    )
-    if result.returncode != 0:
-        raise RuntimeError("Image conversion failed")
+        rendered = render_to_images(render_path, temp_dir, dpi, len(to_render))
+        slide_images.update(zip(to_render, rendered))
 
-    visible_images = sorted(temp_dir.glob("slide-*.jpg"))
+        # Only cache when pages map one-to-one onto the slides
+        if cache_dir and len(rendered) == len(to_render):
+            cache_dir.mkdir(parents=True, exist_ok=True)
+            for slide_num, image_path in zip(to_render, rendered):
+                cached_path = cache_dir / f"{cache_keys[slide_num]}.jpg"
+                temp_path = cache_dir / f".{cached_path.name}.{os.getpid()}.tmp"
+                shutil.copyfile(image_path, temp_path)
+                os.replace(temp_path, cached_path)
 
     # Create full list with placeholders for hidden slides
     all_images = []
-    visible_idx = 0
 
     # Get placeholder dimensions from first visible slide
-    if visible_images:
-        with Image.open(visible_images[0]) as img:
+    if slide_images:
+        with Image.open(slide_images[min(slide_images)]) as img:
             placeholder_size = img.size
     else:
         placeholder_size = (1920, 1080)
@@ -262,11 +429,9 @@ def convert_to_images(pptx_path, temp_dir, dpi):
             placeholder_img = create_hidden_slide_placeholder(placeholder_size)
             placeholder_img.save(placeholder_path, "JPEG")
             all_images.append(placeholder_path)
-        else:
+        elif slide_num in slide_images:
             # Use the actual visible slide image
-            if visible_idx < len(visible_images):
-                all_images.append(visible_images[visible_idx])
-                visible_idx += 1
+            all_images.append(slide_images[slide_num])
 
     return all_images
 
@@ -289,17 +454,13 @@ def create_grids(
     )
 
     # Split images into chunks
+    jobs = []
     for chunk_idx, start_idx in enumerate(
         range(0, len(image_paths), max_images_per_grid)
     ):
         end_idx = min(start_idx + max_images_per_grid, len(image_paths))
         chunk_images = image_paths[start_idx:end_idx]
 
-        # Create grid for this chunk
-        grid = create_grid(
-            chunk_images, cols, width, start_idx, placeholder_regions, slide_dimensions
-        )
-
         # Generate output filename
         if len(image_paths) <= max_images_per_grid:
             # Single grid - use base filename without suffix
@@ -310,14 +471,39 @@ def create_grids(
             suffix = output_path.suffix
             grid_filename = output_path.parent / f"{stem}-{chunk_idx + 1}{suffix}"
 
-        # Save grid
         grid_filename.parent.mkdir(parents=True, exist_ok=True)
-        grid.save(str(grid_filename), quality=JPEG_QUALITY)
+        jobs.append(
+            (
+                grid_filename,
+                chunk_images,
+                cols,
+                width,
+                start_idx,
+                placeholder_regions,
+                slide_dimensions,
+            )
+        )
         grid_files.append(str(grid_filename))
 
+    # Build grids in parallel when there are several
+    workers = min(len(jobs), os.cpu_count() or 1)
+    if workers > 1:
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            list(executor.map(save_grid, jobs))
+    else:
+        for job in jobs:
+            save_grid(job)
+
     return grid_files
 
 
+def save_grid(job):
+    """Create one grid and save it; job is (path, *create_grid arguments)."""
+    grid_filename, *grid_args = job
+    grid = create_grid(*grid_args)
+    grid.save(str(grid_filename), quality=JPEG_QUALITY)
+
+
 def create_grid(
     image_paths,
     cols,
@@ -378,6 +564,11 @@ def create_grid(
             # Get original dimensions before thumbnail
             orig_w, orig_h = img.size
 
+            # Let the JPEG decoder downscale (DCT scaling) to no less than the
+            # thumbnail size instead of decoding at full resolution
+            img.draft("RGB", (width, height))
+            draft_scale = img.width / orig_w
+
             # Apply placeholder outlines if enabled
             if placeholder_regions and (start_slide_num + i) in placeholder_regions:
                 # Convert to RGBA for transparency support
@@ -395,8 +586,8 @@ def create_grid(
                     slide_width_inches = orig_w / CONVERSION_DPI
                     slide_height_inches = orig_h / CONVERSION_DPI
 
-                x_scale = orig_w / slide_width_inches
-                y_scale = orig_h / slide_height_inches
+                x_scale = img.width / slide_width_inches
+                y_scale = img.height / slide_height_inches
 
                 # Create a highlight overlay
                 overlay = Image.new("RGBA", img.size, (255, 255, 255, 0))
@@ -413,8 +604,8 @@ def create_grid(
                     # Draw highlight outline with red color and thick stroke
                     # Using a bright red outline instead of fill
                     stroke_width = max(
-                        5, min(orig_w, orig_h) // 150
-                    )  # Thicker proportional stroke width
+                        1, round(max(5, min(orig_w, orig_h) // 150) * draft_scale)
+                    )  # Thicker proportional stroke width, at the decoded scale
                     overlay_draw.rectangle(
                         [(px_left, px_top), (px_left + px_width, px_top + px_height)],
                         outline=(255, 0, 0, 255),  # Bright red, fully opaque
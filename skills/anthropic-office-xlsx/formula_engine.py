@@ -0,0 +1,1692 @@
+#!/usr/bin/env python3
+"""
+In-process Excel formula evaluation
+Evaluates the formulas of a workbook with openpyxl and stores the results as
+cached values, so recalc.py only needs LibreOffice for unsupported formulas
+"""
+
+import datetime
+import math
+import os
+import posixpath
+import re
+import zipfile
+from bisect import bisect_left, bisect_right
+from collections import deque
+from decimal import Decimal, ROUND_DOWN, ROUND_HALF_UP, ROUND_UP
+from pathlib import Path
+
+from lxml import etree
+from openpyxl import load_workbook
+from openpyxl.formula import Tokenizer
+from openpyxl.formula.tokenizer import Token
+from openpyxl.utils import range_boundaries
+from openpyxl.utils.cell import coordinate_to_tuple
+from openpyxl.utils.datetime import from_excel, to_excel
+
+
+class Unsupported(Exception):
+    """Raised when a workbook uses something only LibreOffice can evaluate"""
+
+
+class ExcelError(str):
+    """An Excel error value such as #DIV/0!"""
+
+
+NULL = ExcelError('#NULL!')
+DIV0 = ExcelError('#DIV/0!')
+VALUE = ExcelError('#VALUE!')
+REF = ExcelError('#REF!')
+NAME = ExcelError('#NAME?')
+NUM = ExcelError('#NUM!')
+NA = ExcelError('#N/A')
+ERRORS = {err: err for err in (NULL, DIV0, VALUE, REF, NAME, NUM, NA)}
+
+
+class _ErrorResult(Exception):
+    """Raised inside functions to return an error value"""
+
+    def __init__(self, error):
+        super().__init__(error)
+        self.error = error
+
+
+class _Missing:
+    """An omitted function argument, as in IF(A1,,0)"""
+
+
+MISSING = _Missing()
+
+MAX_ROW = 1048576
+MAX_COLUMN = 16384
+
+# Operator binding strength; Excel negation binds tighter than ^
+INFIX_PRECEDENCE = {
+    '=': 1, '<>': 1, '<': 1, '>': 1, '<=': 1, '>=': 1,
+    '&': 2, '+': 3, '-': 3, '*': 4, '/': 4, '^': 5,
+}
+POSTFIX_PRECEDENCE = 6
+PREFIX_PRECEDENCE = 7
+
+CELL_ADDRESS = re.compile(
+    r'\$?[A-Za-z]{1,3}\$?\d+(:\$?[A-Za-z]{1,3}\$?\d+)?'
+    r'|\$?[A-Za-z]{1,3}:\$?[A-Za-z]{1,3}|\$?\d+:\$?\d+'
+)
+SHEET_REFERENCE = re.compile(r"(?:'((?:[^']|'')+)'|([^'!]+))!(.+)", re.S)
+
+MAIN_NS = 'http://schemas.openxmlformats.org/spreadsheetml/2006/main'
+REL_NS = 'http://schemas.openxmlformats.org/officeDocument/2006/relationships'
+PKG_REL_NS = 'http://schemas.openxmlformats.org/package/2006/relationships'
+
+
+# Value coercion
+
+def _is_number(value):
+    return isinstance(value, (int, float)) and not isinstance(value, bool)
+
+
+def _parse_number(text):
+    """Parse text the way Excel coerces it to a number, or return None"""
+    text = text.strip()
+    percent = text.endswith('%')
+    if percent:
+        text = text[:-1]
+    try:
+        number = float(text.replace(',', '')) if text else None
+    except ValueError:
+        return None
+    if number is None or math.isinf(number) or math.isnan(number):
+        return None
+    return number / 100 if percent else number
+
+
+def _to_number(value):
+    """Coerce a scalar for arithmetic, returning a number or an error"""
+    if isinstance(value, ExcelError):
+        return value
+    if value is None:
+        return 0
+    if isinstance(value, bool):
+        return int(value)
+    if _is_number(value):
+        return value
+    number = _parse_number(value)
+    return VALUE if number is None else number
+
+
+def _number_text(number):
+    """Format a number like Excel's General format"""
+    if isinstance(number, int):
+        return str(number)
+    if number.is_integer() and abs(number) < 1e15:
+        return str(int(number))
+    text = f'{number:.15g}'
+    if 'e' in text:
+        mantissa, exponent = text.split('e')
+        return f'{mantissa}E{int(exponent):+03d}'
+    return text
+
+
+def _to_text(value):
+    """Coerce a scalar for concatenation, returning text or an error"""
+    if isinstance(value, ExcelError):
+        return value
+    if value is None:
+        return ''
+    if isinstance(value, bool):
+        return 'TRUE' if value else 'FALSE'
+    if _is_number(value):
+        return _number_text(value)
+    return value
+
+
+def _to_bool(value):
+    """Coerce a scalar for logical tests, returning a bool or an error"""
+    if isinstance(value, ExcelError):
+        return value
+    if value is None:
+        return False
+    if isinstance(value, bool):
+        return value
+    if _is_number(value):
+        return value != 0
+    if value.upper() in ('TRUE', 'FALSE'):
+        return value.upper() == 'TRUE'
+    return VALUE
+
+
+def _check(value):
+    if isinstance(value, ExcelError):
+        raise _ErrorResult(value)
+    return value
+
+
+def _result(number):
+    """Turn overflowed arithmetic into #NUM!"""
+    if isinstance(number, float) and (math.isinf(number) or math.isnan(number)):
+        return NUM
+    return number
+
+
+def _type_rank(value):
+    if isinstance(value, bool):
+        return 2
+    if isinstance(value, str):
+        return 1
+    return 0
+
+
+def _compare(left, right):
+    """Order two scalars like Excel: numbers < text < logicals, text ignoring case"""
+    # A blank cell compares as the empty value of the other operand's type
+    if left is None:
+        left = '' if isinstance(right, str) else False if isinstance(right, bool) else 0
+    if right is None:
+        right = '' if isinstance(left, str) else False if isinstance(left, bool) else 0
+    left_rank, right_rank = _type_rank(left), _type_rank(right)
+    if left_rank != right_rank:
+        return -1 if left_rank < right_rank else 1
+    if left_rank == 1:
+        left, right = left.casefold(), right.casefold()
+    return (left > right) - (left < right)
+
+
+COMPARISONS = {
+    '=': lambda c: c == 0, '<>': lambda c: c != 0,
+    '<': lambda c: c < 0, '>': lambda c: c > 0,
+    '<=': lambda c: c <= 0, '>=': lambda c: c >= 0,
+}
+
+
+def _binary(op, left, right):
+    """Apply an infix operator to two scalars"""
+    if isinstance(left, ExcelError):
+        return left
+    if isinstance(right, ExcelError):
+        return right
+    if op == '&':
+        return _to_text(left) + _to_text(right)
+    if op in COMPARISONS:
+        return COMPARISONS[op](_compare(left, right))
+    x, y = _to_number(left), _to_number(right)
+    if isinstance(x, ExcelError):
+        return x
+    if isinstance(y, ExcelError):
+        return y
+    if op == '+':
+        return _result(x + y)
+    if op == '-':
+        return _result(x - y)
+    if op == '*':
+        return _result(x * y)
+    if op == '/':
+        return DIV0 if y == 0 else _result(x / y)
+    if x == 0 and y < 0:
+        return DIV0
+    if x == 0 and y == 0:
+        return NUM
+    try:
+        power = x ** y
+    except OverflowError:
+        return NUM
+    return NUM if isinstance(power, complex) else _result(power)
+
+
+def _unary(op, value):
+    number = _to_number(value)
+    if isinstance(number, ExcelError):
+        return number
+    if op == '-':
+        return -number
+    if op == '%':
+        return number / 100
+    return value
+
+
+# Ranges and arrays
+
+class Array:
+    """A computed two-dimensional array of scalars"""
+
+    def __init__(self, grid):
+        self.grid = grid
+        self.rows = len(grid)
+        self.cols = len(grid[0]) if grid else 0
+
+    def flat(self):
+        for row in self.grid:
+            yield from row
+
+
+class Range(Array):
+    """A rectangular cell reference, read lazily from the workbook"""
+
+    def __init__(self, book, sheet, min_row, min_col, max_row, max_col):
+        self.book = book
+        self.sheet = sheet
+        self.min_row, self.min_col = min_row, min_col
+        self.max_row, self.max_col = max_row, max_col
+        self.rows = max_row - min_row + 1
+        self.cols = max_col - min_col + 1
+
+    @property
+    def grid(self):
+        return self.book.grid(self)
+
+    @property
+    def key(self):
+        return (self.sheet, self.min_row, self.min_col, self.max_row, self.max_col)
+
+    def offset(self, row, col, rows=1, cols=1):
+        """Return the sub-range starting at 0-based `row`, `col`"""
+        return Range(
+            self.book, self.sheet, self.min_row + row, self.min_col + col,
+            self.min_row + row + rows - 1, self.min_col + col + cols - 1,
+        )
+
+
+def _grid(value):
+    if isinstance(value, Array):
+        return value.grid
+    return [[None if value is MISSING else value]]
+
+
+# Parsing
+
+class _Parser:
+    """Parse a formula into a tuple-based syntax tree"""
+
+    def __init__(self, formula):
+        try:
+            tokens = Tokenizer(formula).items
+        except Exception as e:
+            raise Unsupported(f'cannot parse {formula}: {e}')
+        self.tokens = [t for t in tokens if t.type != Token.WSPACE]
+        self.position = 0
+
+    def parse(self):
+        node = self._expression(0)
+        if self._peek() is not None:
+            raise Unsupported('unexpected token ' + self._peek().value)
+        return node
+
+    def _peek(self):
+        if self.position < len(self.tokens):
+            return self.tokens[self.position]
+        return None
+
+    def _next(self):
+        token = self._peek()
+        if token is None:
+            raise Unsupported('unexpected end of formula')
+        self.position += 1
+        return token
+
+    def _expression(self, min_precedence):
+        token = self._next()
+        if token.type == Token.OP_PRE:
+            left = ('unary', token.value, self._expression(PREFIX_PRECEDENCE))
+        elif token.type == Token.OPERAND:
+            left = self._operand(token)
+        elif token.type == Token.FUNC and token.subtype == Token.OPEN:
+            name = token.value[:-1].upper()
+            for prefix in ('_XLFN.', '_XLWS.'):
+                if name.startswith(prefix):
+                    name = name[len(prefix):]
+            left = ('call', name, self._arguments())
+        elif token.type == Token.PAREN and token.subtype == Token.OPEN:
+            left = self._expression(0)
+            token = self._next()
+            if token.type != Token.PAREN or token.subtype != Token.CLOSE:
+                raise Unsupported('unbalanced parentheses')
+        else:
+            raise Unsupported('unsupported token ' + token.value)
+
+        while True:
+            token = self._peek()
+            if token is None:
+                return left
+            if token.type == Token.OP_POST:
+                if POSTFIX_PRECEDENCE < min_precedence:
+                    return left
+                self.position += 1
+                left = ('unary', '%', left)
+            elif token.type == Token.OP_IN:
+                precedence = INFIX_PRECEDENCE.get(token.value)
+                if precedence is None:
+                    raise Unsupported('unsupported operator ' + token.value)
+                if precedence < min_precedence:
+                    return left
+                self.position += 1
+                left = ('binary', token.value, left, self._expression(precedence + 1))
+            else:
+                return left
+
+    def _arguments(self):
+        args = []
+        token = self._peek()
+        if token is not None and token.type == Token.FUNC and token.subtype == Token.CLOSE:
+            self.position += 1
+            return args
+        while True:
+            token = self._peek()
+            if token is not None and (
+                (token.type == Token.SEP and token.subtype == Token.ARG)
+                or (token.type == Token.FUNC and token.subtype == Token.CLOSE)
+            ):
+                args.append(('missing',))
+            else:
+                args.append(self._expression(0))
+            token = self._next()
+            if token.type == Token.SEP and token.subtype == Token.ARG:
+                continue
+            if token.type == Token.FUNC and token.subtype == Token.CLOSE:
+                return args
+            raise Unsupported('unexpected token ' + token.value)
+
+    def _operand(self, token):
+        value = token.value
+        if token.subtype == Token.NUMBER:
+            return ('value', int(value) if value.isdigit() else float(value))
+        if token.subtype == Token.TEXT:
+            return ('value', value[1:-1].replace('""', '"'))
+        if token.subtype == Token.LOGICAL:
+            return ('value', value.upper() == 'TRUE')
+        if token.subtype == Token.ERROR:
+            if value.upper() not in ERRORS:
+                raise Unsupported('unknown error ' + value)
+            return ('value', ERRORS[value.upper()])
+        return ('name', value)
+
+
+# Workbook evaluation
+
+class _Context:
+    """The cell a formula is evaluated for"""
+
+    def __init__(self, book, sheet, row, col):
+        self.book = book
+        self.sheet = sheet
+        self.row = row
+        self.col = col
+
+    def scalar(self, value):
+        """Reduce a reference or array to one value using implicit intersection"""
+        if value is MISSING:
+            return None
+        if isinstance(value, Range):
+            if value.rows == 1 and value.cols == 1:
+                return self.book.value(value.sheet, value.min_row, value.min_col)
+            if value.sheet == self.sheet:
+                if value.cols == 1 and value.min_row <= self.row <= value.max_row:
+                    return self.book.value(value.sheet, self.row, value.min_col)
+                if value.rows == 1 and value.min_col <= self.col <= value.max_col:
+                    return self.book.value(value.sheet, value.min_row, self.col)
+            raise Unsupported('array result in a single cell')
+        if isinstance(value, Array):
+            if value.rows == 1 and value.cols == 1:
+                return value.grid[0][0]
+            raise Unsupported('array result in a single cell')
+        return value
+
+
+class Book:
+    """Formula cells, constants and computed values of a workbook"""
+
+    def __init__(self, workbook):
+        self.workbook = workbook
+        self.epoch = workbook.epoch
+        self.constants = {}
+        self.formulas = {}
+        self.computed = {}
+        self.sheets = {}
+        self.grids = {}
+        self.parsed = {}
+        self.references = {}
+        self.max_row = 1
+        self.max_col = 1
+        # Per sheet and column, the sorted rows that hold formulas
+        self.formula_rows = {}
+
+        for ws in workbook.worksheets:
+            self.sheets[ws.title.casefold()] = ws.title
+            for row in ws.iter_rows():
+                for cell in row:
+                    value = cell.value
+                    if value is None:
+                        continue
+                    key = (ws.title, cell.row, cell.column)
+                    self.max_row = max(self.max_row, cell.row)
+                    self.max_col = max(self.max_col, cell.column)
+                    if cell.data_type == 'f':
+                        if not isinstance(value, str):
+                            raise Unsupported(f'array formula in {ws.title}!{cell.coordinate}')
+                        self.formulas[key] = value
+                        self.formula_rows.setdefault((ws.title, cell.column), []).append(cell.row)
+                    elif cell.data_type == 'e':
+                        self.constants[key] = ERRORS.get(value, VALUE)
+                    elif isinstance(value, (datetime.datetime, datetime.date, datetime.time, datetime.timedelta)):
+                        self.constants[key] = to_excel(value, self.epoch)
+                    else:
+                        self.constants[key] = value
+        for rows in self.formula_rows.values():
+            rows.sort()
+
+    def value(self, sheet, row, col):
+        key = (sheet, row, col)
+        if key in self.computed:
+            return self.computed[key]
+        return self.constants.get(key)
+
+    def grid(self, ref):
+        grid = self.grids.get(ref.key)
+        if grid is None:
+            grid = [
+                [self.value(ref.sheet, row, col) for col in range(ref.min_col, ref.max_col + 1)]
+                for row in range(ref.min_row, ref.max_row + 1)
+            ]
+            self.grids[ref.key] = grid
+        return grid
+
+    def parse(self, key):
+        if key not in self.parsed:
+            self.parsed[key] = _Parser(self.formulas[key]).parse()
+        return self.parsed[key]
+
+    def reference(self, text, sheet):
+        """Resolve reference text to a Range, or an error value"""
+        key = (text, sheet)
+        if key not in self.references:
+            self.references[key] = self._resolve(text, sheet)
+        return self.references[key]
+
+    def _resolve(self, text, sheet):
+        if text.startswith('['):
+            raise Unsupported('external reference ' + text)
+        match = SHEET_REFERENCE.fullmatch(text)
+        if match:
+            quoted, plain, address = match.groups()
+            name = quoted.replace("''", "'") if quoted else plain
+            if ':' in name:
+                raise Unsupported('3D reference ' + text)
+            sheet = self.sheets.get(name.casefold())
+            if sheet is None or address.upper() == '#REF!':
+                return REF
+        else:
+            address = text
+            if address.upper() == '#REF!':
+                return REF
+        if not CELL_ADDRESS.fullmatch(address):
+            if match:
+                raise Unsupported('unsupported reference ' + text)
+            return self.defined_name(address, sheet)
+
+        min_col, min_row, max_col, max_row = range_boundaries(address.replace('$', '').upper())
+        if max(max_row or 0, min_row or 0) > MAX_ROW or max(max_col or 0, min_col or 0) > MAX_COLUMN:
+            raise Unsupported('reference out of bounds ' + text)
+        # Whole rows and columns only extend to the used part of the workbook
+        if min_row is None:
+            min_row, max_row = 1, self.max_row
+        if min_col is None:
+            min_col, max_col = 1, self.max_col
+        return Range(self, sheet, min_row, min_col, max_row, max_col)
+
+    def defined_name(self, name, sheet):
+        # Names scoped to the formula's sheet take precedence over global ones
+        scopes = [self.workbook[sheet].defined_names] if sheet else []
+        scopes.append(self.workbook.defined_names)
+        defined = next(
+            (d for scope in scopes for n, d in scope.items() if n.casefold() == name.casefold()),
+            None,
+        )
+        if defined is None:
+            return NAME
+        text = defined.attr_text.strip()
+        if text.startswith('='):
+            text = text[1:]
+        match = SHEET_REFERENCE.fullmatch(text)
+        if not match or not CELL_ADDRESS.fullmatch(match.group(3)):
+            raise Unsupported(f'defined name {name} is not a simple reference')
+        return self.reference(text, None)
+
+    def precedents(self, node, sheet, found):
+        """Collect the formula cells referenced by a syntax tree"""
+        kind = node[0]
+        if kind == 'name':
+            ref = self.reference(node[1], sheet)
+            if not isinstance(ref, Range):
+                return
+            for col in range(ref.min_col, ref.max_col + 1):
+                rows = self.formula_rows.get((ref.sheet, col))
+                if not rows:
+                    continue
+                start = bisect_left(rows, ref.min_row)
+                end = bisect_right(rows, ref.max_row)
+                for row in rows[start:end]:
+                    found.add((ref.sheet, row, col))
+        elif kind == 'unary':
+            self.precedents(node[2], sheet, found)
+        elif kind == 'binary':
+            self.precedents(node[2], sheet, found)
+            self.precedents(node[3], sheet, found)
+        elif kind == 'call':
+            if node[1] not in FUNCTIONS:
+                raise Unsupported('unsupported function ' + node[1])
+            for arg in node[2]:
+                self.precedents(arg, sheet, found)
+
+    def evaluate_all(self):
+        """Evaluate every formula in dependency order"""
+        dependents = {key: [] for key in self.formulas}
+        pending = {}
+        for key in self.formulas:
+            found = set()
+            self.precedents(self.parse(key), key[0], found)
+            pending[key] = len(found)
+            for precedent in found:
+                dependents[precedent].append(key)
+
+        ready = deque(key for key, count in pending.items() if count == 0)
+        while ready:
+            key = ready.popleft()
+            self.computed[key] = self.evaluate_cell(key)
+            for dependent in dependents[key]:
+                pending[dependent] -= 1
+                if pending[dependent] == 0:
+                    ready.append(dependent)
+        if len(self.computed) < len(self.formulas):
+            raise Unsupported('circular reference')
+        return self.computed
+
+    def evaluate_cell(self, key):
+        context = _Context(self, *key)
+        value = context.scalar(self.evaluate(self.parse(key), context, False))
+        # A formula that only points at an empty cell shows 0
+        return 0 if value is None else value
+
+    def evaluate(self, node, context, array):
+        """Evaluate a syntax tree to a scalar, Range, Array or MISSING
+
+        `array` is set inside functions such as SUMPRODUCT whose arguments are
+        evaluated element by element instead of by implicit intersection
+        """
+        kind = node[0]
+        if kind == 'value':
+            return node[1]
+        if kind == 'name':
+            return self.reference(node[1], context.sheet)
+        if kind == 'missing':
+            return MISSING
+        if kind == 'unary':
+            operand = self.evaluate(node[2], context, array)
+            if array and isinstance(operand, Array):
+                return Array([[_unary(node[1], v) for v in row] for row in operand.grid])
+            return _unary(node[1], context.scalar(operand))
+        if kind == 'binary':
+            left = self.evaluate(node[2], context, array)
+            right = self.evaluate(node[3], context, array)
+            if array and (isinstance(left, Array) or isinstance(right, Array)):
+                return _elementwise(node[1], left, right)
+            return _binary(node[1], context.scalar(left), context.scalar(right))
+
+        function, takes_arrays = FUNCTIONS[node[1]]
+        args = [self.evaluate(arg, context, array or takes_arrays) for arg in node[2]]
+        try:
+            return function(context, *args)
+        except _ErrorResult as e:
+            return e.error
+        except TypeError:
+            # Wrong number of arguments
+            raise Unsupported(f'bad arguments to {node[1]}')
+
+
+def _elementwise(op, left, right):
+    """Apply an operator across arrays, broadcasting single rows and columns"""
+    left, right = _grid(left), _grid(right)
+    rows = max(len(left), len(right))
+    cols = max(len(left[0]), len(right[0]))
+
+    def element(grid, row, col):
+        if len(grid) == 1:
+            row = 0
+        if len(grid[0]) == 1:
+            col = 0
+        if row >= len(grid) or col >= len(grid[0]):
+            return NA
+        return grid[row][col]
+
+    return Array([
+        [_binary(op, element(left, r, c), element(right, r, c)) for c in range(cols)]
+        for r in range(rows)
+    ])
+
+
+# Functions
+
+FUNCTIONS = {}
+
+
+def _function(*names, arrays=False):
+    def register(fn):
+        for name in names:
+            FUNCTIONS[name] = (fn, arrays)
+        return fn
+    return register
+
+
+def _value(context, arg, default=None):
+    if arg is MISSING:
+        return default
+    return _check(context.scalar(arg))
+
+
+def _number(context, arg, default=None):
+    if arg is MISSING and default is not None:
+        return default
+    return _check(_to_number(_value(context, arg)))
+
+
+def _int(context, arg, default=None):
+    return int(_number(context, arg, default))
+
+
+def _text(context, arg, default=None):
+    if arg is MISSING and default is not None:
+        return default
+    return _check(_to_text(_value(context, arg)))
+
+
+def _bool(context, arg, default=None):
+    if arg is MISSING and default is not None:
+        return default
+    return _check(_to_bool(_value(context, arg)))
+
+
+def _numbers(context, args):
+    """Numbers from arguments; references contribute only their numeric cells"""
+    numbers = []
+    for arg in args:
+        if arg is MISSING:
+            continue
+        if isinstance(arg, Array):
+            for value in arg.flat():
+                _check(value)
+                if _is_number(value):
+                    numbers.append(value)
+        else:
+            numbers.append(_check(_to_number(arg)))
+    return numbers
+
+
+def _values(args):
+    for arg in args:
+        if isinstance(arg, Array):
+            yield from arg.flat()
+        elif arg is not MISSING:
+            yield arg
+
+
+@_function('SUM')
+def _sum(context, *args):
+    return _result(math.fsum(_numbers(context, args)))
+
+
+@_function('AVERAGE')
+def _average(context, *args):
+    numbers = _numbers(context, args)
+    return _result(math.fsum(numbers) / len(numbers)) if numbers else DIV0
+
+
+@_function('MIN')
+def _min(context, *args):
+    return min(_numbers(context, args), default=0)
+
+
+@_function('MAX')
+def _max(context, *args):
+    return max(_numbers(context, args), default=0)
+
+
+@_function('PRODUCT')
+def _product(context, *args):
+    numbers = _numbers(context, args)
+    return _result(math.prod(numbers)) if numbers else 0
+
+
+@_function('MEDIAN')
+def _median(context, *args):
+    numbers = sorted(_numbers(context, args))
+    if not numbers:
+        return NUM
+    middle = len(numbers) // 2
+    if len(numbers) % 2:
+        return numbers[middle]
+    return (numbers[middle - 1] + numbers[middle]) / 2
+
+
+def _variance(numbers, sample):
+    if len(numbers) < (2 if sample else 1):
+        raise _ErrorResult(DIV0)
+    mean = math.fsum(numbers) / len(numbers)
+    return math.fsum((n - mean) ** 2 for n in numbers) / (len(numbers) - sample)
+
+
+@_function('VAR', 'VAR.S')
+def _var_s(context, *args):
+    return _variance(_numbers(context, args), True)
+
+
+@_function('VARP', 'VAR.P')
+def _var_p(context, *args):
+    return _variance(_numbers(context, args), False)
+
+
+@_function('STDEV', 'STDEV.S')
+def _stdev_s(context, *args):
+    return math.sqrt(_variance(_numbers(context, args), True))
+
+
+@_function('STDEVP', 'STDEV.P')
+def _stdev_p(context, *args):
+    return math.sqrt(_variance(_numbers(context, args), False))
+
+
+@_function('LARGE')
+def _large(context, values, k):
+    numbers = sorted(_numbers(context, [values]), reverse=True)
+    k = math.ceil(_number(context, k))
+    return numbers[k - 1] if 1 <= k <= len(numbers) else NUM
+
+
+@_function('SMALL')
+def _small(context, values, k):
+    numbers = sorted(_numbers(context, [values]))
+    k = math.ceil(_number(context, k))
+    return numbers[k - 1] if 1 <= k <= len(numbers) else NUM
+
+
+@_function('COUNT')
+def _count(context, *args):
+    count = 0
+    for arg in args:
+        if isinstance(arg, Array):
+            count += sum(1 for value in arg.flat() if _is_number(value))
+        elif arg is not MISSING and not isinstance(_to_number(arg), ExcelError):
+            count += 1
+    return count
+
+
+@_function('COUNTA')
+def _counta(context, *args):
+    return sum(1 for value in _values(args) if value is not None)
+
+
+@_function('COUNTBLANK')
+def _countblank(context, values):
+    if not isinstance(values, Range):
+        raise Unsupported('COUNTBLANK needs a reference')
+    filled = sum(1 for value in values.flat() if value is not None and value != '')
+    return values.rows * values.cols - filled
+
+
+# Criteria as used by SUMIF, COUNTIF and friends
+
+def _wildcard(pattern):
+    """Compile an Excel wildcard pattern into a case-insensitive regex"""
+    parts = re.split(r'(~[*?~]|[*?])', pattern)
+    regex = ''.join(
+        '.*' if part == '*' else '.' if part == '?'
+        else re.escape(part[1]) if part.startswith('~') and len(part) == 2
+        else re.escape(part)
+        for part in parts
+    )
+    return re.compile(regex, re.I | re.S)
+
+
+def _criterion(criterion):
+    """Build a predicate from a criterion such as 5, ">=10" or "app*" """
+    _check(criterion)
+    if criterion is None:
+        raise Unsupported('empty criterion')
+    if not isinstance(criterion, str):
+        return lambda value: (
+            _type_rank(value) == _type_rank(criterion) and value is not None
+            and _compare(value, criterion) == 0
+        )
+
+    op, operand = re.match(r'(<=|>=|<>|<|>|=)?(.*)', criterion, re.S).groups()
+    op = op or '='
+    test = COMPARISONS[op]
+    number = _parse_number(operand)
+    if number is not None:
+        def matches(value):
+            if _is_number(value):
+                return test(_compare(value, number))
+            return op == '<>'
+        return matches
+    if operand.upper() in ('TRUE', 'FALSE'):
+        target = operand.upper() == 'TRUE'
+        return lambda value: (
+            test(_compare(value, target)) if isinstance(value, bool) else op == '<>'
+        )
+    if op in ('=', '<>'):
+        if operand == '':
+            if criterion == '':
+                # A plain empty criterion matches blank cells and empty text
+                return lambda value: value is None or value == ''
+            return lambda value: (value is None) == (op == '=')
+        pattern = _wildcard(operand)
+
+        def matches(value):
+            found = isinstance(value, str) and not isinstance(value, ExcelError) \
+                and pattern.fullmatch(value) is not None
+            return found == (op == '=')
+        return matches
+    return lambda value: (
+        isinstance(value, str) and not isinstance(value, ExcelError)
+        and test(_compare(value, operand))
+    )
+
+
+def _criteria_mask(context, pairs):
+    """Return the grid shape and the cells matching all range/criterion pairs"""
+    shape = None
+    mask = None
+    for values, criterion in pairs:
+        if not isinstance(values, Range):
+            raise Unsupported('criteria range must be a reference')
+        if shape is None:
+            shape = (values.rows, values.cols)
+        elif shape != (values.rows, values.cols):
+            raise _ErrorResult(VALUE)
+        test = _criterion(context.scalar(criterion))
+        matched = [test(value) for value in values.flat()]
+        mask = matched if mask is None else [a and b for a, b in zip(mask, matched)]
+    return shape, mask
+
+
+def _matching(values, shape, mask):
+    # Like Excel, a sum range of a different size is resized from its top-left cell
+    if isinstance(values, Range) and (values.rows, values.cols) != shape:
+        values = values.offset(0, 0, *shape)
+    return [value for value, matched in zip(values.flat(), mask) if matched]
+
+
+def _criteria_pairs(args):
+    if len(args) % 2:
+        raise TypeError
+    return list(zip(args[::2], args[1::2]))
+
+
+@_function('COUNTIF')
+def _countif(context, values, criterion):
+    return sum(_criteria_mask(context, [(values, criterion)])[1])
+
+
+@_function('COUNTIFS')
+def _countifs(context, *args):
+    return sum(_criteria_mask(context, _criteria_pairs(args))[1])
+
+
+@_function('SUMIF')
+def _sumif(context, values, criterion, sum_range=MISSING):
+    shape, mask = _criteria_mask(context, [(values, criterion)])
+    target = values if sum_range is MISSING else sum_range
+    return _sum(context, Array([_matching(target, shape, mask)]))
+
+
+@_function('SUMIFS')
+def _sumifs(context, sum_range, *args):
+    shape, mask = _criteria_mask(context, _criteria_pairs(args))
+    return _sum(context, Array([_matching(sum_range, shape, mask)]))
+
+
+@_function('AVERAGEIF')
+def _averageif(context, values, criterion, average_range=MISSING):
+    shape, mask = _criteria_mask(context, [(values, criterion)])
+    target = values if average_range is MISSING else average_range
+    return _average(context, Array([_matching(target, shape, mask)]))
+
+
+@_function('AVERAGEIFS')
+def _averageifs(context, average_range, *args):
+    shape, mask = _criteria_mask(context, _criteria_pairs(args))
+    return _average(context, Array([_matching(average_range, shape, mask)]))
+
+
+@_function('MAXIFS')
+def _maxifs(context, max_range, *args):
+    shape, mask = _criteria_mask(context, _criteria_pairs(args))
+    return _max(context, Array([_matching(max_range, shape, mask)]))
+
+
+@_function('MINIFS')
+def _minifs(context, min_range, *args):
+    shape, mask = _criteria_mask(context, _criteria_pairs(args))
+    return _min(context, Array([_matching(min_range, shape, mask)]))
+
+
+@_function('SUMPRODUCT', arrays=True)
+def _sumproduct(context, *args):
+    grids = [_grid(arg) for arg in args]
+    shape = (len(grids[0]), len(grids[0][0]))
+    if any((len(g), len(g[0])) != shape for g in grids):
+        return VALUE
+    total = []
+    for r in range(shape[0]):
+        for c in range(shape[1]):
+            product = 1
+            for grid in grids:
+                value = _check(grid[r][c])
+                product *= value if _is_number(value) else 0
+            total.append(product)
+    return _result(math.fsum(total))
+
+
+@_function('SUMSQ')
+def _sumsq(context, *args):
+    return _result(math.fsum(n * n for n in _numbers(context, args)))
+
+
+# Logical
+
+@_function('IF')
+def _if(context, condition, if_true=True, if_false=False):
+    chosen = if_true if _bool(context, condition) else if_false
+    return 0 if chosen is MISSING else chosen
+
+
+@_function('IFS')
+def _ifs(context, *args):
+    for condition, value in _criteria_pairs(args):
+        if _bool(context, condition):
+            return value
+    return NA
+
+
+@_function('SWITCH')
+def _switch(context, expression, *args):
+    value = _value(context, expression)
+    for case, result in zip(args[::2], args[1::2]):
+        if _compare(value, _value(context, case)) == 0:
+            return result
+    return args[-1] if len(args) % 2 else NA
+
+
+@_function('IFERROR')
+def _iferror(context, value, fallback):
+    return fallback if isinstance(context.scalar(value), ExcelError) else value
+
+
+@_function('IFNA')
+def _ifna(context, value, fallback):
+    return fallback if context.scalar(value) == NA else value
+
+
+def _logicals(context, args):
+    results = []
+    for arg in args:
+        if isinstance(arg, Array):
+            for value in arg.flat():
+                _check(value)
+                if isinstance(value, bool) or _is_number(value):
+                    results.append(bool(value))
+        elif arg is not MISSING:
+            results.append(_check(_to_bool(arg)))
+    if not results:
+        raise _ErrorResult(VALUE)
+    return results
+
+
+@_function('AND')
+def _and(context, *args):
+    return all(_logicals(context, args))
+
+
+@_function('OR')
+def _or(context, *args):
+    return any(_logicals(context, args))
+
+
+@_function('XOR')
+def _xor(context, *args):
+    return sum(_logicals(context, args)) % 2 == 1
+
+
+@_function('NOT')
+def _not(context, value):
+    return not _bool(context, value)
+
+
+@_function('TRUE')
+def _true(context):
+    return True
+
+
+@_function('FALSE')
+def _false(context):
+    return False
+
+
+@_function('CHOOSE')
+def _choose(context, index, *args):
+    index = _int(context, index)
+    if not 1 <= index <= len(args):
+        return VALUE
+    return args[index - 1]
+
+
+# Math
+
+def _round(number, digits, rounding):
+    quantum = Decimal(1).scaleb(-int(digits))
+    rounded = Decimal(repr(float(number))).quantize(quantum, rounding=rounding)
+    return int(rounded) if digits <= 0 else float(rounded)
+
+
+@_function('ROUND')
+def _round_half_up(context, number, digits):
+    return _round(_number(context, number), _number(context, digits), ROUND_HALF_UP)
+
+
+@_function('ROUNDUP')
+def _roundup(context, number, digits):
+    return _round(_number(context, number), _number(context, digits), ROUND_UP)
+
+
+@_function('ROUNDDOWN')
+def _rounddown(context, number, digits):
+    return _round(_number(context, number), _number(context, digits), ROUND_DOWN)
+
+
+@_function('TRUNC')
+def _trunc(context, number, digits=MISSING):
+    return _round(_number(context, number), _number(context, digits, 0), ROUND_DOWN)
+
+
+@_function('INT')
+def _int_function(context, number):
+    return math.floor(_number(context, number))
+
+
+@_function('ABS')
+def _abs(context, number):
+    return abs(_number(context, number))
+
+
+@_function('SIGN')
+def _sign(context, number):
+    number = _number(context, number)
+    return (number > 0) - (number < 0)
+
+
+@_function('MOD')
+def _mod(context, number, divisor):
+    number, divisor = _number(context, number), _number(context, divisor)
+    if divisor == 0:
+        return DIV0
+    return number - divisor * math.floor(number / divisor)
+
+
+@_function('POWER')
+def _power(context, number, power):
+    return _binary('^', _number(context, number), _number(context, power))
+
+
+@_function('SQRT')
+def _sqrt(context, number):
+    number = _number(context, number)
+    return NUM if number < 0 else math.sqrt(number)
+
+
+@_function('EXP')
+def _exp(context, number):
+    try:
+        return math.exp(_number(context, number))
+    except OverflowError:
+        return NUM
+
+
+@_function('LN')
+def _ln(context, number):
+    number = _number(context, number)
+    return NUM if number <= 0 else math.log(number)
+
+
+@_function('LOG')
+def _log(context, number, base=MISSING):
+    number, base = _number(context, number), _number(context, base, 10)
+    if number <= 0 or base <= 0:
+        return NUM
+    return DIV0 if base == 1 else math.log(number, base)
+
+
+@_function('LOG10')
+def _log10(context, number):
+    number = _number(context, number)
+    return NUM if number <= 0 else math.log10(number)
+
+
+@_function('PI')
+def _pi(context):
+    return math.pi
+
+
+def _multiple(number, significance, rounding):
+    if significance == 0:
+        return 0
+    if number > 0 and significance < 0:
+        return NUM
+    return rounding(number / significance) * significance
+
+
+@_function('CEILING')
+def _ceiling(context, number, significance=MISSING):
+    number = _number(context, number)
+    significance = _number(context, significance, 1 if number >= 0 else -1)
+    return _multiple(number, significance, math.ceil)
+
+
+@_function('FLOOR')
+def _floor(context, number, significance=MISSING):
+    number = _number(context, number)
+    significance = _number(context, significance, 1 if number >= 0 else -1)
+    return _multiple(number, significance, math.floor)
+
+
+# Lookup
+
+def _same_value(pattern):
+    """Exact-match test for lookups; text lookups honour wildcards"""
+    if isinstance(pattern, str) and re.search(r'[*?~]', pattern):
+        regex = _wildcard(pattern)
+        return lambda value: isinstance(value, str) and regex.fullmatch(value) is not None
+    return lambda value: value is not None and _type_rank(value) == _type_rank(pattern) \
+        and _compare(value, pattern) == 0
+
+
+def _lookup_index(target, values, mode):
+    """Find `target` in a list: mode 0 exact, 1 largest <= target, -1 smallest >= target"""
+    if mode == 0:
+        same = _same_value(target)
+        return next((i for i, value in enumerate(values) if same(value)), None)
+    found = None
+    for i, value in enumerate(values):
+        if value is None or _type_rank(value) != _type_rank(target):
+            continue
+        order = _compare(value, target)
+        if order == 0 or order == -mode:
+            found = i
+        elif mode == 1:
+            break
+    return found
+
+
+def _vector(values):
+    if not isinstance(values, Array):
+        return [values]
+    if values.rows != 1 and values.cols != 1:
+        raise _ErrorResult(NA)
+    return list(values.flat())
+
+
+@_function('MATCH')
+def _match(context, target, values, mode=MISSING):
+    target = _value(context, target)
+    index = _lookup_index(target, _vector(values), _int(context, mode, 1))
+    return NA if index is None else index + 1
+
+
+@_function('VLOOKUP')
+def _vlookup(context, target, table, column, approximate=MISSING):
+    target = _value(context, target)
+    column = _int(context, column)
+    if column < 1:
+        return VALUE
+    if column > table.cols:
+        return REF
+    keys = [row[0] for row in table.grid]
+    index = _lookup_index(target, keys, 1 if _bool(context, approximate, True) else 0)
+    return NA if index is None else table.grid[index][column - 1]
+
+
+@_function('HLOOKUP')
+def _hlookup(context, target, table, row, approximate=MISSING):
+    target = _value(context, target)
+    row = _int(context, row)
+    if row < 1:
+        return VALUE
+    if row > table.rows:
+        return REF
+    index = _lookup_index(target, table.grid[0], 1 if _bool(context, approximate, True) else 0)
+    return NA if index is None else table.grid[row - 1][index]
+
+
+@_function('XLOOKUP')
+def _xlookup(context, target, values, results, if_missing=MISSING, mode=MISSING, search=MISSING):
+    target = _value(context, target)
+    mode, search = _int(context, mode, 0), _int(context, search, 1)
+    if mode != 0 or search not in (1, -1):
+        raise Unsupported('XLOOKUP match or search mode')
+    keys = _vector(values)
+    if search == -1:
+        keys = keys[::-1]
+    index = _lookup_index(target, keys, 0)
+    if index is None:
+        return NA if if_missing is MISSING else if_missing
+    if search == -1:
+        index = len(keys) - 1 - index
+    outcomes = _vector(results)
+    if len(outcomes) != len(keys):
+        return VALUE
+    return outcomes[index]
+
+
+@_function('INDEX')
+def _index(context, values, row, column=MISSING):
+    if not isinstance(values, Array):
+        values = Array([[values]])
+    row = _int(context, row, 0)
+    column = _int(context, column, 0)
+    # A single index into a one-row array selects a column
+    if column == 0 and values.rows == 1 and values.cols > 1:
+        row, column = 1 if row else 0, row
+    if row < 0 or column < 0 or row > values.rows or column > values.cols:
+        return REF
+    if isinstance(values, Range):
+        return values.offset(
+            max(row - 1, 0), max(column - 1, 0),
+            1 if row else values.rows, 1 if column else values.cols,
+        )
+    if row and column:
+        return values.grid[row - 1][column - 1]
+    raise Unsupported('INDEX of a whole array row or column')
+
+
+@_function('ROW')
+def _row(context, ref=MISSING):
+    if ref is MISSING:
+        return context.row
+    if not isinstance(ref, Range):
+        return VALUE
+    return ref.min_row
+
+
+@_function('COLUMN')
+def _column(context, ref=MISSING):
+    if ref is MISSING:
+        return context.col
+    if not isinstance(ref, Range):
+        return VALUE
+    return ref.min_col
+
+
+@_function('ROWS')
+def _rows(context, values):
+    return values.rows if isinstance(values, Array) else 1
+
+
+@_function('COLUMNS')
+def _columns(context, values):
+    return values.cols if isinstance(values, Array) else 1
+
+
+# Text
+
+@_function('LEN')
+def _len(context, text):
+    return len(_text(context, text))
+
+
+@_function('LEFT')
+def _left(context, text, count=MISSING):
+    text, count = _text(context, text), _int(context, count, 1)
+    return VALUE if count < 0 else text[:count]
+
+
+@_function('RIGHT')
+def _right(context, text, count=MISSING):
+    text, count = _text(context, text), _int(context, count, 1)
+    if count < 0:
+        return VALUE
+    return text[len(text) - count:] if count else ''
+
+
+@_function('MID')
+def _mid(context, text, start, count):
+    text, start, count = _text(context, text), _int(context, start), _int(context, count)
+    if start < 1 or count < 0:
+        return VALUE
+    return text[start - 1:start - 1 + count]
+
+
+@_function('UPPER')
+def _upper(context, text):
+    return _text(context, text).upper()
+
+
+@_function('LOWER')
+def _lower(context, text):
+    return _text(context, text).lower()
+
+
+@_function('PROPER')
+def _proper(context, text):
+    return re.sub(r'[^\W\d_]+', lambda m: m.group().capitalize(), _text(context, text).lower())
+
+
+@_function('TRIM')
+def _trim(context, text):
+    return re.sub(' +', ' ', _text(context, text).strip(' '))
+
+
+@_function('CONCATENATE')
+def _concatenate(context, *args):
+    return ''.join(_text(context, arg) for arg in args)
+
+
+@_function('CONCAT')
+def _concat(context, *args):
+    return ''.join(_check(_to_text(value)) for value in _values(args))
+
+
+@_function('TEXTJOIN')
+def _textjoin(context, delimiter, ignore_empty, *args):
+    delimiter = _text(context, delimiter)
+    parts = [_check(_to_text(value)) for value in _values(args)]
+    if _bool(context, ignore_empty):
+        parts = [part for part in parts if part]
+    return delimiter.join(parts)
+
+
+@_function('SUBSTITUTE')
+def _substitute(context, text, old, new, instance=MISSING):
+    text, old, new = _text(context, text), _text(context, old), _text(context, new)
+    if not old:
+        return text
+    if instance is MISSING:
+        return text.replace(old, new)
+    instance = _int(context, instance)
+    if instance < 1:
+        return VALUE
+    position = -1
+    for _ in range(instance):
+        position = text.find(old, position + 1)
+        if position < 0:
+            return text
+    return text[:position] + new + text[position + len(old):]
+
+
+@_function('REPT')
+def _rept(context, text, count):
+    text, count = _text(context, text), _int(context, count)
+    return VALUE if count < 0 or len(text) * count > 32767 else text * count
+
+
+@_function('FIND')
+def _find(context, needle, text, start=MISSING):
+    needle, text, start = _text(context, needle), _text(context, text), _int(context, start, 1)
+    if start < 1 or start > len(text) + 1:
+        return VALUE
+    position = text.find(needle, start - 1)
+    return VALUE if position < 0 else position + 1
+
+
+@_function('SEARCH')
+def _search(context, needle, text, start=MISSING):
+    needle, text, start = _text(context, needle), _text(context, text), _int(context, start, 1)
+    if start < 1 or start > len(text) + 1:
+        return VALUE
+    match = _wildcard(needle).search(text, start - 1)
+    return VALUE if match is None else match.start() + 1
+
+
+@_function('EXACT')
+def _exact(context, first, second):
+    return _text(context, first) == _text(context, second)
+
+
+@_function('VALUE')
+def _value_function(context, text):
+    value = _value(context, text)
+    if _is_number(value):
+        return value
+    number = _parse_number(_check(_to_text(value)))
+    return VALUE if number is None else number
+
+
+# Information
+
+@_function('ISBLANK')
+def _isblank(context, value):
+    return context.scalar(value) is None
+
+
+@_function('ISNUMBER')
+def _isnumber(context, value):
+    return _is_number(context.scalar(value))
+
+
+@_function('ISTEXT')
+def _istext(context, value):
+    value = context.scalar(value)
+    return isinstance(value, str) and not isinstance(value, ExcelError)
+
+
+@_function('ISLOGICAL')
+def _islogical(context, value):
+    return isinstance(context.scalar(value), bool)
+
+
+@_function('ISERROR')
+def _iserror(context, value):
+    return isinstance(context.scalar(value), ExcelError)
+
+
+@_function('ISERR')
+def _iserr(context, value):
+    value = context.scalar(value)
+    return isinstance(value, ExcelError) and value != NA
+
+
+@_function('ISNA')
+def _isna(context, value):
+    return context.scalar(value) == NA
+
+
+@_function('NA')
+def _na(context):
+    return NA
+
+
+# Dates
+
+@_function('DATE')
+def _date(context, year, month, day):
+    year, month, day = _int(context, year), _int(context, month), _int(context, day)
+    if year < 1900:
+        year += 1900
+    year += (month - 1) // 12
+    month = (month - 1) % 12 + 1
+    try:
+        date = datetime.date(year, month, 1) + datetime.timedelta(days=day - 1)
+    except (ValueError, OverflowError):
+        return NUM
+    return int(to_excel(date, context.book.epoch))
+
+
+def _serial_date(context, serial):
+    serial = _number(context, serial)
+    if serial < 0:
+        raise _ErrorResult(NUM)
+    date = from_excel(serial, context.book.epoch)
+    if date is None:
+        raise _ErrorResult(NUM)
+    return date
+
+
+@_function('YEAR')
+def _year(context, serial):
+    return _serial_date(context, serial).year
+
+
+@_function('MONTH')
+def _month(context, serial):
+    return _serial_date(context, serial).month
+
+
+@_function('DAY')
+def _day(context, serial):
+    return _serial_date(context, serial).day
+
+
+@_function('TODAY')
+def _today(context):
+    return int(to_excel(datetime.date.today(), context.book.epoch))
+
+
+@_function('NOW')
+def _now(context):
+    return to_excel(datetime.datetime.now(), context.book.epoch)
+
+
+# Financial
+
+def _annuity(context, rate, periods, payment_type):
+    rate, periods = _number(context, rate), _number(context, periods)
+    payment_type = 1 if _number(context, payment_type, 0) else 0
+    growth = (1 + rate) ** periods if rate else 1
+    return rate, periods, payment_type, growth
+
+
+@_function('PMT')
+def _pmt(context, rate, periods, present, future=MISSING, payment_type=MISSING):
+    rate, periods, payment_type, growth = _annuity(context, rate, periods, payment_type)
+    present, future = _number(context, present), _number(context, future, 0)
+    if rate == 0:
+        return NUM if periods == 0 else -(present + future) / periods
+    return -rate * (future + present * growth) / ((1 + rate * payment_type) * (growth - 1))
+
+
+@_function('FV')
+def _fv(context, rate, periods, payment, present=MISSING, payment_type=MISSING):
+    rate, periods, payment_type, growth = _annuity(context, rate, periods, payment_type)
+    payment, present = _number(context, payment), _number(context, present, 0)
+    if rate == 0:
+        return -(present + payment * periods)
+    return -(present * growth + payment * (1 + rate * payment_type) * (growth - 1) / rate)
+
+
+@_function('PV')
+def _pv(context, rate, periods, payment, future=MISSING, payment_type=MISSING):
+    rate, periods, payment_type, growth = _annuity(context, rate, periods, payment_type)
+    payment, future = _number(context, payment), _number(context, future, 0)
+    if rate == 0:
+        return -(future + payment * periods)
+    return -(future + payment * (1 + rate * payment_type) * (growth - 1) / rate) / growth
+
+
+@_function('NPV')
+def _npv(context, rate, *args):
+    rate = _number(context, rate)
+    if rate == -1:
+        return DIV0
+    values = _numbers(context, args)
+    return _result(math.fsum(v / (1 + rate) ** (i + 1) for i, v in enumerate(values)))
+
+
+# Writing results
+
+def _xml_value(value):
+    """Return the `t` attribute and `<v>` text for a computed value"""
+    if isinstance(value, ExcelError):
+        return 'e', str(value)
+    if isinstance(value, bool):
+        return 'b', '1' if value else '0'
+    if isinstance(value, str):
+        return 'str', value
+    if isinstance(value, int) or value.is_integer() and abs(value) < 1e15:
+        return None, str(int(value))
+    return None, repr(value)
+
+
+def _sheet_parts(archive):
+    """Map sheet names to their worksheet part names"""
+    workbook = etree.fromstring(archive.read('xl/workbook.xml'))
+    rels = etree.fromstring(archive.read('xl/_rels/workbook.xml.rels'))
+    targets = {
+        rel.get('Id'): rel.get('Target') for rel in rels.iter(f'{{{PKG_REL_NS}}}Relationship')
+    }
+    parts = {}
+    for sheet in workbook.iter(f'{{{MAIN_NS}}}sheet'):
+        target = targets.get(sheet.get(f'{{{REL_NS}}}id'))
+        if target:
+            if target.startswith('/'):
+                parts[sheet.get('name')] = target.lstrip('/')
+            else:
+                parts[sheet.get('name')] = posixpath.normpath(posixpath.join('xl', target))
+    return parts
+
+
+def write_values(filename, values):
+    """Store computed formula values as the cached values in the file"""
+    by_sheet = {}
+    for (sheet, row, col), value in values.items():
+        by_sheet.setdefault(sheet, {})[(row, col)] = value
+
+    path = Path(filename)
+    patched = {}
+    with zipfile.ZipFile(path) as archive:
+        parts = _sheet_parts(archive)
+        for sheet, cells in by_sheet.items():
+            part = parts[sheet]
+            root = etree.fromstring(archive.read(part))
+            for cell in root.iter(f'{{{MAIN_NS}}}c'):
+                formula = cell.find(f'{{{MAIN_NS}}}f')
+                if formula is None:
+                    continue
+                key = coordinate_to_tuple(cell.get('r'))
+                if key not in cells:
+                    continue
+                cell_type, text = _xml_value(cells[key])
+                for child in cell.findall(f'{{{MAIN_NS}}}is'):
+                    cell.remove(child)
+                v = cell.find(f'{{{MAIN_NS}}}v')
+                if v is None:
+                    v = etree.Element(f'{{{MAIN_NS}}}v')
+                    formula.addnext(v)
+                v.text = text
+                if cell_type:
+                    cell.set('t', cell_type)
+                elif 't' in cell.attrib:
+                    del cell.attrib['t']
+            patched[part] = etree.tostring(root, xml_declaration=True, encoding='UTF-8', standalone=True)
+
+        temp_path = path.with_name(f'.{path.name}.recalc')
+        try:
+            with zipfile.ZipFile(temp_path, 'w', zipfile.ZIP_DEFLATED) as output:
+                for info in archive.infolist():
+                    output.writestr(info, patched.get(info.filename) or archive.read(info))
+            os.replace(temp_path, path)
+        finally:
+            if temp_path.exists():
+                temp_path.unlink()
+
+
+def recalculate(filename):
+    """
+    Evaluate all formulas in an Excel file and store their values
+
+    Raises Unsupported, leaving the file untouched, if any formula needs
+    LibreOffice. Returns the number of formulas evaluated.
+    """
+    workbook = load_workbook(filename)
+    try:
+        if not workbook.worksheets:
+            raise Unsupported('no worksheets')
+        values = Book(workbook).evaluate_all()
+    finally:
+        workbook.close()
+    if values:
+        write_values(filename, values)
+    return len(values)
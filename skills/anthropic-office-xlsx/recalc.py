@@ -1,7 +1,8 @@
 #!/usr/bin/env python3
 """
 Excel Formula Recalculation Script
-Recalculates all formulas in an Excel file using LibreOffice
+Recalculates all formulas in an Excel file, in-process when every formula is
+supported by formula_engine and with LibreOffice otherwise
 """
 
 import json
@@ -12,6 +13,9 @@ import platform
 from pathlib import Path
 from openpyxl import load_workbook
 
+import formula_engine
+import office_service
+
 
 def setup_libreoffice_macro():
     """Setup LibreOffice macro for recalculation if not already configured"""
@@ -66,6 +70,22 @@ def recalc(filename, timeout=30):
     
     abs_path = str(Path(filename).absolute())
     
+    # Evaluate formulas in-process; anything the engine can't handle goes to LibreOffice
+    try:
+        formula_engine.recalculate(abs_path)
+        return check_errors(filename)
+    except formula_engine.Unsupported:
+        pass
+    except Exception as e:
+        return {'error': f'Formula evaluation failed: {e}'}
+    
+    # Use warm LibreOffice instances if the office service is running
+    reply = office_service.recalculate(abs_path, timeout)
+    if reply is not None:
+        if not reply['ok']:
+            return {'error': reply['error']}
+        return check_errors(filename)
+    
     if not setup_libreoffice_macro():
         return {'error': 'Failed to setup LibreOffice macro'}
     
@@ -98,6 +118,11 @@ def recalc(filename, timeout=30):
         else:
             return {'error': error_msg}
     
+    return check_errors(filename)
+
+
+def check_errors(filename):
+    """Scan a recalculated Excel file for formula errors and count formulas"""
     # Check for Excel errors in the recalculated file - scan ALL cells
     try:
         wb = load_workbook(filename, data_only=True)
@@ -158,7 +183,8 @@ def recalc(filename, timeout=30):
 def main():
     if len(sys.argv) < 2:
         print("Usage: python recalc.py <excel_file> [timeout_seconds]")
-        print("\nRecalculates all formulas in an Excel file using LibreOffice")
+        print("\nRecalculates all formulas in an Excel file, using LibreOffice for")
+        print("formulas the built-in engine doesn't support")
         print("\nReturns JSON with error details:")
         print("  - status: 'success' or 'errors_found'")
         print("  - total_errors: Total number of Excel errors found")